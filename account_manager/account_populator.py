@@ -4,7 +4,9 @@ Account Populator - Auto-populate account details from various sources
 """
 
 import re
-from typing import Optional, Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
 
@@ -161,27 +163,117 @@ class AccountPopulator:
                 return None
 
             # Use provided etrack_user_id or assume same as jira
-            etrack_id = etrack_user_id or jira_assignee
-
-            # Infer email format from jira username
-            email_username = jira_assignee.replace('_', '.')
-
-            account = AccountData(
-                etrack_user_id=etrack_id,
-                jira_account=jira_assignee,  # HIGH confidence from Jira API
-                veritas_email=f"{email_username}@veritas.com",
-                cohesity_email=f"{email_username}@cohesity.com",
-                community_account=email_username,  # Email prefix without domain
-                source="jira_assignee",
-                confidence="medium"  # jira_account is HIGH, others are LOW
-            )
-
-            return account
+            return self._assignee_account_data(etrack_user_id or jira_assignee, jira_assignee)
 
         except Exception as e:
             print(f"Error fetching assignee from {fi_id}: {e}")
             return None
 
+    @staticmethod
+    def _assignee_account_data(etrack_user_id: str, jira_assignee: str) -> AccountData:
+        """Build account data from a FI's Jira assignee (jira_account HIGH, emails inferred)."""
+        # Infer email format from jira username
+        email_username = jira_assignee.replace('_', '.')
+
+        return AccountData(
+            etrack_user_id=etrack_user_id,
+            jira_account=jira_assignee,  # HIGH confidence from Jira API
+            veritas_email=f"{email_username}@veritas.com",
+            cohesity_email=f"{email_username}@cohesity.com",
+            community_account=email_username,  # Email prefix without domain
+            source="jira_assignee",
+            confidence="medium"  # jira_account is HIGH, others are LOW
+        )
+
+    def fetch_jira_profiles(self, jira_usernames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up Jira user profiles for many usernames, concurrently
+
+        Each name is searched once (through the client's user search cache, if
+        any) with at most jira_client.max_workers requests in flight. Only
+        unambiguous results are kept: one user whose name equals the username.
+
+        Args:
+            jira_usernames: Jira usernames (e.g., FI assignees)
+
+        Returns:
+            Dictionary of username -> user dict (accountId, displayName, emailAddress)
+        """
+        names = [name for name in dict.fromkeys(jira_usernames) if name]
+        if not self.jira_client or not names:
+            return {}
+
+        def lookup(name):
+            try:
+                users = self.jira_client.search_users(name)
+            except Exception as e:
+                print(f"Error searching Jira user {name}: {e}")
+                return None
+            exact = [u for u in users if (u.get('displayName') or '').lower() == name.lower()]
+            return exact[0] if len(exact) == 1 else None
+
+        workers = min(getattr(self.jira_client, 'max_workers', 1), len(names))
+        if workers <= 1:
+            found = [lookup(name) for name in names]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                found = list(executor.map(lookup, names))
+        return {name: user for name, user in zip(names, found) if user}
+
+    def populate_batch(self, fi_ids_by_user: Dict[str, List[str]],
+                       fi_assignees: Dict[str, Optional[str]] = None) -> Dict[str, AccountData]:
+        """
+        Populate account data for many users with bulk Jira calls
+
+        Batch counterpart of populate_from_jira_assignee(): FI assignees not in
+        fi_assignees are fetched with one batched get_multiple_assignees() call,
+        each distinct assignee's profile is looked up once (fetch_jira_profiles),
+        and the results are merged with the inferred data by merge_account_data().
+        A user's assignee is the most common assignee among their FIs.
+
+        Args:
+            fi_ids_by_user: etrack_user_id -> FI IDs the user is the etrack assignee of
+            fi_assignees: Already fetched FI ID -> Jira assignee (e.g., from validation)
+
+        Returns:
+            Dictionary of etrack_user_id -> merged AccountData
+        """
+        assignees = dict(fi_assignees or {})
+        if self.jira_client:
+            missing = list(dict.fromkeys(
+                fi for fis in fi_ids_by_user.values() for fi in fis if fi not in assignees))
+            if missing:
+                try:
+                    assignees.update(self.jira_client.get_multiple_assignees(missing))
+                except Exception as e:
+                    print(f"Error fetching FI assignees: {e}")
+
+        user_assignees = {}
+        for etrack_user_id, fi_ids in fi_ids_by_user.items():
+            counts = Counter(assignees[fi] for fi in fi_ids if assignees.get(fi))
+            user_assignees[etrack_user_id] = counts.most_common(1)[0][0] if counts else None
+
+        profiles = self.fetch_jira_profiles(list(user_assignees.values()))
+
+        accounts = {}
+        for etrack_user_id, jira_assignee in user_assignees.items():
+            sources = []
+            if jira_assignee:
+                profile = profiles.get(jira_assignee)
+                if profile:
+                    email = profile.get('emailAddress') or ''
+                    sources.append(AccountData(
+                        etrack_user_id=etrack_user_id,
+                        jira_account=jira_assignee,
+                        cohesity_email=email if '@cohesity.com' in email.lower() else None,
+                        source="jira_profile",
+                        confidence="high"
+                    ))
+                sources.append(self._assignee_account_data(etrack_user_id, jira_assignee))
+            sources.append(self.infer_from_etrack_user_id(etrack_user_id))
+            accounts[etrack_user_id] = self.merge_account_data(*sources)
+        return accounts
+
     def merge_account_data(self, *accounts: AccountData) -> AccountData:
         """
         Merge multiple AccountData objects, preferring higher confidence data
@@ -0,0 +1,212 @@
+"""
+Action Log Archive - Retention for the action_log table
+
+Old action_log entries are moved, one month per transaction, into
+gzip-compressed monthly CSV files (action_log_YYYY-MM.csv.gz). Their
+per-day counts go into the action_log_daily rollup table, which
+get_action_summary() and the daily activity report add to the live
+counts. The live table stays small, and freed pages are returned to the
+filesystem with incremental VACUUM.
+"""
+
+import csv
+import gzip
+import os
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from .models import retry_on_lock
+
+if TYPE_CHECKING:
+    from .models import AccountManager
+
+# Keep this many days in the live table by default
+DEFAULT_RETENTION_DAYS = 90
+
+ARCHIVE_FIELDS = ['id', 'action_type', 'target_type', 'target_id',
+                  'old_value', 'new_value', 'status', 'details', 'created_at']
+
+
+def default_archive_dir(db_path: str) -> str:
+    """Archive directory: $ACTION_LOG_ARCHIVE_DIR or action_log_archive/ next to the database."""
+    return os.getenv('ACTION_LOG_ARCHIVE_DIR') or os.path.join(
+        os.path.dirname(os.path.abspath(db_path)), 'action_log_archive')
+
+
+def _next_month(month: str) -> str:
+    """'2025-12' -> '2026-01-01' (first day of the following month)."""
+    year, mon = (int(part) for part in month.split('-'))
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}-01"
+
+
+class ActionLogArchiver:
+    """Archives, rolls up and compacts the action log"""
+
+    def __init__(self, account_manager: 'AccountManager', archive_dir: str = None):
+        """
+        Initialize the archiver
+
+        Args:
+            account_manager: AccountManager instance
+            archive_dir: Directory for monthly archive files (default: default_archive_dir())
+        """
+        self.am = account_manager
+        self.archive_dir = archive_dir or default_archive_dir(account_manager.db_path)
+
+    def archive_path(self, month: str) -> str:
+        """Path of the archive file for a month (YYYY-MM)."""
+        return os.path.join(self.archive_dir, f"action_log_{month}.csv.gz")
+
+    def pending_months(self, before: str) -> List[Tuple[str, int]]:
+        """
+        List months with live entries older than a date
+
+        Args:
+            before: Cutoff date (YYYY-MM-DD); entries before it are archivable
+
+        Returns:
+            List of (YYYY-MM, entry count), oldest first
+        """
+        self.am.flush_action_log()
+        cursor = self.am.conn.execute("""
+            SELECT substr(created_at, 1, 7) as month, COUNT(*)
+            FROM action_log
+            WHERE created_at < date(?)
+            GROUP BY month ORDER BY month
+        """, (before,))
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def archive(self, before: str = None, days: int = DEFAULT_RETENTION_DAYS,
+                dry_run: bool = False) -> Dict[str, int]:
+        """
+        Move entries older than a cutoff into monthly archives and daily rollups
+
+        Each month is appended to its archive file (and synced to disk)
+        before its rows are rolled up and deleted in one transaction, so an
+        interrupted run can duplicate archived rows but never lose them.
+
+        Args:
+            before: Cutoff date (YYYY-MM-DD); default: today minus days
+            days: Days to keep in the live table when before is not given
+            dry_run: Only report what would be archived
+
+        Returns:
+            Dictionary: {'months': n, 'archived': n}
+        """
+        if not before:
+            before = (date.today() - timedelta(days=days)).isoformat()
+
+        stats = {'months': 0, 'archived': 0}
+        for month, count in self.pending_months(before):
+            if not dry_run:
+                count = self._archive_month(month, before)
+            stats['months'] += 1
+            stats['archived'] += count
+        return stats
+
+    def _archive_month(self, month: str, before: str) -> int:
+        """Archive one month's entries (up to the cutoff). Returns entries archived."""
+        start = f"{month}-01"
+        end = min(_next_month(month), before)
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = self.archive_path(month)
+        write_header = not os.path.exists(path)
+
+        count = 0
+        max_id = None
+        # Appending adds a gzip member; readers see one continuous CSV
+        with gzip.open(path, 'at', newline='', encoding='utf-8') as archive:
+            writer = csv.DictWriter(archive, fieldnames=ARCHIVE_FIELDS)
+            if write_header:
+                writer.writeheader()
+            rows = self.am.conn.execute(f"""
+                SELECT {', '.join(ARCHIVE_FIELDS)} FROM action_log
+                WHERE created_at >= ? AND created_at < date(?)
+                ORDER BY id
+            """, (start, end))
+            for row in rows:
+                writer.writerow(dict(row))
+                count += 1
+                max_id = row['id']
+        with open(path, 'rb') as archive:
+            os.fsync(archive.fileno())
+
+        if max_id is not None:
+            self._rollup_and_delete(start, end, max_id)
+        return count
+
+    @retry_on_lock
+    def _rollup_and_delete(self, start: str, end: str, max_id: int):
+        """Add archived entries to action_log_daily and delete them, in one transaction."""
+        conn = self.am.conn
+        try:
+            conn.execute("""
+                INSERT INTO action_log_daily (day, action_type, status, count)
+                SELECT date(created_at), action_type, status, COUNT(*)
+                FROM action_log
+                WHERE created_at >= ? AND created_at < date(?) AND id <= ?
+                GROUP BY date(created_at), action_type, status
+                ON CONFLICT(day, action_type, status) DO UPDATE SET count = count + excluded.count
+            """, (start, end, max_id))
+            conn.execute("""
+                DELETE FROM action_log
+                WHERE created_at >= ? AND created_at < date(?) AND id <= ?
+            """, (start, end, max_id))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def compact(self, pages: int = None) -> Dict[str, int]:
+        """
+        Return free pages to the filesystem
+
+        Databases created before incremental auto-vacuum are converted once
+        with a full VACUUM; after that only free pages are released.
+
+        Args:
+            pages: Maximum pages to release (None = all free pages)
+
+        Returns:
+            Dictionary: {'free_before': n, 'free_after': n, 'full_vacuum': 0/1}
+        """
+        self.am.flush_action_log()
+        conn = self.am.conn
+        conn.commit()
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        full_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2  # 2 = INCREMENTAL
+        if full_vacuum:
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+        else:
+            # executescript runs the pragma to completion (execute() frees one page per step)
+            conn.executescript(f"PRAGMA incremental_vacuum({int(pages or 0)});")
+        free_after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return {'free_before': free_before, 'free_after': free_after, 'full_vacuum': int(full_vacuum)}
+
+    def archived_months(self) -> List[str]:
+        """List months (YYYY-MM) that have an archive file, oldest first."""
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(name[len('action_log_'):-len('.csv.gz')]
+                      for name in os.listdir(self.archive_dir)
+                      if name.startswith('action_log_') and name.endswith('.csv.gz'))
+
+    def iter_archived(self, month: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Lazily read archived entries
+
+        Args:
+            month: Only this month (YYYY-MM); default: all archives, oldest first
+
+        Yields:
+            Action log entry dictionaries (values as strings)
+        """
+        months = [month] if month else self.archived_months()
+        for name in months:
+            path = self.archive_path(name)
+            if not os.path.exists(path):
+                continue
+            with gzip.open(path, 'rt', newline='', encoding='utf-8') as archive:
+                yield from csv.DictReader(archive)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the esql output parser
+
+Parses a synthetic 100k-row incident dump in each esql output format, once
+with the old per-line format cascade and once with EsqlOutputParser
+(format detected once, precompiled splitter, columns mapped by header).
+
+Usage:
+    python3 account_manager/bench_esql_parser.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from account_manager.esql_parser import EsqlOutputParser
+
+FIELDS = ['incident', 'assigned_to', 'state', 'severity', 'priority', 'version',
+          'component', 'type', 'target_version', 'abstract']
+
+
+def make_dump(rows: int, fmt: str) -> str:
+    """Build a synthetic esql dump with a header in the given format."""
+    values = []
+    for i in range(rows):
+        values.append([
+            str(4000000 + i), f"user{i % 500}", 'OPEN' if i % 3 else 'CLOSED', str(i % 4 + 1),
+            f"P{i % 3 + 1}", '10.5', 'client', 'DEFECT', '11.0',
+            f"Backup job {i} fails | status {i % 97} after restore",
+        ])
+
+    header = [f.upper() for f in FIELDS]
+    if fmt == 'tab':
+        lines = ['\t'.join(header)] + ['\t'.join(v) for v in values]
+    elif fmt == 'table':
+        border = '+' + '+'.join('-' * 12 for _ in FIELDS) + '+'
+        lines = [border, '| ' + ' | '.join(header) + ' |', border]
+        lines += ['| ' + ' | '.join(v) + ' |' for v in values]
+        lines.append(border)
+    else:
+        widths = [max(len(h), 16) for h in header]
+        lines = ['  '.join(h.ljust(w) for h, w in zip(header, widths))]
+        lines += ['  '.join(v.ljust(w) for v, w in zip(row, widths)).rstrip() for row in values]
+    lines.append(f"{rows} rows selected.")
+    return '\n'.join(lines) + '\n'
+
+
+def parse_cascade(output: str) -> int:
+    """Old approach: re-detect the format on every line and map columns by part count."""
+    count = 0
+    for line in output.strip().split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if 'incident' in line.lower() and 'assigned_to' in line.lower():
+            continue
+        if line.startswith('---') or line.startswith('===') or line.startswith('+'):
+            continue
+        if 'rows selected' in line.lower() or 'row selected' in line.lower():
+            continue
+
+        if '\t' in line:
+            parts = [p.strip() for p in line.split('\t')]
+        elif line.startswith('|'):
+            parts = [p.strip() for p in line[1:-1].split('|', len(FIELDS) - 1)]
+        elif re.search(r'\s{2,}', line):
+            parts = [p.strip() for p in re.split(r'\s{2,}', line)]
+        elif '|' in line and line.count('|') >= 3:
+            parts = [p.strip() for p in line.split('|')]
+        else:
+            parts = [p.strip() for p in line.split()]
+
+        while parts and not parts[0]:
+            parts.pop(0)
+        while parts and not parts[-1]:
+            parts.pop()
+
+        if len(parts) >= 10:
+            record = dict(zip(FIELDS, parts))
+        else:
+            record = {'incident': parts[0], 'abstract': parts[-1]}
+        count += len(record) > 0
+    return count
+
+
+def parse_unified(output: str) -> int:
+    """New approach: EsqlOutputParser over the same text."""
+    count = 0
+    for _ in EsqlOutputParser(FIELDS).iter_records(output):
+        count += 1
+    return count
+
+
+def bench(func, output: str, repeat: int) -> float:
+    """Return the best wall time over repeat runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(output)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark esql output parsing')
+    parser.add_argument('--rows', type=int, default=100000, help='Rows in the synthetic dump (default: 100000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per parser; best time is reported (default: 3)')
+    args = parser.parse_args()
+
+    print(f"esql parser benchmark: {args.rows} rows, best of {args.repeat}")
+    print("=" * 70)
+    print(f"{'Format':<10} {'Cascade':>12} {'Unified':>12} {'Rows/s (unified)':>18} {'Speedup':>10}")
+    print("-" * 70)
+
+    for fmt in ('tab', 'table', 'columns'):
+        output = make_dump(args.rows, fmt)
+        rows_old = parse_cascade(output)
+        rows_new = parse_unified(output)
+        if rows_old != rows_new:
+            print(f"Warning: {fmt}: row count mismatch (cascade {rows_old}, unified {rows_new})")
+
+        old = bench(parse_cascade, output, args.repeat)
+        new = bench(parse_unified, output, args.repeat)
+        print(f"{fmt:<10} {old:>11.3f}s {new:>11.3f}s {rows_new / new:>18,.0f} {old / new:>9.2f}x")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
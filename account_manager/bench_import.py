@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark for IOUtils.import_from_csv
+
+Imports a synthetic 100k-row accounts CSV into a fresh database twice per
+path: once into an empty table (all adds) and once more in update mode
+(all updates). The per-row path commits every account and log entry; the
+bulk path writes one transaction per chunk.
+
+Usage:
+    python3 account_manager/bench_import.py [--rows N] [--chunk-size N] [--skip-per-row]
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from account_manager.models import AccountManager
+from account_manager.io_utils import IOUtils, BULK_IMPORT_CHUNK_SIZE
+
+
+def make_csv(path: str, rows: int, suffix: str = ''):
+    """Write a synthetic accounts CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['etrack_user_id', 'first_name', 'last_name', 'veritas_email',
+                         'cohesity_email', 'community_account', 'jira_account',
+                         'manual_verified', 'notes'])
+        for i in range(rows):
+            writer.writerow([f"user{i}", f"First{i}", f"Last{i}{suffix}", f"user{i}@vcompany.com",
+                             f"user{i}@ccompany.com" if suffix else '', f"user{i}",
+                             f"JIRAUSER{i}", 'yes' if i % 2 else 'no', ''])
+
+
+def run_import(db_path: str, csv_path: str, mode: str, bulk: bool, chunk_size: int):
+    """Run one import and return (seconds, stats)."""
+    with AccountManager(db_path) as am:
+        io_utils = IOUtils(am)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            stats = io_utils.import_from_csv(csv_path, mode, bulk=bulk, chunk_size=chunk_size)
+        return time.perf_counter() - start, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CSV account import')
+    parser.add_argument('--rows', type=int, default=100000, help='Rows in the synthetic CSV (default: 100000)')
+    parser.add_argument('--chunk-size', type=int, default=BULK_IMPORT_CHUNK_SIZE,
+                        help=f'Bulk rows per transaction (default: {BULK_IMPORT_CHUNK_SIZE})')
+    parser.add_argument('--skip-per-row', action='store_true', help='Only run the bulk path')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='am-bench-')
+    add_csv = os.path.join(workdir, 'add.csv')
+    update_csv = os.path.join(workdir, 'update.csv')
+    make_csv(add_csv, args.rows)
+    make_csv(update_csv, args.rows, suffix='-x')
+
+    paths = [('bulk', True)] if args.skip_per_row else [('per-row', False), ('bulk', True)]
+    results = {}
+
+    print(f"CSV import benchmark: {args.rows} rows (database in {workdir})")
+    print("=" * 70)
+    print(f"{'Path':<10} {'Add':>12} {'Update':>12} {'Rows/s (add)':>16}  Stats")
+    print("-" * 70)
+
+    for name, bulk in paths:
+        db_path = os.path.join(workdir, f"{name}.db")
+        add_time, add_stats = run_import(db_path, add_csv, 'skip', bulk, args.chunk_size)
+        update_time, update_stats = run_import(db_path, update_csv, 'update', bulk, args.chunk_size)
+        results[name] = (add_time, update_time)
+        print(f"{name:<10} {add_time:>11.2f}s {update_time:>11.2f}s {args.rows / add_time:>16,.0f}  "
+              f"added={add_stats['added']} updated={update_stats['updated']}")
+
+    if 'per-row' in results:
+        old, new = results['per-row'], results['bulk']
+        print("-" * 70)
+        print(f"Speedup: add {old[0] / new[0]:.1f}x, update {old[1] / new[1]:.1f}x")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,12 +8,18 @@ import sys
 from .models import AccountManager, DatabaseLockedError
 from .reports import ReportGenerator
 from .io_utils import IOUtils
+from .action_archive import ActionLogArchiver, DEFAULT_RETENTION_DAYS
 from .esql_integration import EsqlExecutor
+from .esql_cache import EsqlCache
 from .fi_validator import FIValidator
 from .jira_client import JiraClient, MockJiraClient
+from .http_session import format_connection_stats
+from .issue_cache import IssueCache
 from .account_populator import AutoPopulateStrategy
 from .euserls_integration import EuserlsUpdater
+from .euserls_cache import EuserlsNegativeCache
 from .jira_integration import JiraIdUpdater
+from .jira_user_cache import JiraUserCache
 from .etrack_integration import EtrackExecutor, MockEtrackExecutor
 import re
 
@@ -142,6 +148,10 @@ Report Types:
     table           Formatted table view
     compact         Compact table format
     markdown        Markdown-formatted table
+    all             summary, verification, missing-fields and full
+    <t1>,<t2>,...   Several types in one run
+
+    Multiple types are built from a single read of the accounts table.
 
 Options:
     --show-notes    Include notes column in output (for table/compact/markdown/full)
@@ -151,6 +161,8 @@ Examples:
     python3 -m account_manager.cli report table
     python3 -m account_manager.cli report table --show-notes
     python3 -m account_manager.cli report missing-fields
+    python3 -m account_manager.cli report summary,verification
+    python3 -m account_manager.cli report all
 """)
 
     elif command == 'validate-fi':
@@ -233,6 +245,9 @@ Options:
     --skip-details           Suppress per-record detail blocks
                              (applies to --report-severity text, --show-conflicts, --report)
     --mock                   Use mock Jira/Etrack clients (no API calls, for testing)
+    --no-cache               Do not use the persistent Jira issue / esql result caches
+    --refresh-cache          Ignore cached Jira issues and esql results and re-fetch
+                             (results are re-cached; --refresh is an alias)
 
   Severity Mapping:  P1->1  P2->2  P3->3  P4->4
   Conflict Rule:     Multiple FI priorities -> highest priority wins (P1+P3 => 1)
@@ -345,7 +360,7 @@ Import from CSV
 Import account data from CSV file.
 
 Usage:
-    python3 -m account_manager.cli import <file> [mode] [--allow-empty]
+    python3 -m account_manager.cli import <file> [mode] [--allow-empty] [--bulk]
 
 Arguments:
     file    CSV file path
@@ -358,6 +373,8 @@ Modes:
 Options:
     --allow-empty    Empty CSV values will clear existing data
                      Without this flag, only non-empty values update fields
+    --bulk           Import in chunks of 5000 rows, one transaction per chunk
+                     (much faster for large files, same conflict handling)
 
 CSV Format:
     etrack_user_id,first_name,last_name,veritas_email,cohesity_email,community_account,jira_account,manual_verified,notes
@@ -372,6 +389,9 @@ Examples:
 
     # Update and allow empty values to clear fields
     python3 -m account_manager.cli import accounts.csv update --allow-empty
+
+    # Bulk import a large file
+    python3 -m account_manager.cli import accounts.csv update --bulk
 """)
 
     elif command == 'export-log':
@@ -444,8 +464,10 @@ Usage:
     python3 -m account_manager.cli update-emails [options]
 
 Options:
-    --dry-run    Show what would be updated without making changes
-    --verbose    Show detailed progress messages
+    --dry-run          Show what would be updated without making changes
+    --verbose          Show detailed progress messages
+    --workers=N        Concurrent euserls lookups (default: $EUSERLS_WORKERS or 8)
+    --retry-missing    Also query users euserls recently did not find
 
 Description:
     Scans all accounts and uses the euserls command to fetch:
@@ -453,6 +475,10 @@ Description:
     - first_name and last_name (parsed from euserls output)
     - community_account (derived from veritas_email, e.g., John.Doe@vcompany.com -> John.Doe)
 
+    Lookups run in parallel and all updates are written in one transaction.
+    Users euserls does not find are remembered for $EUSERLS_NEGATIVE_TTL
+    seconds (default: 7 days) and skipped until then.
+
 Examples:
     # Preview what will be updated
     python3 -m account_manager.cli update-emails --dry-run
@@ -582,9 +608,12 @@ Usage:
     python3 -m account_manager.cli update-jira-ids [options]
 
 Options:
-    --dry-run    Show what would be updated without making changes
-    --verbose    Show detailed progress messages
-    --mock       Use mock JIRA client (for testing)
+    --dry-run          Show what would be updated without making changes
+    --verbose          Show detailed progress messages
+    --mock             Use mock JIRA client (for testing)
+    --workers=N        Concurrent user searches (default: $JIRA_BATCH_WORKERS or 4)
+    --no-cache         Do not use the persistent Jira user search cache
+    --refresh-cache    Ignore cached user searches and re-fetch (results are re-cached)
 
 Description:
     Scans all accounts where:
@@ -596,6 +625,9 @@ Description:
     - jira_account (JIRA display name)
     - cohesity_email (ONLY if it's a @cohesity.com domain)
 
+    Searches run in parallel and are cached on disk for $JIRA_USER_CACHE_TTL
+    seconds (default: 1 day); all updates are written in one transaction.
+
 Multiple Match Handling:
     When multiple JIRA users match, disambiguation is attempted using:
     1. Exact display name match + cohesity.com email (highest priority)
@@ -829,12 +861,15 @@ Action History
 View history of actions for a specific target.
 
 Usage:
-    python3 -m account_manager.cli action-history <target_type> <target_id>
+    python3 -m account_manager.cli action-history <target_type> <target_id> [--limit=N]
 
 Arguments:
     target_type    Type: account, fi, etrack
     target_id      Identifier (etrack_user_id, FI-12345, 1234567)
 
+Options:
+    --limit=N      Show only the N most recent actions (default: all, streamed)
+
 Examples:
     # View all actions on account john_doe
     python3 -m account_manager.cli action-history account john_doe
@@ -867,6 +902,34 @@ Examples:
     python3 -m account_manager.cli action-clear --all
 """)
 
+    elif command == 'action-archive':
+        print("""
+Archive Action Log
+==================
+Move old action log entries into compressed monthly archive files
+(action_log_YYYY-MM.csv.gz) and keep their per-day counts, so
+action-summary and daily reports still include them. Then release the
+freed space (incremental VACUUM).
+
+Usage:
+    python3 -m account_manager.cli action-archive [options]
+
+Options:
+    --days=N              Keep the last N days in the live table (default: 90)
+    --before=YYYY-MM-DD   Archive entries before this date (overrides --days)
+    --dir=PATH            Archive directory (default: $ACTION_LOG_ARCHIVE_DIR or
+                          action_log_archive/ next to the database)
+    --dry-run             Show what would be archived
+    --no-vacuum           Skip releasing free pages
+
+Examples:
+    # Keep the last 90 days live
+    python3 -m account_manager.cli action-archive
+
+    # Archive everything before 2025
+    python3 -m account_manager.cli action-archive --before=2025-01-01 --dry-run
+""")
+
     elif command == 'lookup-etrack-emails':
         print("""
 Lookup Emails
@@ -968,7 +1031,7 @@ DATA IMPORT/EXPORT
     import-log <file>                Import action log from CSV (see help import-log)
 
     Modes: skip (default), update, fail
-    Options: --allow-empty (empty values clear existing data)
+    Options: --allow-empty (empty values clear existing data), --bulk (chunked transactions)
 
 FI VALIDATION (esql + Jira)
     validate-fi <query> [options]    Validate FI assignees (see help validate-fi)
@@ -1023,6 +1086,7 @@ ACTION LOGS
     action-summary [options]         View action statistics
     action-history <type> <id>       View history for specific target
     action-clear [--before=DATE]     Clear old action log entries
+    action-archive [--days=N]        Archive old entries to monthly .csv.gz + daily rollups
 
     Options: --limit=N, --type=TYPE, --status=STATUS, --since=YYYY-MM-DD
 
@@ -1474,25 +1538,22 @@ def main():
             if report_type == '--show-notes':
                 report_type = 'summary'
 
+            # Several types (comma-separated, or 'all') share one snapshot of the table
+            report_types = [t.strip() for t in report_type.split(',') if t.strip()]
+
             # Normalize underscore to dash for backward compatibility
-            if report_type == 'missing_fields':
-                report_type = 'missing-fields'
+            report_types = ['missing-fields' if t == 'missing_fields' else t for t in report_types]
 
             # Validate report type
-            valid_types = ['full', 'summary', 'missing-fields', 'table', 'compact', 'markdown', 'verification']
-            if report_type not in valid_types:
-                print(f"X Unknown report type: {report_type}")
-                print(f"  Valid types: {', '.join(valid_types)}")
-                print(f"  Use 'report -h' for help")
-                return
+            valid_types = ['full', 'summary', 'missing-fields', 'table', 'compact', 'markdown', 'verification', 'all']
+            for report_type in report_types:
+                if report_type not in valid_types:
+                    print(f"X Unknown report type: {report_type}")
+                    print(f"  Valid types: {', '.join(valid_types)}")
+                    print(f"  Use 'report -h' for help")
+                    return
 
-            # Handle special compact and markdown reports
-            if report_type == 'compact':
-                print(report_gen.generate_compact_table(show_notes=show_notes))
-            elif report_type == 'markdown':
-                print(report_gen.generate_markdown_table(show_notes=show_notes))
-            else:
-                print(report_gen.generate_report(report_type, show_notes=show_notes))
+            print(report_gen.generate_reports(report_types, show_notes=show_notes))
 
         elif command == 'export':
             # Handle help flag
@@ -1526,16 +1587,18 @@ def main():
                 print_usage('import')
                 return
             if len(sys.argv) < 3:
-                print("Usage: python3 -m account_manager.cli import <csv_file> [conflict_mode] [--allow-empty]")
+                print("Usage: python3 -m account_manager.cli import <csv_file> [conflict_mode] [--allow-empty] [--bulk]")
                 print("  conflict_mode: skip (default), update, or fail")
                 print("  --allow-empty: Empty CSV values will clear existing data")
+                print("  --bulk: One transaction per chunk of rows (large files)")
                 return
             filename = sys.argv[2]
             # Parse arguments
             allow_empty = '--allow-empty' in sys.argv
-            remaining_args = [a for a in sys.argv[3:] if a != '--allow-empty']
+            bulk = '--bulk' in sys.argv
+            remaining_args = [a for a in sys.argv[3:] if a not in ('--allow-empty', '--bulk')]
             conflict_mode = remaining_args[0] if remaining_args else 'skip'
-            io_utils.import_from_csv(filename, conflict_mode, allow_empty)
+            io_utils.import_from_csv(filename, conflict_mode, allow_empty, bulk=bulk)
 
         elif command == 'import-log':
             # Handle help flag
@@ -1611,7 +1674,7 @@ def main():
                 '--fix-severity', '--show-conflicts', '--table',
                 '--auto-add', '--interactive', '--fail-on-unknown',
                 '--all-types', '--perform-sr-type-check', '--skip-details',
-                '--only-unassigned'
+                '--only-unassigned', '--no-cache', '--refresh-cache', '--refresh'
             }
             valid_option_prefixes = {
                 '--fix-from=', '--report-from=', '--skip-fi=', '--incident=', '--fi=', '--format=',
@@ -1648,6 +1711,8 @@ def main():
             include_all_types = '--all-types' in sys.argv  # For --fi/--incident
             perform_sr_type_check = '--perform-sr-type-check' in sys.argv  # For query-based
             skip_details = '--skip-details' in sys.argv
+            use_cache = '--no-cache' not in sys.argv
+            refresh_cache = '--refresh-cache' in sys.argv or '--refresh' in sys.argv
             severity_mode = severity_report or severity_fix
             fi_sync_field_name = 'Consulting with R&D'
 
@@ -1902,7 +1967,7 @@ def main():
             print("=" * 60)
 
             # Execute esql query or fetch incident(s)/FI(s)
-            executor = EsqlExecutor()
+            executor = EsqlExecutor(cache=EsqlCache(refresh=refresh_cache) if use_cache else None)
             if fi_ids:
                 # Fetch records for each FI ID
                 records = []
@@ -1917,6 +1982,9 @@ def main():
                         include_all_types=include_all_types,
                         verbose=not skip_details
                     )
+                    if executor.failed_incidents:
+                        print(f"! {len(executor.failed_incidents)} incident(s) could not be fetched; retry with:")
+                        print(f"  --incident={','.join(executor.failed_incidents)}")
                 else:
                     # Single incident - use original method
                     records = executor.fetch_incident_by_id(incident_nos[0], include_all_types=include_all_types)
@@ -2085,7 +2153,8 @@ def main():
                 jira_client = MockJiraClient()
             else:
                 try:
-                    jira_client = JiraClient()
+                    issue_cache = IssueCache(refresh=refresh_cache) if use_cache else None
+                    jira_client = JiraClient(issue_cache=issue_cache)
                     if not jira_client.test_connection():
                         print("X Failed to connect to Jira")
                         return
@@ -2096,6 +2165,8 @@ def main():
 
             print()
 
+            # Per-record account lookups become dict hits (one accounts table scan)
+            db.enable_index()
             validator = FIValidator(db, jira_client, auto_populate_strategy=auto_strategy)
             run_assignee_validation = (
                 fix_mismatches or generate_report or fix_from_user is not None or report_from_user is not None
@@ -2844,6 +2915,16 @@ def main():
             else:
                 print("\nNo mismatch FIs found.")
 
+            # Connection reuse and cache statistics
+            if not use_mock:
+                print(f"\nJira connections: {format_connection_stats(jira_client.connection_stats())}")
+                if jira_client.issue_cache:
+                    print(f"Jira issue cache: {jira_client.issue_cache.format_stats()}")
+            if executor.cache:
+                print(f"esql result cache: {executor.cache.format_stats()}")
+            if executor.transport.latencies:
+                print(f"esql commands: {executor.transport.format_stats()}")
+
         elif command == 'check-assignee':
             # Check specific FI assignee
             if len(sys.argv) < 3:
@@ -2913,6 +2994,10 @@ def main():
             # Update missing Veritas emails using euserls
             dry_run = '--dry-run' in sys.argv
             verbose = '--verbose' in sys.argv
+            workers = None
+            for arg in sys.argv[2:]:
+                if arg.startswith('--workers='):
+                    workers = int(arg.split('=', 1)[1])
 
             print("Updating Missing Veritas Emails")
             print("=" * 60)
@@ -2921,7 +3006,9 @@ def main():
                 print("=" * 60)
 
             try:
-                updater = EuserlsUpdater(db, verbose=verbose)
+                negative_cache = EuserlsNegativeCache(refresh='--retry-missing' in sys.argv)
+                updater = EuserlsUpdater(db, verbose=verbose, max_workers=workers,
+                                         negative_cache=negative_cache)
                 stats = updater.update_missing_emails(dry_run=dry_run)
 
                 print("\n" + "=" * 60)
@@ -2930,6 +3017,8 @@ def main():
                 print(f"Accounts needing update: {stats['total']}")
                 print(f"Successfully updated: {stats['updated']}")
                 print(f"Failed: {stats['failed']}")
+                if stats['cached_missing']:
+                    print(f"Not queried (recently not found): {stats['cached_missing']} (use --retry-missing)")
                 print(f"Already had email: {stats['skipped']}")
 
                 if not dry_run and stats['updated'] > 0:
@@ -3043,6 +3132,12 @@ def main():
             dry_run = '--dry-run' in sys.argv
             verbose = '--verbose' in sys.argv
             use_mock = '--mock' in sys.argv
+            workers = None
+            for arg in sys.argv[2:]:
+                if arg.startswith('--workers='):
+                    workers = int(arg.split('=', 1)[1])
+            use_cache = '--no-cache' not in sys.argv and not use_mock
+            refresh_cache = '--refresh-cache' in sys.argv or '--refresh' in sys.argv
 
             print("Updating Missing JIRA IDs and Cohesity Emails")
             print("=" * 60)
@@ -3054,7 +3149,9 @@ def main():
                 print("=" * 60)
 
             try:
-                updater = JiraIdUpdater(db, verbose=verbose, use_mock=use_mock)
+                user_cache = JiraUserCache(refresh=refresh_cache) if use_cache else None
+                updater = JiraIdUpdater(db, verbose=verbose, use_mock=use_mock,
+                                        max_workers=workers, user_cache=user_cache)
                 stats = updater.update_missing_jira_ids(dry_run=dry_run)
 
                 print("\n" + "=" * 60)
@@ -3066,6 +3163,8 @@ def main():
                 print(f"Conflicts (need manual update): {stats.get('conflicts', 0)}")
                 print(f"Failed (no JIRA user found): {stats['failed']}")
                 print(f"Skipped: {stats['skipped']}")
+                if user_cache:
+                    print(f"Jira user cache: {user_cache.format_stats()}")
 
                 if stats.get('conflicts', 0) > 0:
                     print(f"\n! {stats['conflicts']} accounts had conflicts - see details above")
@@ -3401,36 +3500,38 @@ def main():
             # Check and update each FI
             fi_results = {'updated': 0, 'already_assigned': 0, 'failed': 0}
 
-            for fi_id in fi_ids:
-                print(f"\n  Processing {fi_id}...")
+            # Group-commit the per-FI log entries (flushed when the loop ends)
+            with db.buffered_action_log():
+                for fi_id in fi_ids:
+                    print(f"\n  Processing {fi_id}...")
 
-                # Get current FI assignee
-                current_fi_assignee = jira_client.get_assignee(fi_id)
-                print(f"    Current Jira assignee: {current_fi_assignee or 'N/A'}")
+                    # Get current FI assignee
+                    current_fi_assignee = jira_client.get_assignee(fi_id)
+                    print(f"    Current Jira assignee: {current_fi_assignee or 'N/A'}")
 
-                if current_fi_assignee == jira_account:
-                    print(f"    + Already assigned to {jira_account}")
-                    fi_results['already_assigned'] += 1
-                else:
-                    print(f"    -> Updating assignee to '{jira_account}'...")
-                    if dry_run:
-                        print(f"    [DRY-RUN] Would update {fi_id} assignee to {jira_account}")
-                        fi_results['updated'] += 1
-                        db.log_action('assign_fi', 'fi', fi_id,
-                                     old_value=current_fi_assignee, new_value=jira_account,
-                                     status='dry_run', details=f'etrack={etrack_number}, user={etrack_user_id}')
+                    if current_fi_assignee == jira_account:
+                        print(f"    + Already assigned to {jira_account}")
+                        fi_results['already_assigned'] += 1
                     else:
-                        success = jira_client.update_assignee(fi_id, jira_account)
-                        if success:
+                        print(f"    -> Updating assignee to '{jira_account}'...")
+                        if dry_run:
+                            print(f"    [DRY-RUN] Would update {fi_id} assignee to {jira_account}")
                             fi_results['updated'] += 1
                             db.log_action('assign_fi', 'fi', fi_id,
                                          old_value=current_fi_assignee, new_value=jira_account,
-                                         status='success', details=f'etrack={etrack_number}, user={etrack_user_id}')
+                                         status='dry_run', details=f'etrack={etrack_number}, user={etrack_user_id}')
                         else:
-                            fi_results['failed'] += 1
-                            db.log_action('assign_fi', 'fi', fi_id,
-                                         old_value=current_fi_assignee, new_value=jira_account,
-                                         status='failed', details=f'etrack={etrack_number}, user={etrack_user_id}')
+                            success = jira_client.update_assignee(fi_id, jira_account)
+                            if success:
+                                fi_results['updated'] += 1
+                                db.log_action('assign_fi', 'fi', fi_id,
+                                             old_value=current_fi_assignee, new_value=jira_account,
+                                             status='success', details=f'etrack={etrack_number}, user={etrack_user_id}')
+                            else:
+                                fi_results['failed'] += 1
+                                db.log_action('assign_fi', 'fi', fi_id,
+                                             old_value=current_fi_assignee, new_value=jira_account,
+                                             status='failed', details=f'etrack={etrack_number}, user={etrack_user_id}')
 
             # Summary
             print("\n" + "=" * 60)
@@ -3512,9 +3613,15 @@ def main():
 
             target_type = sys.argv[2]
             target_id = sys.argv[3]
+            limit = None
+            for arg in sys.argv[4:]:
+                if arg.startswith('--limit='):
+                    limit = int(arg.split('=', 1)[1])
 
+            # Stream the history: busy targets can have a very long log
             report_gen = ReportGenerator(db)
-            print(report_gen.generate_target_history_report(target_type, target_id))
+            for line in report_gen.iter_target_history_report(target_type, target_id, limit=limit):
+                print(line)
 
         elif command == 'action-clear':
             # Clear action log
@@ -3543,6 +3650,36 @@ def main():
 
             print(f"+ Cleared {deleted} action log entries")
 
+        elif command == 'action-archive':
+            # Handle help flag
+            if len(sys.argv) > 2 and sys.argv[2] in ['-h', '--help']:
+                print_usage('action-archive')
+                return
+            # Archive old action log entries
+            before = None
+            days = DEFAULT_RETENTION_DAYS
+            archive_dir = None
+            for arg in sys.argv[2:]:
+                if arg.startswith('--before='):
+                    before = arg.split('=', 1)[1]
+                elif arg.startswith('--days='):
+                    days = int(arg.split('=', 1)[1])
+                elif arg.startswith('--dir='):
+                    archive_dir = arg.split('=', 1)[1]
+            dry_run = '--dry-run' in sys.argv
+
+            archiver = ActionLogArchiver(db, archive_dir=archive_dir)
+            if dry_run:
+                print("DRY RUN MODE - No changes will be made")
+            stats = archiver.archive(before=before, days=days, dry_run=dry_run)
+            verb = "Would archive" if dry_run else "Archived"
+            print(f"+ {verb} {stats['archived']} entries from {stats['months']} month(s) to {archiver.archive_dir}")
+
+            if not dry_run and '--no-vacuum' not in sys.argv:
+                result = archiver.compact()
+                kind = "full VACUUM (one-time conversion)" if result['full_vacuum'] else "incremental VACUUM"
+                print(f"+ Released {result['free_before'] - result['free_after']} free pages ({kind})")
+
         elif command == 'lookup-etrack-emails':
             # Lookup emails for list of Etrack IDs, FI IDs, or usernames
             import select
@@ -3661,6 +3798,9 @@ def main():
             results = []  # List of (input_id, assignee, email)
             missing = []  # Items with no email found
 
+            # Per-ID account lookups become dict hits (one accounts table scan)
+            db.enable_index()
+
             # OPTIMIZED: Batch lookup for etrack type
             if input_type == 'etrack':
                 if verbose:
@@ -3847,10 +3987,35 @@ def main():
             print("\nEnvironment Variables:")
             env_vars = [
                 ('ET_JR_ACCOUNTS_DB', 'Database path'),
+                ('ET_JR_ACCOUNTS_WAL', 'WAL journal + tuned pragmas for the database (1 enables)'),
                 ('JIRA_SERVER_NAME', 'Jira server'),
                 ('JIRA_ACC_TOKEN', 'Jira API token'),
                 ('JIRA_PROJECT_KEY', 'Jira project'),
+                ('JIRA_POOL_SIZE', 'Jira keep-alive connection pool size'),
+                ('JIRA_IDLE_TIMEOUT', 'Seconds before an idle Jira connection is recycled'),
+                ('JIRA_MAX_RETRIES', 'Jira retries on connection errors/429/5xx'),
+                ('JIRA_BATCH_WORKERS', 'Concurrent Jira batch requests'),
+                ('JIRA_RATE_LIMIT', 'Max Jira requests per second'),
+                ('JIRA_ISSUE_CACHE_DB', 'Jira issue cache file'),
+                ('JIRA_ISSUE_CACHE_TTL', 'Jira issue cache TTL (seconds)'),
+                ('JIRA_USER_CACHE_DB', 'Jira user search cache file'),
+                ('JIRA_USER_CACHE_TTL', 'Jira user search cache TTL (seconds)'),
+                ('JIRA_FIELD_CACHE_DB', 'Jira field list cache file'),
+                ('JIRA_FIELD_CACHE_TTL', 'Jira field list cache TTL (seconds, 0 = disabled)'),
+                ('ESQL_CACHE_DB', 'esql result cache file'),
+                ('ESQL_CACHE_TTL', 'esql result cache TTL (seconds)'),
+                ('ESQL_BATCH_WORKERS', 'Concurrent esql batch queries'),
+                ('ESQL_JOIN', 'Single JOIN query for incidents + FI links (0 disables)'),
+                ('ACTION_LOG_BATCH_SIZE', 'Action log entries per commit (1 = write through)'),
+                ('ACTION_LOG_FLUSH_INTERVAL', 'Max seconds an action log entry stays buffered'),
+                ('ACTION_LOG_ARCHIVE_DIR', 'Directory for monthly action log archives'),
+                ('EUSERLS_WORKERS', 'Concurrent euserls lookups in update-emails'),
+                ('EUSERLS_NEGATIVE_CACHE_DB', 'Cache of users euserls did not find'),
+                ('EUSERLS_NEGATIVE_TTL', 'Seconds a euserls miss is trusted (0 disables)'),
                 ('RMTCMD_HOST', 'Remote command host'),
+                ('RMTCMD_MULTIPLEX', 'Reuse one SSH connection (0 disables)'),
+                ('RMTCMD_CONTROL_PERSIST', 'Idle SSH master lifetime (seconds)'),
+                ('RMTCMD_LOG_LATENCY', 'Print per-command latency (1 enables)'),
             ]
             for var, desc in env_vars:
                 value = os.environ.get(var)
@@ -3875,7 +4040,8 @@ def main():
             print("                    update-emails, fetch-email, update-jira-ids,")
             print("                    fetch-jira-id, auto-update, update-verified,")
             print("                    update-notes, action-log, action-summary,")
-            print("                    action-history, action-clear, lookup-etrack-emails,")
+            print("                    action-history, action-clear, action-archive,")
+            print("                    lookup-etrack-emails,")
             print("                    config, demo, help")
             print("\nFor detailed help: python3 -m account_manager.cli help [command]")
 
@@ -0,0 +1,187 @@
+"""
+ESQL Cache - Persistent SQLite cache of esql query output
+
+Results are content-addressed by a hash of the normalized SQL text, so the
+same lookup issued by different code paths (or back-to-back runs) is served
+locally instead of paying an SSH round trip to the esql host.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+# Default cache location (override with ESQL_CACHE_DB)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'account_manager', 'esql_cache.db')
+
+# Seconds a result is trusted (override default with ESQL_CACHE_TTL).
+# A query's TTL is the smallest TTL among the tables it reads.
+DEFAULT_TTL = 600
+TABLE_TTLS = {
+    'incident': 300,            # assigned_to changes during triage
+    'external_reference': 900,  # FI links change rarely
+}
+
+_TABLE_RE = re.compile(r'\b(?:from|join)\s+([A-Za-z_][A-Za-z0-9_]*)', re.IGNORECASE)
+_IN_LIST_RE = re.compile(r'\bIN\s*\(\s*(\d+(?:\s*,\s*\d+)*)\s*\)', re.IGNORECASE)
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Normalize SQL text so equivalent queries share a cache key
+
+    Collapses whitespace, drops a trailing semicolon and sorts numeric IN lists
+    (callers often build them from unordered sets).
+
+    Args:
+        sql: Raw SQL query string
+
+    Returns:
+        Normalized SQL string
+    """
+    text = ' '.join(sql.split()).rstrip(';').strip()
+
+    def sort_in_list(match):
+        values = sorted({v.strip() for v in match.group(1).split(',')}, key=int)
+        return f"IN ({', '.join(values)})"
+
+    return _IN_LIST_RE.sub(sort_in_list, text)
+
+
+class EsqlCache:
+    """Persistent on-disk cache of esql output keyed by normalized SQL"""
+
+    def __init__(self, db_path: str = None, default_ttl: int = None,
+                 table_ttls: Dict[str, int] = None, refresh: bool = False):
+        """
+        Initialize the esql cache
+
+        Args:
+            db_path: SQLite file path (default: $ESQL_CACHE_DB or ~/.cache/account_manager/esql_cache.db)
+            default_ttl: TTL in seconds for tables not in table_ttls (default: $ESQL_CACHE_TTL or 600)
+            table_ttls: Per-table TTL overrides in seconds
+            refresh: If True, ignore cached results (but still store fresh ones)
+        """
+        self.db_path = db_path or os.getenv('ESQL_CACHE_DB') or DEFAULT_CACHE_PATH
+        if default_ttl is None:
+            try:
+                default_ttl = int(os.getenv('ESQL_CACHE_TTL', DEFAULT_TTL))
+            except ValueError:
+                default_ttl = DEFAULT_TTL
+        self.default_ttl = default_ttl
+        self.table_ttls = dict(TABLE_TTLS)
+        if table_ttls:
+            self.table_ttls.update(table_ttls)
+        self.refresh = refresh
+        self.stats = {'hits': 0, 'misses': 0}
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS esql_cache (
+                query_hash TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                output TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def cache_key(sql: str) -> str:
+        """Get the content hash for a query."""
+        return hashlib.sha256(normalize_sql(sql).encode('utf-8')).hexdigest()
+
+    def ttl_for(self, sql: str) -> int:
+        """Get the TTL (seconds) for a query: the smallest TTL among the tables it reads."""
+        tables = {t.lower() for t in _TABLE_RE.findall(sql)}
+        if not tables:
+            return self.default_ttl
+        return min(self.table_ttls.get(t, self.default_ttl) for t in tables)
+
+    def get(self, sql: str, ttl: int = None) -> Optional[str]:
+        """
+        Get cached output for a query if it is still fresh
+
+        Args:
+            sql: SQL query (or named-query key)
+            ttl: TTL override in seconds
+
+        Returns:
+            Cached output or None
+        """
+        if self.refresh:
+            self.stats['misses'] += 1
+            return None
+
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT output, fetched_at FROM esql_cache WHERE query_hash = ?",
+                (self.cache_key(sql),)
+            ).fetchone()
+
+        if row and time.time() - row[1] <= (self.ttl_for(sql) if ttl is None else ttl):
+            self.stats['hits'] += 1
+            return row[0]
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, sql: str, output: str):
+        """Store query output."""
+        with self._lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO esql_cache (query_hash, query, output, fetched_at)
+                VALUES (?, ?, ?, ?)
+            """, (self.cache_key(sql), normalize_sql(sql), output, time.time()))
+            self.conn.commit()
+
+    def prune(self, max_age: int = None) -> int:
+        """
+        Delete entries older than max_age seconds
+
+        Args:
+            max_age: Age limit in seconds (default: largest configured TTL)
+
+        Returns:
+            Number of rows deleted
+        """
+        if max_age is None:
+            max_age = max([self.default_ttl] + list(self.table_ttls.values()))
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM esql_cache WHERE fetched_at < ?",
+                                       (time.time() - max_age,))
+            self.conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """Remove all cached entries. Returns number of rows deleted."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM esql_cache")
+            self.conn.commit()
+            return cursor.rowcount
+
+    def format_stats(self) -> str:
+        """Format hit/miss counters for display."""
+        return f"{self.stats['hits']} hit(s), {self.stats['misses']} miss(es)"
+
+    def close(self):
+        """Close the cache database"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
@@ -2,13 +2,42 @@
 ESQL Query Executor - Execute and parse esql queries
 """
 
-import subprocess
+import io
 import os
 import shutil
 import sys
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
+from .esql_cache import EsqlCache
+from .esql_parser import LineSource, iter_records, iter_rows
+from .remote_exec import get_remote_executor
+
+
+# Concurrent esql batches (override with ESQL_BATCH_WORKERS)
+DEFAULT_ESQL_WORKERS = 4
+
+
+def get_esql_workers(workers: int = None) -> int:
+    """Resolve the esql batch worker count (argument, $ESQL_BATCH_WORKERS, or default)."""
+    if workers is None:
+        try:
+            workers = int(os.getenv('ESQL_BATCH_WORKERS', DEFAULT_ESQL_WORKERS))
+        except ValueError:
+            workers = DEFAULT_ESQL_WORKERS
+    return max(1, int(workers))
+
+
+def _is_join_rejection(error: Exception) -> bool:
+    """
+    True if esql itself failed the JOIN query (any nonzero exit but ssh's 255)
+
+    esql's wording for an unsupported statement varies between servers, so
+    the exit status is used instead of the message.
+    """
+    match = re.search(r'\(exit (\d+)\)', str(error))
+    return bool(match) and match.group(1) != '255'
 
 
 def _fi_sort_key(fi_id: str) -> int:
@@ -40,14 +69,31 @@ class FIRecord:
 class EsqlExecutor:
     """Execute esql queries and parse results"""
 
-    def __init__(self, esql_command: str = None, ssh_target: str = None):
+    # Named queries (-r) read several tables; use the shortest incident TTL
+    NAMED_QUERY_TTL = 300
+
+    # Columns of the named FI query output (see parse_output)
+    FI_DUMP_FIELDS = ['incident_no', 'etrack_user_id', 'who_added_fi', 'fi_ids']
+
+    def __init__(self, esql_command: str = None, ssh_target: str = None,
+                 cache: Optional[EsqlCache] = None, use_join: bool = None):
         """
         Initialize ESQL executor
 
         Args:
             esql_command: Path to esql command or None for auto-detect
             ssh_target: SSH target in format 'user@host' (default: $RMTCMD_HOST env var)
+            cache: Optional persistent EsqlCache for query results
+            use_join: Fetch incidents and FI links with one JOIN query per batch
+                      (default: on unless $ESQL_JOIN=0; falls back to two queries if rejected)
         """
+        self.cache = cache
+        if use_join is None:
+            use_join = os.getenv('ESQL_JOIN', '1') != '0'
+        self.use_join = use_join
+        self.ssh_target = None
+        self.failed_incidents = []  # Incidents the last fetch_incidents_batch() could not fetch
+
         if esql_command:
             self.esql_command = esql_command
             self.use_ssh = False
@@ -70,6 +116,9 @@ class EsqlExecutor:
 
                 self.esql_command = f"ssh {self.ssh_target} esql"
 
+        # Shared transport: multiplexed SSH for remote esql, plain subprocess locally
+        self.transport = get_remote_executor(self.ssh_target if self.use_ssh else None)
+
     def execute_query(self, query_name: str, timeout: int = 300) -> str:
         """
         Execute esql query
@@ -82,42 +131,72 @@ class EsqlExecutor:
             Raw output from esql command
 
         Raises:
-            subprocess.TimeoutExpired: If command times out
-            subprocess.CalledProcessError: If command fails
+            TimeoutError: If command times out
+            RuntimeError: If command fails
             FileNotFoundError: If esql command not found
         """
-        try:
-            if self.use_ssh:
-                # Use shell=True for SSH command
-                cmd = f"{self.esql_command} -r {query_name}"
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=timeout,
-                    check=True
-                )
-            else:
-                # Use list for local command
-                cmd = [self.esql_command, '-r', query_name]
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=timeout,
-                    check=True
-                )
-            return result.stdout.decode('utf-8', errors='replace')
+        return ''.join(self.stream_query(query_name, timeout))
+
+    def stream_query(self, query_name: str, timeout: int = 300) -> Iterator[str]:
+        """
+        Execute esql query and yield output lines as esql produces them
+
+        Args:
+            query_name: Name of the query to execute
+            timeout: Command timeout in seconds (default: 300)
+
+        Yields:
+            Raw output lines
+
+        Raises:
+            TimeoutError: If command times out
+            RuntimeError: If command fails (after the lines already yielded)
+            FileNotFoundError: If esql command not found
+        """
+        cmd = ['esql' if self.use_ssh else self.esql_command, '-r', query_name]
+        yield from self._stream(cmd, None, f"-r {query_name}", self.NAMED_QUERY_TTL,
+                                timeout, f"esql query '{query_name}'")
 
-        except subprocess.TimeoutExpired:
-            raise TimeoutError(f"esql query '{query_name}' timed out after {timeout} seconds")
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"esql query '{query_name}' failed: {e.stderr.decode('utf-8', errors='replace') if e.stderr else ''}")
+    def _stream(self, cmd, input_text: Optional[str], cache_key: Optional[str],
+                ttl: Optional[int], timeout: int, what: str) -> Iterator[str]:
+        """
+        Stream esql output through the transport, serving/storing it via the cache
+
+        Args:
+            cmd: esql argv or command string
+            input_text: SQL passed via stdin (None for named queries)
+            cache_key: Cache key, or None to bypass the cache
+            ttl: Cache TTL override in seconds
+            timeout: Command timeout in seconds
+            what: Query description used in error messages
+
+        Yields:
+            Raw output lines
+        """
+        if self.cache and cache_key is not None:
+            cached = self.cache.get(cache_key, ttl=ttl)
+            if cached is not None:
+                yield from io.StringIO(cached)
+                return
+
+        # Lines are only kept when they have to be cached
+        collected = [] if self.cache and cache_key is not None else None
+        try:
+            for line in self.transport.stream(cmd, input_text=input_text, timeout=timeout, label='esql'):
+                if collected is not None:
+                    collected.append(line)
+                yield line
+        except TimeoutError:
+            raise TimeoutError(f"{what} timed out after {timeout} seconds")
         except FileNotFoundError:
             raise FileNotFoundError(f"esql command not found: {self.esql_command}")
+        except RuntimeError as e:
+            raise RuntimeError(f"{what} failed: {e}")
 
-    def parse_output(self, raw_output: str) -> List[FIRecord]:
+        if collected is not None:
+            self.cache.put(cache_key, ''.join(collected))
+
+    def parse_output(self, raw_output: LineSource) -> List[FIRecord]:
         """
         Parse esql output into FIRecord objects, deduplicating by incident_no + etrack_user_id
 
@@ -132,7 +211,7 @@ class EsqlExecutor:
               These are deduplicated, combining all unique FI IDs.
 
         Args:
-            raw_output: Raw output from esql command
+            raw_output: Raw output from esql command, or any iterable of lines (e.g., a pipe)
 
         Returns:
             List of FIRecord objects (deduplicated by incident_no + etrack_user_id)
@@ -140,24 +219,49 @@ class EsqlExecutor:
         # Use dict to deduplicate by (incident_no, etrack_user_id)
         # Key: (incident_no, etrack_user_id) -> {fi_ids: set, who_added_fi: list}
         record_map = {}
-        lines = raw_output.strip().split('\n')
 
-        for line_num, line in enumerate(lines, start=1):
-            line = line.strip()
-            if not line:
-                continue
+        for row in self.iter_records(raw_output):
+            key = (row.incident_no, row.etrack_user_id)
+            if key not in record_map:
+                record_map[key] = {
+                    'fi_ids': set(),
+                    'who_added_fi': []
+                }
+            # Add FI IDs (using set to deduplicate)
+            record_map[key]['fi_ids'].update(row.fi_ids)
+            # Track who added (for reference)
+            if row.who_added_fi and row.who_added_fi not in record_map[key]['who_added_fi']:
+                record_map[key]['who_added_fi'].append(row.who_added_fi)
 
-            # Split by tab
-            parts = line.split('\t')
+        # Convert map to list of FIRecords
+        records = []
+        for (incident_no, etrack_user_id), data in record_map.items():
+            record = FIRecord(
+                incident_no=incident_no,
+                etrack_user_id=etrack_user_id,
+                who_added_fi=', '.join(data['who_added_fi']),  # Combine all who added
+                fi_ids=_sort_fi_ids(data['fi_ids'])  # Numerically sorted list of unique FI IDs
+            )
+            records.append(record)
 
-            if len(parts) < 4:
-                print(f"Warning: Line {line_num} has insufficient fields, skipping: {line}")
-                continue
+        return records
 
-            incident_no = parts[0].strip()
-            etrack_user_id = parts[1].strip()
-            who_added_fi = parts[2].strip()
-            fi_ids_str = parts[3].strip()
+    def iter_records(self, raw_output: LineSource) -> Iterator[FIRecord]:
+        """
+        Lazily parse esql output, yielding one FIRecord per valid line (not deduplicated)
+
+        Args:
+            raw_output: Raw output string or any iterable of lines (e.g., stream_query())
+
+        Yields:
+            FIRecord objects in output order
+        """
+        rows = iter_rows(raw_output, self.FI_DUMP_FIELDS)
+        for line_num, (incident_no, etrack_user_id, who_added_fi, fi_ids_str) in enumerate(rows, start=1):
+            if not fi_ids_str:
+                print(f"Warning: Line {line_num} has insufficient fields, skipping: "
+                      f"{' '.join(p for p in (incident_no, etrack_user_id, who_added_fi) if p)}")
+                continue
 
             # Skip records with invalid etrack_user_id (placeholder values)
             if not etrack_user_id or etrack_user_id == '-' or etrack_user_id == 'N/A':
@@ -176,30 +280,12 @@ class EsqlExecutor:
                     print(f"Warning: Invalid FI ID format '{fi_id}' in line {line_num}, skipping")
 
             if valid_fi_ids:
-                key = (incident_no, etrack_user_id)
-                if key not in record_map:
-                    record_map[key] = {
-                        'fi_ids': set(),
-                        'who_added_fi': []
-                    }
-                # Add FI IDs (using set to deduplicate)
-                record_map[key]['fi_ids'].update(valid_fi_ids)
-                # Track who added (for reference)
-                if who_added_fi and who_added_fi not in record_map[key]['who_added_fi']:
-                    record_map[key]['who_added_fi'].append(who_added_fi)
-
-        # Convert map to list of FIRecords
-        records = []
-        for (incident_no, etrack_user_id), data in record_map.items():
-            record = FIRecord(
-                incident_no=incident_no,
-                etrack_user_id=etrack_user_id,
-                who_added_fi=', '.join(data['who_added_fi']),  # Combine all who added
-                fi_ids=_sort_fi_ids(data['fi_ids'])  # Numerically sorted list of unique FI IDs
-            )
-            records.append(record)
-
-        return records
+                yield FIRecord(
+                    incident_no=incident_no,
+                    etrack_user_id=etrack_user_id,
+                    who_added_fi=who_added_fi,
+                    fi_ids=valid_fi_ids
+                )
 
     def execute_and_parse(self, query_name: str, timeout: int = 300) -> List[FIRecord]:
         """
@@ -212,44 +298,39 @@ class EsqlExecutor:
         Returns:
             List of FIRecord objects
         """
-        raw_output = self.execute_query(query_name, timeout)
-        return self.parse_output(raw_output)
+        # Rows are parsed while esql is still writing them
+        return self.parse_output(self.stream_query(query_name, timeout))
 
-    def execute_raw_query(self, sql: str, timeout: int = 300) -> str:
+    def execute_raw_query(self, sql: str, timeout: int = 300, use_cache: bool = True) -> str:
         """
         Execute raw SQL query via esql using stdin
 
         Args:
             sql: Raw SQL query string
             timeout: Command timeout in seconds
+            use_cache: Serve/store the result through the executor's cache (if any)
 
         Returns:
             Raw output from esql command
         """
-        try:
-            if self.use_ssh:
-                # Execute via SSH, passing SQL through stdin
-                cmd = f"ssh {self.ssh_target} esql"
-            else:
-                cmd = self.esql_command
-
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=timeout,
-                input=sql.encode('utf-8'),
-                check=True
-            )
-            return result.stdout.decode('utf-8', errors='replace')
+        return ''.join(self.stream_raw_query(sql, timeout, use_cache))
 
-        except subprocess.TimeoutExpired:
-            raise TimeoutError(f"esql raw query timed out after {timeout} seconds")
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"esql raw query failed: {e.stderr.decode('utf-8', errors='replace') if e.stderr else ''}")
-        except FileNotFoundError:
-            raise FileNotFoundError(f"esql command not found: {self.esql_command}")
+    def stream_raw_query(self, sql: str, timeout: int = 300, use_cache: bool = True) -> Iterator[str]:
+        """
+        Execute raw SQL query via esql and yield output lines as esql produces them
+
+        Args:
+            sql: Raw SQL query string
+            timeout: Command timeout in seconds
+            use_cache: Serve/store the result through the executor's cache (if any)
+
+        Yields:
+            Raw output lines
+        """
+        # SQL goes through stdin; remote esql reuses the multiplexed SSH connection
+        cmd = 'esql' if self.use_ssh else self.esql_command
+        yield from self._stream(cmd, sql, sql if use_cache else None, None,
+                                timeout, "esql raw query")
 
     def fetch_incident_by_id(self, incident_no: str, timeout: int = 60,
                               type_filter: str = 'SERVICE_REQUEST',
@@ -273,15 +354,10 @@ class EsqlExecutor:
         # Parse assignee and type
         assignee = None
         inc_type = None
-        for line in assignee_output.strip().split('\n'):
-            line = line.strip()
-            if not line or 'assigned_to' in line.lower() or line.startswith('---'):
-                continue
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                assignee = parts[1].strip()
-                if len(parts) >= 3:
-                    inc_type = parts[2].strip()
+        for row in iter_records(assignee_output, ['incident', 'assigned_to', 'type']):
+            if row['assigned_to']:
+                assignee = row['assigned_to']
+                inc_type = row.get('type') or None
                 break
 
         if not assignee:
@@ -305,16 +381,8 @@ class EsqlExecutor:
         fi_output = self.execute_raw_query(fi_sql, timeout)
 
         # Parse FI IDs
-        fi_ids = []
-        for line in fi_output.strip().split('\n'):
-            line = line.strip()
-            if not line or 'ext_src' in line.lower() or line.startswith('---'):
-                continue
-            parts = re.split(r'[\t|]+', line)
-            parts = [p.strip() for p in parts if p.strip()]
-            for part in parts:
-                if re.match(r'^FI-\d+$', part):
-                    fi_ids.append(part)
+        fi_ids = [row['ext_inc'] for row in iter_records(fi_output, ['incident', 'ext_src', 'ext_inc'])
+                  if re.match(r'^FI-\d+$', row.get('ext_inc', ''))]
 
         if not fi_ids:
             return []
@@ -332,10 +400,15 @@ class EsqlExecutor:
                                type_filter: str = 'SERVICE_REQUEST',
                                include_all_types: bool = False,
                                batch_size: int = 100,
-                               verbose: bool = False) -> List['FIRecord']:
+                               verbose: bool = False,
+                               max_workers: int = None) -> List['FIRecord']:
         """
         Fetch FI records for multiple incident numbers in batches (more efficient than individual fetches)
 
+        Independent batches run concurrently. Batches that fail are retried once
+        serially; incidents still unresolved are reported and kept in
+        self.failed_incidents instead of being silently dropped.
+
         Args:
             incident_nos: List of etrack incident numbers
             timeout: Command timeout in seconds
@@ -343,115 +416,216 @@ class EsqlExecutor:
             include_all_types: If True, include all incident types (ignore type_filter)
             batch_size: Number of incidents per batch query
             verbose: Print progress info
+            max_workers: Concurrent batches (default: $ESQL_BATCH_WORKERS or 4, 1 = serial)
 
         Returns:
             List of FIRecord objects for incidents with FIs
         """
+        self.failed_incidents = []
         if not incident_nos:
             return []
 
-        # Deduplicate and clean
-        unique_incidents = list(set(str(i).strip() for i in incident_nos if str(i).strip().isdigit()))
+        # Deduplicate and clean (sorted so batches, and their cache keys, are stable across runs)
+        unique_incidents = sorted(set(str(i).strip() for i in incident_nos if str(i).strip().isdigit()), key=int)
         if not unique_incidents:
             return []
 
-        records = []
-        total = len(unique_incidents)
-        skipped_type = []
-
-        # Process in batches
-        for batch_start in range(0, total, batch_size):
-            batch = unique_incidents[batch_start:batch_start + batch_size]
-            batch_num = batch_start // batch_size + 1
-            total_batches = (total + batch_size - 1) // batch_size
-
-            if verbose or sys.stderr.isatty():
-                print(f"\rFetching incidents batch {batch_num}/{total_batches} ({len(batch)} incidents)...", end='', file=sys.stderr)
-
-            # Step 1: Get assignee and type for all incidents in batch
-            incident_list = ', '.join(batch)
-            assignee_sql = f"SELECT incident, assigned_to, type FROM incident WHERE incident IN ({incident_list})"
-            try:
-                assignee_output = self.execute_raw_query(assignee_sql, timeout)
-            except Exception as e:
-                print(f"\nWarning: Error fetching incident batch: {e}", file=sys.stderr)
-                continue
-
-            # Parse assignee data: incident -> (assignee, type)
-            incident_info = {}
-            for line in assignee_output.strip().split('\n'):
-                line = line.strip()
-                if not line or 'assigned_to' in line.lower() or line.startswith('---'):
-                    continue
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    inc_no = parts[0].strip()
-                    assignee = parts[1].strip()
-                    inc_type = parts[2].strip() if len(parts) >= 3 else None
-                    incident_info[inc_no] = (assignee, inc_type)
-
-            # Filter by type if needed
-            valid_incidents = []
-            for inc_no, (assignee, inc_type) in incident_info.items():
-                if not include_all_types and type_filter and inc_type:
-                    if inc_type != type_filter:
-                        skipped_type.append((inc_no, inc_type))
-                        continue
-                valid_incidents.append((inc_no, assignee, inc_type))
-
-            if not valid_incidents:
-                continue
+        batches = [unique_incidents[i:i + batch_size] for i in range(0, len(unique_incidents), batch_size)]
+        total_batches = len(batches)
+        workers = min(get_esql_workers(max_workers), total_batches)
+        show_progress = verbose or sys.stderr.isatty()
 
-            # Step 2: Get FI links for valid incidents
-            valid_incident_list = ', '.join(inc for inc, _, _ in valid_incidents)
-            fi_sql = (
-                f"SELECT DISTINCT incident, ext_inc "
-                f"FROM external_reference "
-                f"WHERE incident IN ({valid_incident_list}) "
-                f"AND ext_src IN ('TOOLS_AGILE', 'JIRA') "
-                f"AND ext_inc LIKE 'FI-%'"
-            )
+        def run_batch(batch):
             try:
-                fi_output = self.execute_raw_query(fi_sql, timeout)
+                return self._fetch_incident_batch(batch, timeout, type_filter, include_all_types), None
             except Exception as e:
-                print(f"\nWarning: Error fetching FI links: {e}", file=sys.stderr)
-                continue
+                return None, e
+
+        # Run batches concurrently; results are kept in batch order
+        results = [None] * total_batches
+        errors = {}
+        done = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {pool.submit(run_batch, batch): idx for idx, batch in enumerate(batches)}
+            for future in as_completed(futures):
+                idx = futures[future]
+                results[idx], error = future.result()
+                if error is not None:
+                    errors[idx] = error
+                done += 1
+                if show_progress:
+                    print(f"\rFetching incidents: {done}/{total_batches} batches done "
+                          f"({workers} parallel)...", end='', file=sys.stderr)
+
+        # Retry failed batches once, serially, before giving up on them
+        for idx in sorted(errors):
+            print(f"\nWarning: Error fetching incident batch {idx + 1}/{total_batches}: {errors[idx]}; retrying",
+                  file=sys.stderr)
+            results[idx], error = run_batch(batches[idx])
+            if error is not None:
+                print(f"Warning: Batch {idx + 1}/{total_batches} failed again: {error}", file=sys.stderr)
+                self.failed_incidents.extend(batches[idx])
 
-            # Parse FI links: incident -> [fi_ids]
-            incident_fis = {}
-            for line in fi_output.strip().split('\n'):
-                line = line.strip()
-                if not line or 'ext_inc' in line.lower() or line.startswith('---'):
-                    continue
-                parts = re.split(r'[\t|]+', line)
-                parts = [p.strip() for p in parts if p.strip()]
-                if len(parts) >= 2 and parts[0].isdigit():
-                    inc_no = parts[0]
-                    fi_id = parts[1]
-                    if re.match(r'^FI-\d+$', fi_id):
-                        if inc_no not in incident_fis:
-                            incident_fis[inc_no] = []
-                        incident_fis[inc_no].append(fi_id)
-
-            # Create records for incidents with FIs
-            for inc_no, assignee, inc_type in valid_incidents:
-                if inc_no in incident_fis:
-                    records.append(FIRecord(
-                        incident_no=inc_no,
-                        etrack_user_id=assignee,
-                        who_added_fi='(unknown)',
-                        fi_ids=_sort_fi_ids(incident_fis[inc_no]),
-                        incident_type=inc_type
-                    ))
+        records = []
+        skipped_type = []
+        for result in results:
+            if result:
+                batch_records, batch_skipped = result
+                records.extend(batch_records)
+                skipped_type.extend(batch_skipped)
 
         if sys.stderr.isatty():
             print(f"\r{' ' * 60}\r", end='', file=sys.stderr)
 
+        if self.failed_incidents:
+            preview = ', '.join(self.failed_incidents[:10])
+            more = f" (+{len(self.failed_incidents) - 10} more)" if len(self.failed_incidents) > 10 else ''
+            print(f"Warning: {len(self.failed_incidents)} incident(s) could not be fetched: {preview}{more}",
+                  file=sys.stderr)
+
         if skipped_type and verbose:
             print(f"  Note: Skipped {len(skipped_type)} non-{type_filter} incidents", file=sys.stderr)
 
         return records
 
+    def _fetch_incident_batch(self, batch: List[str], timeout: int, type_filter: str,
+                              include_all_types: bool) -> Tuple[List[FIRecord], List[tuple]]:
+        """
+        Fetch FI records for one batch of incidents
+
+        Args:
+            batch: Incident numbers in this batch
+            timeout: Command timeout in seconds
+            type_filter: Only include if incident is this type
+            include_all_types: If True, include all incident types
+
+        Returns:
+            Tuple of (list of FIRecord, list of (incident_no, type) skipped by type filter)
+
+        Raises:
+            RuntimeError/TimeoutError: If an esql query fails
+        """
+        if self.use_join:
+            try:
+                return self._fetch_incident_batch_join(batch, timeout, type_filter, include_all_types)
+            except RuntimeError as e:
+                if not _is_join_rejection(e):
+                    raise  # Transient failure: let the batch retry handle it
+                # Server rejected the JOIN; use the two-query path from now on
+                self.use_join = False
+                print(f"\nNote: esql JOIN query failed ({str(e).strip()[:100]}), "
+                      f"falling back to separate incident/external_reference queries", file=sys.stderr)
+
+        # Step 1: Get assignee and type for all incidents in batch
+        incident_list = ', '.join(batch)
+        assignee_sql = f"SELECT incident, assigned_to, type FROM incident WHERE incident IN ({incident_list})"
+
+        # Parse assignee data while it streams: incident -> (assignee, type)
+        incident_info = {}
+        rows = iter_records(self.stream_raw_query(assignee_sql, timeout), ['incident', 'assigned_to', 'type'])
+        for row in rows:
+            if row['incident'].isdigit():
+                incident_info[row['incident']] = (row['assigned_to'], row.get('type') or None)
+
+        # Filter by type if needed
+        skipped_type = []
+        valid_incidents = []
+        for inc_no, (assignee, inc_type) in incident_info.items():
+            if not include_all_types and type_filter and inc_type:
+                if inc_type != type_filter:
+                    skipped_type.append((inc_no, inc_type))
+                    continue
+            valid_incidents.append((inc_no, assignee, inc_type))
+
+        if not valid_incidents:
+            return [], skipped_type
+
+        # Step 2: Get FI links for valid incidents
+        valid_incident_list = ', '.join(inc for inc, _, _ in valid_incidents)
+        fi_sql = (
+            f"SELECT DISTINCT incident, ext_inc "
+            f"FROM external_reference "
+            f"WHERE incident IN ({valid_incident_list}) "
+            f"AND ext_src IN ('TOOLS_AGILE', 'JIRA') "
+            f"AND ext_inc LIKE 'FI-%'"
+        )
+
+        # Parse FI links while they stream: incident -> [fi_ids]
+        incident_fis = {}
+        for inc_no, fi_id in iter_rows(self.stream_raw_query(fi_sql, timeout), ['incident', 'ext_inc']):
+            if inc_no.isdigit() and re.match(r'^FI-\d+$', fi_id):
+                incident_fis.setdefault(inc_no, []).append(fi_id)
+
+        # Create records for incidents with FIs
+        records = []
+        for inc_no, assignee, inc_type in valid_incidents:
+            if inc_no in incident_fis:
+                records.append(FIRecord(
+                    incident_no=inc_no,
+                    etrack_user_id=assignee,
+                    who_added_fi='(unknown)',
+                    fi_ids=_sort_fi_ids(incident_fis[inc_no]),
+                    incident_type=inc_type
+                ))
+
+        return records, skipped_type
+
+    def _fetch_incident_batch_join(self, batch: List[str], timeout: int, type_filter: str,
+                                   include_all_types: bool) -> Tuple[List[FIRecord], List[tuple]]:
+        """
+        Fetch FI records for one batch with a single incident/external_reference JOIN
+
+        The type filter is applied in SQL; like the two-query path it keeps
+        incidents without a type. Filtered incidents are never returned, so
+        the skipped list is always empty.
+
+        Args:
+            batch: Incident numbers in this batch
+            timeout: Command timeout in seconds
+            type_filter: Only include if incident is this type
+            include_all_types: If True, include all incident types
+
+        Returns:
+            Tuple of (list of FIRecord, list of (incident_no, type) skipped by type filter)
+
+        Raises:
+            RuntimeError/TimeoutError: If the esql query fails
+        """
+        type_clause = ''
+        if not include_all_types and type_filter:
+            type_clause = f"AND (i.type = '{type_filter}' OR i.type IS NULL OR i.type = '') "
+        sql = (
+            f"SELECT DISTINCT i.incident, i.assigned_to, i.type, e.ext_inc "
+            f"FROM incident i JOIN external_reference e ON e.incident = i.incident "
+            f"WHERE i.incident IN ({', '.join(batch)}) "
+            f"{type_clause}"
+            f"AND e.ext_src IN ('TOOLS_AGILE', 'JIRA') "
+            f"AND e.ext_inc LIKE 'FI-%'"
+        )
+
+        # incident -> (assignee, type, [fi_ids]), in first-seen order (built while esql streams)
+        incidents = {}
+        rows = iter_rows(self.stream_raw_query(sql, timeout), ['incident', 'assigned_to', 'type', 'ext_inc'])
+        for inc_no, assignee, inc_type, fi_id in rows:
+            if not inc_no.isdigit() or not re.match(r'^FI-\d+$', fi_id):
+                continue
+            inc_type = inc_type or None
+            if inc_no not in incidents:
+                incidents[inc_no] = (assignee, inc_type, [])
+            incidents[inc_no][2].append(fi_id)
+
+        records = [
+            FIRecord(
+                incident_no=inc_no,
+                etrack_user_id=assignee,
+                who_added_fi='(unknown)',
+                fi_ids=_sort_fi_ids(fi_ids),
+                incident_type=inc_type
+            )
+            for inc_no, (assignee, inc_type, fi_ids) in incidents.items()
+        ]
+        return records, []
+
     def fetch_by_fi_id(self, fi_id: str, timeout: int = 60,
                         type_filter: str = 'SERVICE_REQUEST',
                         include_all_types: bool = False) -> List[FIRecord]:
@@ -481,15 +655,8 @@ class EsqlExecutor:
         incident_output = self.execute_raw_query(incident_sql, timeout)
 
         # Parse incident numbers
-        incident_nos = []
-        for line in incident_output.strip().split('\n'):
-            line = line.strip()
-            if not line or 'ext_src' in line.lower() or line.startswith('---'):
-                continue
-            parts = re.split(r'[\t|]+', line)
-            parts = [p.strip() for p in parts if p.strip()]
-            if parts and parts[0].isdigit():
-                incident_nos.append(parts[0])
+        incident_nos = [row['incident'] for row in iter_records(incident_output, ['incident', 'ext_src', 'ext_inc'])
+                        if row['incident'].isdigit()]
 
         if not incident_nos:
             return []
@@ -503,15 +670,10 @@ class EsqlExecutor:
 
             assignee = None
             inc_type = None
-            for line in assignee_output.strip().split('\n'):
-                line = line.strip()
-                if not line or 'assigned_to' in line.lower() or line.startswith('---'):
-                    continue
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    assignee = parts[1].strip()
-                    if len(parts) >= 3:
-                        inc_type = parts[2].strip()
+            for row in iter_records(assignee_output, ['incident', 'assigned_to', 'type']):
+                if row['assigned_to']:
+                    assignee = row['assigned_to']
+                    inc_type = row.get('type') or None
                     break
 
             # Filter by type unless include_all_types is True
@@ -548,8 +710,7 @@ class EsqlExecutor:
             List of FIRecord objects
         """
         with open(filename, 'r') as f:
-            content = f.read()
-        return self.parse_output(content)
+            return self.parse_output(f)
 
     def group_by_incident(self, records: List[FIRecord]) -> Dict[str, List[FIRecord]]:
         """
@@ -600,18 +761,11 @@ class EsqlExecutor:
         # Build IN clause for batch query
         incident_list = ', '.join(incident_nos)
         sql = f"SELECT incident, type FROM incident WHERE incident IN ({incident_list})"
-        output = self.execute_raw_query(sql, timeout)
 
-        # Parse results
+        # Parse results as they stream
         type_map = {}
-        for line in output.strip().split('\n'):
-            line = line.strip()
-            if not line or 'type' in line.lower() or line.startswith('---'):
-                continue
-            parts = line.split('\t')
-            if len(parts) >= 2:
-                inc_no = parts[0].strip()
-                inc_type = parts[1].strip()
+        for inc_no, inc_type in iter_rows(self.stream_raw_query(sql, timeout), ['incident', 'type']):
+            if inc_no.isdigit():
                 type_map[inc_no] = inc_type
 
         return type_map
@@ -0,0 +1,290 @@
+"""
+ESQL Parser - Streaming parser for esql output
+
+Works on any iterable of lines (a subprocess pipe, a file, or a string) and
+yields rows as they arrive, so callers can start on the first rows without
+holding the whole dump plus its split() copy in memory.
+
+The output format (tab, PrettyTable, fixed-width columns, ...) is detected
+once from the first data line, which also supplies the column names when it
+is a header. Every later row goes through one precompiled splitter and is
+mapped to columns by name, not by counting parts.
+"""
+
+import io
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+LineSource = Union[str, Iterable[str]]
+
+# Output formats
+FORMAT_TAB = 'tab'          # incident<TAB>assigned_to
+FORMAT_PIPE = 'pipe'        # | incident | assigned_to |  (PrettyTable) or incident|assigned_to
+FORMAT_COLUMNS = 'columns'  # fixed-width columns separated by 2+ spaces
+FORMAT_WORDS = 'words'      # single-space separated (single column or fallback)
+
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_TOKEN_RE = re.compile(r'\S+')
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_.]*$')
+
+
+def is_noise_line(stripped: str) -> bool:
+    """
+    Check whether a stripped esql output line carries no data
+
+    Args:
+        stripped: Line with surrounding whitespace removed
+
+    Returns:
+        True for blank lines, table borders/separators, row counts and warnings
+    """
+    if not stripped:
+        return True
+    first = stripped[0]
+    if first in '-=+':
+        return stripped.startswith(('---', '===', '+-'))
+    if first in 'Ww' and stripped[:8].lower() == 'warning:':
+        return True
+    # "N rows selected." is the only other non-data line esql prints
+    return stripped[-1] in '.dD' and stripped.rstrip('.').lower().endswith(('row selected', 'rows selected'))
+
+
+def iter_lines(source: LineSource) -> Iterator[str]:
+    """
+    Lazily yield stripped data lines from esql output
+
+    Args:
+        source: Raw output string or any iterable of lines (e.g., a pipe)
+
+    Yields:
+        Non-noise lines with surrounding whitespace removed
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    for line in source:
+        stripped = line.strip()
+        if not is_noise_line(stripped):
+            yield stripped
+
+
+def detect_format(line: str) -> str:
+    """
+    Detect the esql output format from one stripped data line
+
+    Tabs win over whitespace columns, which win over bare pipes (abstracts
+    often contain '|'). A leading '|' means a PrettyTable row.
+
+    Args:
+        line: Stripped line
+
+    Returns:
+        One of the FORMAT_* constants
+    """
+    if '\t' in line:
+        return FORMAT_TAB
+    if line.startswith('|'):
+        return FORMAT_PIPE
+    if _MULTI_SPACE_RE.search(line):
+        return FORMAT_COLUMNS
+    if line.count('|') >= 3:
+        return FORMAT_PIPE
+    return FORMAT_WORDS
+
+
+def _header_formats(line: str) -> List[str]:
+    """Formats a header line could be in, most specific first (headers never contain data pipes)."""
+    if '\t' in line:
+        return [FORMAT_TAB]
+    formats = []
+    if '|' in line:
+        formats.append(FORMAT_PIPE)
+    if _MULTI_SPACE_RE.search(line):
+        formats.append(FORMAT_COLUMNS)
+    formats.append(FORMAT_WORDS)
+    return formats
+
+
+def compile_splitter(fmt: str, n_fields: Optional[int] = None) -> Callable[[str], List[str]]:
+    """
+    Build the split function for a format
+
+    With n_fields, the last column absorbs any extra separators, so
+    '|' or tabs inside an abstract stay in the abstract.
+
+    Args:
+        fmt: One of the FORMAT_* constants
+        n_fields: Expected column count (None = split on every separator)
+
+    Returns:
+        Function mapping a stripped line to a list of stripped column values
+    """
+    maxsplit = n_fields - 1 if n_fields else -1
+
+    if fmt == FORMAT_PIPE:
+        strip = str.strip
+
+        def split_pipe(line):
+            # Drop PrettyTable borders first so they never count as columns
+            if line[0] == '|':
+                line = line[1:-1] if line[-1] == '|' else line[1:]
+            elif line[-1] == '|':
+                line = line[:-1]
+            return list(map(strip, line.split('|', maxsplit)))
+        return split_pipe
+
+    if n_fields == 1:
+        return lambda line: [line]
+
+    if fmt == FORMAT_TAB:
+        def split_tab(line):
+            parts = line.split('\t', maxsplit)
+            # Unpadded cells (the common case) need no per-column strip
+            if ' \t' in line or '\t ' in line:
+                return [p.strip() for p in parts]
+            return parts
+        return split_tab
+
+    if fmt == FORMAT_COLUMNS:
+        split_columns = _MULTI_SPACE_RE.split
+        count = max(maxsplit, 0)  # re.split: 0 = no limit
+        return lambda line: split_columns(line, count)
+
+    return lambda line: line.split(None, maxsplit)
+
+
+def _column_name(token: str) -> str:
+    """Normalize a header token or field name ('I.INCIDENT' -> 'incident')."""
+    return token.rsplit('.', 1)[-1].lower()
+
+
+class EsqlOutputParser:
+    """Parse esql output with a format detected once and columns mapped by header name"""
+
+    def __init__(self, fields: Optional[Sequence[str]] = None):
+        """
+        Initialize the parser
+
+        Args:
+            fields: Columns in SELECT order; used when the output has no header
+                    and to recognize the header when it has one
+        """
+        self.fields = [_column_name(f) for f in fields] if fields else None
+        self.format = None
+        self.columns = None   # Column names in output order
+        self.header = None    # Stripped header line (repeated headers are skipped)
+        self._split = None
+        self._offsets = None  # Header column start positions (fixed-width output)
+
+    def _is_header(self, tokens: List[str]) -> bool:
+        """Check whether split tokens look like column names."""
+        if not tokens or not all(_IDENTIFIER_RE.match(t) for t in tokens):
+            return False
+        if not self.fields:
+            return True
+        names = {_column_name(t) for t in tokens}
+        return bool(names & set(self.fields))
+
+    def _start(self, raw: str, line: str) -> bool:
+        """Detect format and columns from the first data line. Returns True if it is a header."""
+        for fmt in _header_formats(line):
+            tokens = compile_splitter(fmt)(line)
+            if self._is_header(tokens):
+                self.format = fmt
+                self.columns = [_column_name(t) for t in tokens]
+                self.header = line
+                if fmt == FORMAT_COLUMNS:
+                    self._offsets = [m.start() for m in _TOKEN_RE.finditer(raw.rstrip('\r\n'))]
+                self._split = compile_splitter(fmt, len(self.columns))
+                return True
+
+        # No header: the first row decides the format, columns come from fields
+        self.format = detect_format(line)
+        if self.fields:
+            self.columns = self.fields
+        else:
+            self.columns = [f"col{i}" for i in range(1, len(compile_splitter(self.format)(line)) + 1)]
+        self._split = compile_splitter(self.format, len(self.columns))
+        return False
+
+    def _slice(self, raw: str) -> List[str]:
+        """Cut a fixed-width row at the header's column offsets (keeps empty columns)."""
+        body = raw.rstrip('\r\n')
+        bounds = self._offsets[1:] + [None]
+        return [body[start:end].strip() for start, end in zip(self._offsets, bounds)]
+
+    def iter_rows(self, source: LineSource) -> Iterator[List[str]]:
+        """
+        Lazily yield rows as lists of values in self.columns order
+
+        Args:
+            source: Raw output string or any iterable of lines
+
+        Yields:
+            List of column values (padded to the column count)
+        """
+        if isinstance(source, str):
+            source = io.StringIO(source)
+
+        split = width = None
+        for raw in source:
+            line = raw.strip()
+            if is_noise_line(line):
+                continue
+            if split is None:
+                is_header = self._start(raw, line)
+                split, width = self._split, len(self.columns)
+                if is_header:
+                    continue
+            elif line == self.header:
+                continue
+
+            parts = split(line)
+            if len(parts) < width:
+                if self._offsets and len(self._offsets) == width:
+                    parts = self._slice(raw)
+                else:
+                    parts = parts + [''] * (width - len(parts))
+            yield parts
+
+    def iter_records(self, source: LineSource) -> Iterator[Dict[str, str]]:
+        """
+        Lazily yield rows as dicts keyed by lowercase column name
+
+        Args:
+            source: Raw output string or any iterable of lines
+
+        Yields:
+            Dictionary: {column: value}
+        """
+        for parts in self.iter_rows(source):
+            yield dict(zip(self.columns, parts))
+
+
+def iter_records(source: LineSource, fields: Optional[Sequence[str]] = None) -> Iterator[Dict[str, str]]:
+    """
+    Lazily parse esql output into dicts keyed by lowercase column name
+
+    Args:
+        source: Raw output string or any iterable of lines (e.g., a pipe)
+        fields: Columns in SELECT order (used when the output has no header)
+
+    Yields:
+        Dictionary: {column: value}
+    """
+    return EsqlOutputParser(fields).iter_records(source)
+
+
+def iter_rows(source: LineSource, fields: Sequence[str]) -> Iterator[List[str]]:
+    """
+    Lazily parse esql output into value lists in the given field order
+
+    Args:
+        source: Raw output string or any iterable of lines (e.g., a pipe)
+        fields: Columns in SELECT order
+
+    Yields:
+        List of values, one per field (missing columns are '')
+    """
+    names = [_column_name(f) for f in fields]
+    for record in iter_records(source, fields):
+        yield [record.get(name, '') for name in names]
@@ -11,8 +11,10 @@ import subprocess
 import os
 import shutil
 import re
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from dataclasses import dataclass
+from .esql_parser import iter_records
+from .remote_exec import get_remote_executor
 
 
 @dataclass
@@ -86,6 +88,11 @@ def validate_etrack_format(value: str) -> tuple:
 class EtrackExecutor:
     """Execute etrack commands (esql, eset) and parse results."""
 
+    # Columns fetched by get_etrack_info*() (fallback set for servers missing newer columns)
+    INFO_FIELDS = ['incident', 'assigned_to', 'state', 'severity', 'priority', 'version',
+                   'component', 'type', 'target_version', 'abstract']
+    INFO_FALLBACK_FIELDS = ['incident', 'assigned_to', 'state', 'abstract']
+
     def __init__(self, ssh_target: str = None):
         """
         Initialize Etrack executor.
@@ -105,6 +112,10 @@ class EtrackExecutor:
                 "Please install esql locally or set RMTCMD_HOST environment variable."
             )
 
+        # Shared transport: multiplexed SSH when esql is not installed locally
+        remote = self.ssh_target if not self.esql_local else None
+        self.transport = get_remote_executor(remote)
+
     def _execute_command(self, cmd: str, use_shell: bool = True, timeout: int = 60, stdin_input: str = None) -> Optional[str]:
         """
         Execute a command locally or via SSH.
@@ -119,47 +130,9 @@ class EtrackExecutor:
             Command output or None on error
         """
         try:
-            if self.ssh_target and not self.esql_local:
-                # Execute via SSH - pass stdin through echo pipe
-                if stdin_input:
-                    # Use printf to safely pass the query, avoiding shell escaping issues
-                    ssh_cmd = f"ssh {self.ssh_target} '{cmd}'"
-                    result = subprocess.run(
-                        ssh_cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=timeout,
-                        input=stdin_input.encode('utf-8')
-                    )
-                else:
-                    ssh_cmd = f"ssh {self.ssh_target} '{cmd}'"
-                    result = subprocess.run(
-                        ssh_cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=timeout
-                    )
-            else:
-                # Execute locally - pass query via stdin
-                if stdin_input:
-                    result = subprocess.run(
-                        cmd,
-                        shell=use_shell,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=timeout,
-                        input=stdin_input.encode('utf-8')
-                    )
-                else:
-                    result = subprocess.run(
-                        cmd,
-                        shell=use_shell,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        timeout=timeout
-                    )
+            # Remote commands reuse one multiplexed SSH connection
+            command = cmd if use_shell or self.transport.is_remote else cmd.split()
+            result = self.transport.run(command, input_text=stdin_input, timeout=timeout)
 
             if result.returncode != 0:
                 print(f"Warning: Command failed: {cmd}")
@@ -471,117 +444,15 @@ class EtrackExecutor:
         Returns:
             EtrackInfo object or None
         """
-        query = (
-            f"SELECT incident, assigned_to, state, severity, priority, version, component, type, target_version, abstract "
-            f"FROM incident WHERE incident = {incident_no}"
-        )
-        output = self._execute_command("esql", stdin_input=query)
-
-        if not output:
-            fallback_query = f"SELECT incident, assigned_to, state, type, abstract FROM incident WHERE incident = {incident_no}"
-            output = self._execute_command("esql", stdin_input=fallback_query)
-
-        if not output:
-            return None
-
-        lines = output.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if 'incident' in line.lower() and 'assigned_to' in line.lower():
-                continue
-            if line.startswith('---') or line.startswith('==='):
-                continue
-            if 'rows selected' in line.lower() or 'row selected' in line.lower():
-                continue
-
-            # Parse the data line - prioritize tabs/spaces over pipes
-            # (pipes often appear in abstract field as part of data)
-            if '\t' in line:
-                # Tab-separated - split on tabs, preserving empty fields
-                parts = [p.strip() for p in line.split('\t')]
-            elif re.search(r'\s{2,}', line):
-                # Whitespace-separated (fixed-width columns) - split on 2+ spaces
-                # This is common in esql output when columns have varying widths
-                parts = [p.strip() for p in re.split(r'\s{2,}', line)]
-            elif '|' in line and line.count('|') >= 3:
-                # Pipe-separated (only if multiple pipes suggest real separators)
-                parts = [p.strip() for p in line.split('|')]
-            else:
-                # Single space separated (unlikely but fallback)
-                parts = [p.strip() for p in line.split()]
-
-            # Filter completely empty parts only at the ends
-            while parts and not parts[0]:
-                parts.pop(0)
-            while parts and not parts[-1]:
-                parts.pop()
-
-            if len(parts) >= 3:
-                # Determine format based on column count
-                incident = parts[0] if len(parts) > 0 else None
-                assignee = parts[1] if len(parts) > 1 else None
-                state = parts[2] if len(parts) > 2 else None
-
-                if len(parts) == 5:
-                    # Fallback format: incident, assigned_to, state, type, abstract
-                    severity = None
-                    priority = None
-                    version = None
-                    component = None
-                    etype = parts[3] if parts[3] else None
-                    target_version = None
-                    abstract = parts[4]
-                elif len(parts) >= 10:
-                    # Full format: incident, assigned_to, state, severity, priority, version, component, type, target_version, abstract
-                    severity = parts[3] if parts[3] else None
-                    priority = parts[4] if parts[4] else None
-                    version = parts[5] if parts[5] else None
-                    component = parts[6] if parts[6] else None
-                    etype = parts[7] if parts[7] else None
-                    target_version = parts[8] if parts[8] else None
-                    abstract = parts[9] if len(parts) > 9 else None
-                elif len(parts) >= 9:
-                    # Old format without target_version: incident, assigned_to, state, severity, priority, version, component, type, abstract
-                    severity = parts[3] if parts[3] else None
-                    priority = parts[4] if parts[4] else None
-                    version = parts[5] if parts[5] else None
-                    component = parts[6] if parts[6] else None
-                    etype = parts[7] if parts[7] else None
-                    target_version = None
-                    abstract = parts[8] if len(parts) > 8 else None
-                elif len(parts) >= 8:
-                    # Old format without component: incident, assigned_to, state, severity, priority, version, type, abstract
-                    severity = parts[3] if parts[3] else None
-                    priority = parts[4] if parts[4] else None
-                    version = parts[5] if parts[5] else None
-                    component = None
-                    etype = parts[6] if parts[6] else None
-                    target_version = None
-                    abstract = parts[7] if len(parts) > 7 else None
-                else:
-                    # Partial - fields may be empty/collapsed, last field is likely abstract
-                    severity = None
-                    priority = None
-                    version = None
-                    component = None
-                    etype = None
-                    target_version = None
-                    abstract = parts[-1] if len(parts) > 3 else None
-
-                return EtrackInfo(
-                    incident_no=incident_no,
-                    assignee=assignee,
-                    state=state,
-                    severity=severity,
-                    priority=priority,
-                    abstract=abstract,
-                    version=version,
-                    component=component,
-                    type=etype,
-                    target_version=target_version,
-                )
+        for fields in (self.INFO_FIELDS, ['incident', 'assigned_to', 'state', 'type', 'abstract']):
+            query = f"SELECT {', '.join(fields)} FROM incident WHERE incident = {incident_no}"
+            try:
+                for info in self._iter_etrack_info(query, fields):
+                    info.incident_no = incident_no
+                    return info
+            except Exception as e:
+                print("Warning: Command failed: esql")
+                print(f"Error: {e}")
 
         return None
 
@@ -605,129 +476,23 @@ class EtrackExecutor:
         for i in range(0, len(incident_nos), batch_size):
             batch = incident_nos[i:i + batch_size]
             in_list = ','.join(batch)
-            query = (
-                f"SELECT incident, assigned_to, state, severity, priority, version, component, type, target_version, abstract "
-                f"FROM incident WHERE incident IN ({in_list})"
-            )
 
             if verbose:
                 print(f"  [DEBUG] Fetching etrack info batch {i // batch_size + 1} with {len(batch)} incidents")
 
-            output = self._execute_command("esql", stdin_input=query)
-
-            if not output:
-                fallback_query = (
-                    f"SELECT incident, assigned_to, state, abstract "
-                    f"FROM incident WHERE incident IN ({in_list})"
-                )
-                output = self._execute_command("esql", stdin_input=fallback_query)
-
-            if not output:
-                for incident_no in batch:
-                    results[incident_no] = None
-                continue
-
+            # Rows are parsed as esql writes them; fall back only if the full query yields nothing
             found_incidents = set()
-            lines = output.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if 'incident' in line.lower() and 'assigned_to' in line.lower():
-                    continue
-                if line.startswith('---') or line.startswith('==='):
-                    continue
-                if 'rows selected' in line.lower() or 'row selected' in line.lower():
-                    continue
-
-                # Parse the data line - prioritize tabs/spaces over pipes
-                # (pipes often appear in abstract field as part of data)
-                if '\t' in line:
-                    # Tab-separated
-                    parts = [p.strip() for p in line.split('\t')]
-                elif re.search(r'\s{2,}', line):
-                    # Whitespace-separated (fixed-width columns) - split on 2+ spaces
-                    parts = [p.strip() for p in re.split(r'\s{2,}', line)]
-                elif '|' in line and line.count('|') >= 3:
-                    # Pipe-separated (only if multiple pipes suggest real separators)
-                    parts = [p.strip() for p in line.split('|')]
-                else:
-                    # Single space separated (unlikely but fallback)
-                    parts = [p.strip() for p in line.split()]
-
-                # Filter completely empty parts only at the ends
-                while parts and not parts[0]:
-                    parts.pop(0)
-                while parts and not parts[-1]:
-                    parts.pop()
-
-                if len(parts) < 3:
-                    continue
-
-                incident_no = parts[0]
-                found_incidents.add(incident_no)
-
-                assignee = parts[1] if len(parts) > 1 else None
-                state = parts[2] if len(parts) > 2 else None
-
-                if len(parts) == 4:
-                    # Fallback format: incident, assigned_to, state, abstract
-                    severity = None
-                    priority = None
-                    version = None
-                    component = None
-                    etype = None
-                    target_version = None
-                    abstract = parts[3]
-                elif len(parts) >= 10:
-                    # Full format: incident, assigned_to, state, severity, priority, version, component, type, target_version, abstract
-                    severity = parts[3] if parts[3] else None
-                    priority = parts[4] if parts[4] else None
-                    version = parts[5] if parts[5] else None
-                    component = parts[6] if parts[6] else None
-                    etype = parts[7] if parts[7] else None
-                    target_version = parts[8] if parts[8] else None
-                    abstract = parts[9] if len(parts) > 9 else None
-                elif len(parts) >= 8:
-                    # Old format: incident, assigned_to, state, severity, priority, version, component, abstract
-                    severity = parts[3] if parts[3] else None
-                    priority = parts[4] if parts[4] else None
-                    version = parts[5] if parts[5] else None
-                    component = parts[6] if parts[6] else None
-                    etype = None
-                    target_version = None
-                    abstract = parts[7] if len(parts) > 7 else None
-                elif len(parts) >= 7:
-                    # Old format without component: incident, assigned_to, state, severity, priority, version, abstract
-                    severity = parts[3] if parts[3] else None
-                    priority = parts[4] if parts[4] else None
-                    version = parts[5] if parts[5] else None
-                    component = None
-                    etype = None
-                    target_version = None
-                    abstract = parts[6] if len(parts) > 6 else None
-                else:
-                    # Partial - fields may be empty/collapsed, last field is likely abstract
-                    severity = None
-                    priority = None
-                    version = None
-                    component = None
-                    etype = None
-                    target_version = None
-                    abstract = parts[-1] if len(parts) > 3 else None
-
-                results[incident_no] = EtrackInfo(
-                    incident_no=incident_no,
-                    assignee=assignee,
-                    state=state,
-                    severity=severity,
-                    priority=priority,
-                    abstract=abstract,
-                    version=version,
-                    component=component,
-                    type=etype,
-                    target_version=target_version,
-                )
+            for fields in (self.INFO_FIELDS, self.INFO_FALLBACK_FIELDS):
+                query = f"SELECT {', '.join(fields)} FROM incident WHERE incident IN ({in_list})"
+                try:
+                    for info in self._iter_etrack_info(query, fields):
+                        results[info.incident_no] = info
+                        found_incidents.add(info.incident_no)
+                except Exception as e:
+                    print("Warning: Command failed: esql")
+                    print(f"Error: {e}")
+                if found_incidents:
+                    break
 
             for incident_no in batch:
                 if incident_no not in found_incidents:
@@ -735,6 +500,42 @@ class EtrackExecutor:
 
         return results
 
+    def _iter_etrack_info(self, query: str, fields: List[str], timeout: int = 60) -> Iterator[EtrackInfo]:
+        """
+        Stream an incident query through esql and yield EtrackInfo per row as it arrives.
+
+        Columns are mapped by header name (or SELECT order when esql prints no header),
+        so missing columns simply stay None.
+
+        Args:
+            query: SELECT on incident
+            fields: Columns in SELECT order
+            timeout: Command timeout in seconds
+
+        Yields:
+            EtrackInfo objects in output order
+
+        Raises:
+            RuntimeError/TimeoutError: If esql fails (after the rows already yielded)
+        """
+        output = self.transport.stream("esql", input_text=query, timeout=timeout)
+        for row in iter_records(output, fields):
+            incident_no = row.get('incident')
+            if not incident_no:
+                continue
+            yield EtrackInfo(
+                incident_no=incident_no,
+                assignee=row.get('assigned_to') or None,
+                state=row.get('state') or None,
+                severity=row.get('severity') or None,
+                priority=row.get('priority') or None,
+                abstract=row.get('abstract') or None,
+                version=row.get('version') or None,
+                component=row.get('component') or None,
+                type=row.get('type') or None,
+                target_version=row.get('target_version') or None,
+            )
+
 
 class MockEtrackExecutor:
     """Mock Etrack executor for testing without actual etrack access."""
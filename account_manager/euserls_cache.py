@@ -0,0 +1,121 @@
+"""
+euserls Cache - Persistent negative cache for euserls lookups
+
+Users that euserls does not know (departed, renamed, typos) are remembered
+for a TTL, so the nightly email backfill does not spend a subprocess (and
+an SSH round trip) on each of them every run. Only definitive misses are
+stored; timeouts and SSH failures are retried on the next run.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Set
+
+# Default cache location (override with EUSERLS_NEGATIVE_CACHE_DB)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'account_manager', 'euserls_negative.db')
+
+# Seconds a user stays "known missing" (override with EUSERLS_NEGATIVE_TTL)
+DEFAULT_NEGATIVE_TTL = 7 * 86400
+
+
+class EuserlsNegativeCache:
+    """Persistent on-disk set of etrack_user_ids that euserls did not find"""
+
+    def __init__(self, db_path: str = None, ttl: int = None, refresh: bool = False):
+        """
+        Initialize the negative cache
+
+        Args:
+            db_path: SQLite file path (default: $EUSERLS_NEGATIVE_CACHE_DB or ~/.cache/account_manager/euserls_negative.db)
+            ttl: Seconds a miss is trusted (default: $EUSERLS_NEGATIVE_TTL or 7 days; 0 disables the cache)
+            refresh: If True, ignore cached misses (but still record new ones)
+        """
+        self.db_path = db_path or os.getenv('EUSERLS_NEGATIVE_CACHE_DB') or DEFAULT_CACHE_PATH
+        if ttl is None:
+            try:
+                ttl = int(os.getenv('EUSERLS_NEGATIVE_TTL', DEFAULT_NEGATIVE_TTL))
+            except ValueError:
+                ttl = DEFAULT_NEGATIVE_TTL
+        self.ttl = ttl
+        self.refresh = refresh
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS euserls_missing (
+                etrack_user_id TEXT PRIMARY KEY,
+                checked_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    @property
+    def enabled(self) -> bool:
+        """True if cached misses are consulted"""
+        return self.ttl > 0 and not self.refresh
+
+    def known_missing(self, etrack_user_ids: Iterable[str]) -> Set[str]:
+        """
+        Get the users with an unexpired miss
+
+        Args:
+            etrack_user_ids: IDs to check
+
+        Returns:
+            Set of the IDs euserls did not find within the TTL
+        """
+        if not self.enabled:
+            return set()
+        ids = list(dict.fromkeys(etrack_user_ids))
+        cutoff = time.time() - self.ttl
+        found = set()
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = self.conn.execute(
+                    f"SELECT etrack_user_id FROM euserls_missing "
+                    f"WHERE checked_at >= ? AND etrack_user_id IN ({placeholders})",
+                    [cutoff] + chunk
+                )
+                found.update(row[0] for row in cursor.fetchall())
+        return found
+
+    def add(self, etrack_user_ids: List[str]):
+        """Record users that euserls did not find (now)."""
+        if not etrack_user_ids or self.ttl <= 0:
+            return
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO euserls_missing (etrack_user_id, checked_at) VALUES (?, ?)",
+                [(user_id, now) for user_id in etrack_user_ids]
+            )
+            self.conn.commit()
+
+    def discard(self, etrack_user_ids: List[str]):
+        """Forget misses for users that have since been found."""
+        if not etrack_user_ids:
+            return
+        with self._lock:
+            self.conn.executemany("DELETE FROM euserls_missing WHERE etrack_user_id = ?",
+                                  [(user_id,) for user_id in etrack_user_ids])
+            self.conn.commit()
+
+    def clear(self) -> int:
+        """Remove all cached misses. Returns number of rows deleted."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM euserls_missing")
+            self.conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """Close the cache database"""
+        with self._lock:
+            self.conn.close()
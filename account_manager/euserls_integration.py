@@ -10,10 +10,18 @@ The euserls command can be executed locally or remotely via SSH using RMTCMD_HOS
 
 import subprocess
 import os
+import sqlite3
 import shutil
 import re
-from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
+from .remote_exec import get_remote_executor
+from .euserls_cache import EuserlsNegativeCache
+
+# Concurrent euserls invocations for bulk lookups (override with EUSERLS_WORKERS).
+# Remote calls share one multiplexed SSH master, whose sshd allows 10 sessions by default.
+DEFAULT_EUSERLS_WORKERS = 8
 
 
 @dataclass
@@ -50,6 +58,9 @@ class EuserlsExecutor:
                     "Please install euserls or set RMTCMD_HOST environment variable."
                 )
 
+        # Shared transport: multiplexed SSH when euserls is not installed locally
+        self.transport = get_remote_executor(self.rmtcmd_host if self.use_ssh else None)
+
     def get_user_info(self, etrack_user_id: str) -> Optional[EuserInfo]:
         """
         Execute euserls command and parse the output for a specific user.
@@ -60,11 +71,54 @@ class EuserlsExecutor:
         Returns:
             EuserInfo object if successful, None if user not found or error
         """
+        return self.lookup(etrack_user_id)[0]
+
+    def lookup(self, etrack_user_id: str) -> Tuple[Optional[EuserInfo], bool]:
+        """
+        Query one user, telling "not found" apart from "could not ask"
+
+        Args:
+            etrack_user_id: The etrack user ID to query
+
+        Returns:
+            Tuple of (EuserInfo or None, definitive). definitive is True only
+            when euserls exited cleanly and listed no user; any failure
+            (nonzero exit, timeout, unparsable user line) says nothing about
+            the user.
+        """
         output = self._execute_euserls(etrack_user_id)
-        if not output:
-            return None
+        if output is None:
+            return None, False
 
-        return self._parse_output(output, etrack_user_id)
+        user_info = self._parse_output(output, etrack_user_id)
+        if user_info:
+            return user_info, True
+        return None, not self._has_user_line(output)
+
+    def lookup_many(self, etrack_user_ids: List[str],
+                    max_workers: int = None) -> Dict[str, Tuple[Optional[EuserInfo], bool]]:
+        """
+        Query many users with a bounded pool of concurrent euserls invocations
+
+        Args:
+            etrack_user_ids: The etrack user IDs to query
+            max_workers: Concurrent invocations (default: $EUSERLS_WORKERS or 8; 1 = serial)
+
+        Returns:
+            Dictionary of etrack_user_id -> (EuserInfo or None, definitive), see lookup()
+        """
+        if max_workers is None:
+            try:
+                max_workers = int(os.getenv('EUSERLS_WORKERS', DEFAULT_EUSERLS_WORKERS))
+            except ValueError:
+                max_workers = DEFAULT_EUSERLS_WORKERS
+        ids = list(dict.fromkeys(etrack_user_ids))
+        workers = min(max(1, max_workers), len(ids)) if ids else 1
+
+        if workers == 1:
+            return {user_id: self.lookup(user_id) for user_id in ids}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(ids, pool.map(self.lookup, ids)))
 
     def get_email(self, etrack_user_id: str) -> Optional[str]:
         """
@@ -80,26 +134,16 @@ class EuserlsExecutor:
         return user_info.email if user_info else None
 
     def _execute_euserls(self, etrack_user_id: str) -> Optional[str]:
-        """Execute the euserls command locally or via SSH."""
+        """
+        Execute the euserls command locally or via SSH.
+
+        Returns:
+            stdout, or None if euserls failed (nonzero exit, timeout, could not start)
+        """
         try:
-            if self.use_ssh:
-                # Execute via SSH (use shell=True for SSH command)
-                ssh_cmd = f"ssh {self.rmtcmd_host} 'euserls {etrack_user_id}'"
-                result = subprocess.run(
-                    ssh_cmd,
-                    shell=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=30
-                )
-            else:
-                # Execute locally (use list for local command)
-                result = subprocess.run(
-                    [self.euserls_path, etrack_user_id],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=30
-                )
+            # Remote calls reuse one multiplexed SSH connection
+            cmd = ['euserls' if self.use_ssh else self.euserls_path, etrack_user_id]
+            result = self.transport.run(cmd, timeout=30, label='euserls')
 
             if result.returncode != 0:
                 print(f"Warning: euserls command failed for {etrack_user_id}")
@@ -115,6 +159,12 @@ class EuserlsExecutor:
             print(f"Error executing euserls for {etrack_user_id}: {e}")
             return None
 
+    @staticmethod
+    def _has_user_line(output: str) -> bool:
+        """True if euserls output contains anything besides headers and separators."""
+        return any(line.strip() and not line.startswith(('---', '===')) and 'Login' not in line
+                   for line in output.split('\n'))
+
     def _parse_output(self, output: str, etrack_user_id: str) -> Optional[EuserInfo]:
         """
         Parse euserls output to extract user information.
@@ -243,37 +293,57 @@ class EuserlsExecutor:
 class EuserlsUpdater:
     """Update accounts with missing Veritas emails using euserls."""
 
-    def __init__(self, account_manager, verbose: bool = False):
+    def __init__(self, account_manager, verbose: bool = False, max_workers: int = None,
+                 negative_cache: EuserlsNegativeCache = None):
         """
         Initialize the updater.
 
         Args:
             account_manager: AccountManager instance
             verbose: Print detailed progress messages
+            max_workers: Concurrent euserls invocations (default: $EUSERLS_WORKERS or 8)
+            negative_cache: Cache of users euserls did not find (default: EuserlsNegativeCache())
         """
         self.account_manager = account_manager
         self.verbose = verbose
+        self.max_workers = max_workers
         self.executor = EuserlsExecutor()
+        self.negative_cache = negative_cache
+
+    def _get_negative_cache(self) -> Optional[EuserlsNegativeCache]:
+        """Open the default negative cache on first use (None if it cannot be opened)."""
+        if self.negative_cache is None:
+            try:
+                self.negative_cache = EuserlsNegativeCache()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: euserls negative cache disabled: {e}")
+                return None
+        return self.negative_cache
 
     def update_missing_emails(self, dry_run: bool = False) -> Dict[str, int]:
         """
         Update all accounts that have missing Veritas email addresses.
 
+        Users are looked up concurrently (see EuserlsExecutor.lookup_many),
+        users euserls recently did not find are skipped until their negative
+        cache entry expires, and all updates are written in one transaction.
+
         Args:
             dry_run: If True, only report what would be updated without making changes
 
         Returns:
-            Dictionary with statistics: {'total': n, 'updated': n, 'failed': n, 'skipped': n}
+            Dictionary with statistics:
+            {'total': n, 'updated': n, 'failed': n, 'skipped': n, 'cached_missing': n}
         """
-        stats = {'total': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        stats = {'total': 0, 'updated': 0, 'failed': 0, 'skipped': 0, 'cached_missing': 0}
 
         # Get all accounts
         accounts = self.account_manager.get_all_accounts()
 
+        # Collect the accounts that need something, and what they need
+        pending = []
         for account in accounts:
             etrack_user_id = account['etrack_user_id']
-            veritas_email = account.get('veritas_email')
-            community_account = account.get('community_account')
 
             # Skip invalid etrack_user_ids
             if not etrack_user_id or etrack_user_id in ['-', '']:
@@ -283,9 +353,9 @@ class EuserlsUpdater:
                 continue
 
             # Check what needs to be updated
-            needs_email = not veritas_email
+            needs_email = not account.get('veritas_email')
             needs_names = not account.get('first_name') and not account.get('last_name')
-            needs_community = not community_account
+            needs_community = not account.get('community_account')
 
             # Skip if nothing needs updating
             if not needs_email and not needs_names and not needs_community:
@@ -295,73 +365,79 @@ class EuserlsUpdater:
                 continue
 
             stats['total'] += 1
+            pending.append((etrack_user_id, needs_email, needs_names, needs_community))
+
+        # Users euserls did not find within the negative cache TTL
+        cache = self._get_negative_cache()
+        known_missing = cache.known_missing(p[0] for p in pending) if cache else set()
+
+        to_query = [p[0] for p in pending if p[0] not in known_missing]
+        if self.verbose and to_query:
+            print(f"Fetching {len(to_query)} users with euserls...")
+        results = self.executor.lookup_many(to_query, max_workers=self.max_workers)
+
+        updates = []
+        messages = []
+        missing = []
+        for etrack_user_id, needs_email, needs_names, needs_community in pending:
+            if etrack_user_id in known_missing:
+                if self.verbose:
+                    print(f"Skipping {etrack_user_id}: not found by euserls recently (cached)")
+                stats['cached_missing'] += 1
+                continue
 
-            if self.verbose:
-                what_updating = []
-                if needs_email:
-                    what_updating.append('email')
-                if needs_names:
-                    what_updating.append('names')
-                if needs_community:
-                    what_updating.append('community')
-                print(f"Fetching {', '.join(what_updating)} for {etrack_user_id}...")
-
-            # Fetch user info using euserls
-            user_info = self.executor.get_user_info(etrack_user_id)
-
+            user_info, definitive = results[etrack_user_id]
             if not user_info:
                 print(f"Failed to fetch info for {etrack_user_id}")
+                if definitive:
+                    missing.append(etrack_user_id)
                 stats['failed'] += 1
                 continue
 
+            update_fields = {}
+
+            # Update email if missing
+            if needs_email:
+                update_fields['veritas_email'] = user_info.email
+
+            # Update names if both are missing
+            if needs_names:
+                update_fields['first_name'] = user_info.first_name
+                update_fields['last_name'] = user_info.last_name
+
+            # Update community account if missing (derive from email)
+            if needs_community and user_info.email:
+                update_fields['community_account'] = user_info.email.replace('@veritas.com', '')
+
+            changes = []
+            if needs_email:
+                changes.append(f"veritas_email={user_info.email}")
+            if needs_names:
+                changes.append(f"first_name={user_info.first_name}, last_name={user_info.last_name}")
+            if needs_community and user_info.email:
+                changes.append(f"community_account={update_fields['community_account']}")
+
             if dry_run:
-                updates = []
-                if needs_email:
-                    updates.append(f"veritas_email={user_info.email}")
-                if needs_names:
-                    updates.append(f"first_name={user_info.first_name}")
-                    updates.append(f"last_name={user_info.last_name}")
-                if needs_community and user_info.email:
-                    # Derive community account from email (remove @veritas.com)
-                    community = user_info.email.replace('@veritas.com', '')
-                    updates.append(f"community_account={community}")
-                print(f"Would update {etrack_user_id}: {', '.join(updates)}")
-                stats['updated'] += 1
+                print(f"Would update {etrack_user_id}: {', '.join(changes)}")
             else:
-                # Update the account
-                try:
-                    update_fields = {}
-
-                    # Update email if missing
-                    if needs_email:
-                        update_fields['veritas_email'] = user_info.email
-
-                    # Update names if both are missing
-                    if needs_names:
-                        update_fields['first_name'] = user_info.first_name
-                        update_fields['last_name'] = user_info.last_name
-
-                    # Update community account if missing (derive from email)
-                    if needs_community and user_info.email:
-                        update_fields['community_account'] = user_info.email.replace('@veritas.com', '')
-
-                    self.account_manager.update_account(
-                        etrack_user_id=etrack_user_id,
-                        **update_fields
-                    )
-
-                    updates = []
-                    if needs_email:
-                        updates.append(f"veritas_email={user_info.email}")
-                    if needs_names:
-                        updates.append(f"first_name={user_info.first_name}, last_name={user_info.last_name}")
-                    if needs_community and user_info.email:
-                        updates.append(f"community_account={user_info.email.replace('@veritas.com', '')}")
-                    print(f"Updated {etrack_user_id}: {', '.join(updates)}")
-                    stats['updated'] += 1
-                except Exception as e:
-                    print(f"Error updating {etrack_user_id}: {e}")
-                    stats['failed'] += 1
+                messages.append(f"Updated {etrack_user_id}: {', '.join(changes)}")
+            update_fields['etrack_user_id'] = etrack_user_id
+            updates.append(update_fields)
+            stats['updated'] += 1
+
+        if cache and not dry_run:
+            cache.add(missing)
+            cache.discard([u['etrack_user_id'] for u in updates])
+
+        if updates and not dry_run:
+            try:
+                self.account_manager.apply_account_batch(updates=updates)
+                for message in messages:
+                    print(message)
+            except Exception as e:
+                print(f"Error updating accounts: {e}")
+                stats['failed'] += stats['updated']
+                stats['updated'] = 0
 
         return stats
 
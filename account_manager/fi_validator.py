@@ -221,6 +221,69 @@ class FIValidator:
             print(f"X Failed to add account for '{etrack_user_id}': {e}")
             return None
 
+    def _add_missing_accounts(self, records: List[FIRecord], fi_assignees: Dict[str, Optional[str]],
+                              expected_jira_ids: Dict[str, Optional[str]]):
+        """
+        Add accounts for every unknown etrack assignee of a run in one bulk insert
+
+        Batch counterpart of _handle_missing_account() for AUTO and INTERACTIVE
+        modes. INTERACTIVE defaults come from AccountPopulator.populate_batch()
+        (FI assignees already fetched for validation, plus one profile lookup
+        per assignee); AUTO adds minimal accounts as before. Handled users are
+        marked processed, so per-record handling skips them.
+
+        Args:
+            records: FI records being validated
+            fi_assignees: Pre-fetched FI ID -> Jira assignee
+            expected_jira_ids: etrack_user_id -> Jira account; updated in place for added accounts
+        """
+        fi_ids_by_user = {}
+        for record in records:
+            etrack_user_id = record.etrack_user_id
+            if (expected_jira_ids.get(etrack_user_id) or etrack_user_id in self._processed_users
+                    or not is_valid_etrack_user_id(etrack_user_id)):
+                continue
+            fi_ids_by_user.setdefault(etrack_user_id, []).extend(record.fi_ids)
+
+        if not fi_ids_by_user:
+            return
+
+        # Existing accounts without a jira_account are left for update-jira-ids
+        existing = self.am.existing_etrack_user_ids(list(fi_ids_by_user))
+        self._processed_users.update(fi_ids_by_user)
+        new_ids = [etrack_user_id for etrack_user_id in fi_ids_by_user if etrack_user_id not in existing]
+        if not new_ids:
+            return
+
+        if self.auto_populate_strategy == AutoPopulateStrategy.INTERACTIVE:
+            print(f"Preparing defaults for {len(new_ids)} new user(s) from Jira...")
+            defaults = self.populator.populate_batch({uid: fi_ids_by_user[uid] for uid in new_ids}, fi_assignees)
+            accounts = [self.populator.interactive_populate(uid, defaults[uid]) for uid in new_ids]
+        else:  # AUTO - minimal data, user will update later
+            print(f"\n+ Auto-adding {len(new_ids)} minimal account(s) (fields left empty for later update)")
+            accounts = [AccountData(etrack_user_id=uid, source="auto_minimal", confidence="low")
+                        for uid in new_ids]
+
+        try:
+            self.am.apply_account_batch(new_accounts=[{
+                'etrack_user_id': account_data.etrack_user_id,
+                'veritas_email': account_data.veritas_email,
+                'cohesity_email': account_data.cohesity_email,
+                'community_account': account_data.community_account,
+                'jira_account': account_data.jira_account,
+                'manual_verified': 'no',
+            } for account_data in accounts])
+        except Exception as e:
+            print(f"X Failed to add {len(accounts)} account(s): {e}")
+            return
+
+        for account_data in accounts:
+            self.new_users_added.append(account_data)
+            expected_jira_ids[account_data.etrack_user_id] = account_data.jira_account
+            print(f"+ Added account for '{account_data.etrack_user_id}' "
+                  f"(update later with: cli.py update {account_data.etrack_user_id})")
+        print()
+
     def get_jira_assignee(self, fi_id: str) -> Optional[str]:
         """
         Get current assignee from Jira for a FI
@@ -362,31 +425,44 @@ class FIValidator:
             fi_assignees = self.jira_client.get_multiple_assignees(all_fi_ids)
             print(f"+ Fetched {len(fi_assignees)} FI assignees")
 
+        # Resolve every etrack assignee's Jira account from one in-memory index scan
+        expected_jira_ids = self.am.translate_many(
+            list({record.etrack_user_id for record in records}), 'jira_account')
+
+        # Add all unknown users up front in one transaction, so the loop below never writes
+        if self.auto_populate_strategy in (AutoPopulateStrategy.AUTO, AutoPopulateStrategy.INTERACTIVE):
+            self._add_missing_accounts(records, fi_assignees, expected_jira_ids)
+
         # Now validate records using pre-fetched data
         results = []
         for i, record in enumerate(records, 1):
             if i % 50 == 0 or i == total_records:
                 print(f"\rValidating: {i}/{total_records} records...", end='', flush=True)
-            result = self._validate_fi_record_with_cache(record, fi_assignees)
+            result = self._validate_fi_record_with_cache(record, fi_assignees, expected_jira_ids)
             results.append(result)
         print()  # New line after progress
         return results
 
-    def _validate_fi_record_with_cache(self, record: FIRecord, fi_assignees: Dict[str, Optional[str]]) -> ValidationResult:
+    def _validate_fi_record_with_cache(self, record: FIRecord, fi_assignees: Dict[str, Optional[str]],
+                                       expected_jira_ids: Dict[str, Optional[str]] = None) -> ValidationResult:
         """
         Validate a single FI record using pre-fetched assignee cache.
 
         Args:
             record: FIRecord to validate
             fi_assignees: Pre-fetched dict mapping FI ID to assignee name
+            expected_jira_ids: Pre-translated dict mapping etrack_user_id to Jira account
 
         Returns:
             ValidationResult with assignee comparisons
         """
         validations = []
 
-        # Get expected Jira ID for the etrack assignee from database
-        expected_jira_id = self.am.translate(record.etrack_user_id, 'jira_account')
+        # Get expected Jira ID for the etrack assignee (misses are re-checked: an
+        # earlier record may have auto-added the account)
+        expected_jira_id = (expected_jira_ids or {}).get(record.etrack_user_id)
+        if not expected_jira_id:
+            expected_jira_id = self.am.translate(record.etrack_user_id, 'jira_account')
 
         # If not in database and auto-population enabled, try to add
         if not expected_jira_id and self.auto_populate_strategy != AutoPopulateStrategy.SKIP:
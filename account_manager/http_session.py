@@ -0,0 +1,404 @@
+"""
+HTTP Session - Pooled, keep-alive requests sessions for Jira API access
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connection pool defaults (override with JIRA_POOL_SIZE / JIRA_MAX_RETRIES)
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Batch concurrency defaults (override with JIRA_BATCH_WORKERS / JIRA_RATE_LIMIT)
+DEFAULT_BATCH_WORKERS = 4
+DEFAULT_RATE_LIMIT = 10.0  # requests per second per host, 0 disables
+
+# ResilientTransport defaults (override idle timeout with JIRA_IDLE_TIMEOUT)
+DEFAULT_IDLE_TIMEOUT = 30.0      # seconds; idle pooled connections are dropped after this
+FRESH_FALLBACK_AFTER = 3         # consecutive stale-connection failures before using fresh sockets
+FRESH_FALLBACK_SECONDS = 60.0    # how long fresh sockets are used before keep-alive is tried again
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+# Error text of a keep-alive socket the server (or load balancer) already closed
+STALE_CONNECTION_MARKERS = (
+    'UNEXPECTED_EOF_WHILE_READING',
+    'EOF occurred in violation of protocol',
+    'SSLEOFError',
+    'ConnectionResetError',
+    'Connection reset by peer',
+    'RemoteDisconnected',
+    'BrokenPipeError',
+    'bad record mac',
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a non-negative float from the environment, falling back to default."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return default
+
+
+def get_batch_workers(workers: int = None) -> int:
+    """Resolve the batch worker count (argument, $JIRA_BATCH_WORKERS, or default)."""
+    if workers is not None:
+        return max(1, int(workers))
+    return _env_int('JIRA_BATCH_WORKERS', DEFAULT_BATCH_WORKERS)
+
+
+class HostRateLimiter:
+    """
+    Thread-safe per-host request spacing.
+
+    Each host gets at most `rate` request starts per second; callers block
+    in acquire() until their slot comes up.
+    """
+
+    def __init__(self, rate: float):
+        """
+        Initialize the limiter
+
+        Args:
+            rate: Max requests per second per host (0 or less disables limiting)
+        """
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str):
+        """Block until the next request slot for host is available."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class PooledSession(requests.Session):
+    """requests.Session that applies an optional per-host rate limit"""
+
+    def __init__(self, rate_limiter: Optional[HostRateLimiter] = None):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+
+    def request(self, method, url, *args, **kwargs):
+        if self.rate_limiter:
+            self.rate_limiter.acquire(urlparse(url).netloc)
+        return super().request(method, url, *args, **kwargs)
+
+
+def create_session(pool_size: int = None, max_retries: int = None,
+                   backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+                   rate_limit: float = None) -> requests.Session:
+    """
+    Create a requests.Session with a sized connection pool and retry adapter.
+
+    Connections are kept alive and reused across calls, so only the first
+    request to a host pays the TCP and TLS handshake.
+
+    Args:
+        pool_size: Max connections kept per host (default: $JIRA_POOL_SIZE or 10)
+        max_retries: Retries for connection errors and 429/5xx (default: $JIRA_MAX_RETRIES or 3)
+        backoff_factor: Exponential backoff factor between retries
+        rate_limit: Max requests per second per host, 0 disables
+                    (default: $JIRA_RATE_LIMIT or 10)
+
+    Returns:
+        Configured requests.Session
+    """
+    if pool_size is None:
+        pool_size = _env_int('JIRA_POOL_SIZE', DEFAULT_POOL_SIZE)
+    if max_retries is None:
+        max_retries = _env_int('JIRA_MAX_RETRIES', DEFAULT_MAX_RETRIES)
+    if rate_limit is None:
+        rate_limit = _env_float('JIRA_RATE_LIMIT', DEFAULT_RATE_LIMIT)
+
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+
+    session = PooledSession(HostRateLimiter(rate_limit) if rate_limit else None)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def is_stale_connection_error(exc: Exception) -> bool:
+    """True if an error looks like a dropped keep-alive socket (TLS EOF, reset, ...)."""
+    details = str(exc)
+    return any(marker in details for marker in STALE_CONNECTION_MARKERS) or 'bad record mac' in details.lower()
+
+
+class ResilientTransport:
+    """
+    Long-lived keep-alive transport that survives dropped pooled connections.
+
+    Requests share one pooled session, so a run pays a handful of TLS
+    handshakes instead of one per request. Stale sockets are handled without
+    giving up keep-alive:
+    - a pool idle for longer than idle_timeout is dropped before the next
+      request (load balancers silently close idle TLS sessions);
+    - a stale-socket error on an idempotent request reconnects on a new pool
+      and repeats the request once, immediately;
+    - after FRESH_FALLBACK_AFTER consecutive stale errors, requests use fresh
+      sockets (Connection: close) for FRESH_FALLBACK_SECONDS, then keep-alive
+      is tried again.
+
+    A dropped session is only closed once the last request using it returns,
+    so concurrent callers never see their connection closed under them.
+    Other errors are raised unchanged, so callers keep their own retry/backoff.
+    """
+
+    def __init__(self, pool_size: int = None, idle_timeout: float = None):
+        """
+        Initialize the transport
+
+        Args:
+            pool_size: Max connections kept per host (default: $JIRA_POOL_SIZE or 10)
+            idle_timeout: Seconds a pool may sit idle before it is dropped, 0 = never
+                          (default: $JIRA_IDLE_TIMEOUT or 30)
+        """
+        self.pool_size = pool_size or _env_int('JIRA_POOL_SIZE', DEFAULT_POOL_SIZE)
+        if idle_timeout is None:
+            idle_timeout = _env_float('JIRA_IDLE_TIMEOUT', DEFAULT_IDLE_TIMEOUT)
+        self.idle_timeout = idle_timeout
+        self.stats = {'requests': 0, 'connections': 0, 'reconnects': 0, 'fresh': 0}
+
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._in_use: Dict[requests.Session, int] = {}  # open sessions -> requests in flight
+        self._last_used = 0.0
+        self._stale_failures = 0
+        self._fresh_until = 0.0
+
+    def _new_session(self) -> requests.Session:
+        """Create a pooled session without adapter-level retries."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _close_session(self, session: requests.Session):
+        """Close a session nobody is using, keeping its connection count (lock held)."""
+        del self._in_use[session]
+        self.stats['connections'] += get_connection_stats(session)['new_connections']
+        session.close()
+
+    def _retire_session(self):
+        """Stop handing out the pooled session; close it now if idle, else on last release (lock held)."""
+        session, self._session = self._session, None
+        if session is not None and not self._in_use[session]:
+            self._close_session(session)
+
+    def _acquire_session(self) -> requests.Session:
+        """Check out the shared session, dropping it first if it sat idle too long."""
+        with self._lock:
+            now = time.monotonic()
+            if self._session is not None and self.idle_timeout and now - self._last_used > self.idle_timeout:
+                self._retire_session()
+            if self._session is None:
+                self._session = self._new_session()
+                self._in_use[self._session] = 0
+            self._last_used = now
+            self.stats['requests'] += 1
+            self._in_use[self._session] += 1
+            return self._session
+
+    def _release_session(self, session: requests.Session):
+        """Check a session back in; a retired session is closed by its last user."""
+        with self._lock:
+            self._in_use[session] -= 1
+            if session is not self._session and not self._in_use[session]:
+                self._close_session(session)
+
+    def _use_fresh_socket(self) -> bool:
+        """True while the fresh-socket fallback is active."""
+        return time.monotonic() < self._fresh_until
+
+    def _fresh_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on a one-off connection (Connection: close)."""
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['fresh'] += 1
+        return send_request(None, method, url, **kwargs)
+
+    def _record_stale(self, session: requests.Session):
+        """Retire a session that produced a stale-socket error; enter fallback if it keeps happening."""
+        with self._lock:
+            if session is self._session:
+                self._retire_session()
+            self._stale_failures += 1
+            if self._stale_failures >= FRESH_FALLBACK_AFTER:
+                self._fresh_until = time.monotonic() + FRESH_FALLBACK_SECONDS
+                self._stale_failures = 0
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request (same arguments as requests.Session.request)
+
+        Returns:
+            requests.Response
+
+        Raises:
+            requests.exceptions.RequestException: As requests does, after the
+            stale-socket reconnect (if any) also failed
+        """
+        if self._use_fresh_socket():
+            return self._fresh_request(method, url, **kwargs)
+
+        try:
+            response = self._pooled_request(method, url, **kwargs)
+        except requests.exceptions.ConnectionError as exc:
+            if not is_stale_connection_error(exc) or method.upper() not in IDEMPOTENT_METHODS:
+                raise
+            # The pooled socket was dead: reconnect and repeat once, without backoff
+            with self._lock:
+                self.stats['reconnects'] += 1
+            if self._use_fresh_socket():
+                return self._fresh_request(method, url, **kwargs)
+            response = self._pooled_request(method, url, **kwargs)
+
+        with self._lock:
+            self._stale_failures = 0
+        return response
+
+    def _pooled_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on the shared session, retiring it on a stale-socket error."""
+        session = self._acquire_session()
+        try:
+            return session.request(method, url, **kwargs)
+        except requests.exceptions.ConnectionError as exc:
+            if is_stale_connection_error(exc):
+                self._record_stale(session)
+            raise
+        finally:
+            self._release_session(session)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request."""
+        return self.request('GET', url, **kwargs)
+
+    def connection_count(self) -> int:
+        """Connections (TCP + TLS handshakes) opened so far."""
+        with self._lock:
+            current = sum(get_connection_stats(session)['new_connections'] for session in self._in_use)
+            return self.stats['connections'] + current + self.stats['fresh']
+
+    def format_stats(self) -> str:
+        """Format request/connection counters for display."""
+        return (f"{self.stats['requests']} requests over {self.connection_count()} connection(s) "
+                f"({self.stats['reconnects']} stale reconnect(s), {self.stats['fresh']} on fresh sockets)")
+
+    def close(self):
+        """Close pooled connections (sessions still in use close when their requests finish)"""
+        with self._lock:
+            self._retire_session()
+
+
+def send_request(transport: Optional[ResilientTransport], method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send one request over a shared transport, or on a fresh socket without one
+
+    Args:
+        transport: ResilientTransport, or None to open a one-off 'Connection: close'
+                   connection (the behaviour before the transport existed)
+        method: HTTP method
+        url: Request URL
+        **kwargs: Passed to requests.Session.request (headers, params, json, timeout, ...)
+
+    Returns:
+        requests.Response
+    """
+    if transport is not None:
+        return transport.request(method, url, **kwargs)
+    headers = dict(kwargs.pop('headers', None) or {})
+    headers['Connection'] = 'close'
+    with requests.Session() as session:
+        return session.request(method, url, headers=headers, **kwargs)
+
+
+def get_connection_stats(session: requests.Session) -> Dict[str, int]:
+    """
+    Report how many requests reused a pooled connection vs opened a new one.
+
+    Args:
+        session: Session created by create_session()
+
+    Returns:
+        Dictionary: {'requests': n, 'new_connections': n, 'reused': n}
+    """
+    total_requests = 0
+    new_connections = 0
+
+    seen_adapters = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen_adapters or not hasattr(adapter, 'poolmanager'):
+            continue
+        seen_adapters.add(id(adapter))
+
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            total_requests += getattr(pool, 'num_requests', 0)
+            new_connections += getattr(pool, 'num_connections', 0)
+
+    return {
+        'requests': total_requests,
+        'new_connections': new_connections,
+        'reused': max(0, total_requests - new_connections),
+    }
+
+
+def format_connection_stats(stats: Dict[str, int]) -> str:
+    """
+    Format connection stats for display
+
+    Args:
+        stats: Dictionary from get_connection_stats()
+
+    Returns:
+        One-line summary string
+    """
+    return (f"{stats['requests']} requests over {stats['new_connections']} connection(s) "
+            f"({stats['reused']} reused)")
@@ -4,11 +4,19 @@ Import/Export utilities for account data
 
 import csv
 import os
-from typing import Dict, TYPE_CHECKING
+import sqlite3
+from itertools import islice
+from typing import Dict, Iterator, List, TYPE_CHECKING
+
+from .models import (ACCOUNT_FIELDS, DatabaseLockedError, is_valid_etrack_user_id,
+                     normalize_verification_status)
 
 if TYPE_CHECKING:
     from .models import AccountManager
 
+# Rows per transaction for bulk CSV imports
+BULK_IMPORT_CHUNK_SIZE = 5000
+
 
 class IOUtils:
     """Handles import and export operations"""
@@ -48,7 +56,8 @@ class IOUtils:
                           new_value=f"{len(accounts)} accounts", status='success')
         print(f"Exported {len(accounts)} accounts to {filename}")
 
-    def import_from_csv(self, filename: str, conflict_mode: str = 'skip', allow_empty: bool = False) -> Dict[str, int]:
+    def import_from_csv(self, filename: str, conflict_mode: str = 'skip', allow_empty: bool = False,
+                        bulk: bool = False, chunk_size: int = BULK_IMPORT_CHUNK_SIZE) -> Dict[str, int]:
         """
         Import accounts from CSV file
 
@@ -60,6 +69,9 @@ class IOUtils:
                           'fail' - Raise error on conflict
             allow_empty: If True, empty CSV values will overwrite existing data
                          If False (default), only non-empty values update existing data
+            bulk: Stream the CSV in chunks, look up existing accounts with one query
+                  per chunk and write each chunk in one transaction
+            chunk_size: Rows per chunk in bulk mode
 
         Returns:
             Dictionary with statistics: {'added': n, 'updated': n, 'skipped': n, 'errors': n}
@@ -80,67 +92,70 @@ class IOUtils:
             if 'etrack_user_id' not in reader.fieldnames:
                 raise ValueError("CSV must contain 'etrack_user_id' column")
 
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
-                etrack_user_id = row.get('etrack_user_id', '').strip()
-
-                if not etrack_user_id:
-                    errors.append(f"Row {row_num}: Missing etrack_user_id")
-                    stats['errors'] += 1
-                    continue
-
-                # Check if account exists
-                existing = self.am.get_account(etrack_user_id=etrack_user_id)
-
-                try:
-                    if existing:
-                        if conflict_mode == 'fail':
-                            raise ValueError(f"Account with etrack_user_id '{etrack_user_id}' already exists")
-                        elif conflict_mode == 'skip':
-                            stats['skipped'] += 1
-                            continue
-                        elif conflict_mode == 'update':
-                            # Update existing record
-                            update_data = {}
-                            fields = ['first_name', 'last_name', 'veritas_email', 'cohesity_email',
-                                      'community_account', 'jira_account', 'manual_verified', 'notes']
-
-                            for field in fields:
-                                if field in row:
-                                    value = row[field].strip() if row[field] else ''
-                                    if value:  # Non-empty value - always update
-                                        update_data[field] = value
-                                    elif allow_empty:  # Empty value with --allow-empty
-                                        update_data[field] = None
-
-                            if update_data:
-                                self.am.update_account(etrack_user_id, **update_data)
-                                self.am.log_action('import_accounts', 'account', etrack_user_id,
-                                                  new_value=str(update_data), status='success')
-                                stats['updated'] += 1
-                            else:
+            if bulk:
+                self._import_rows_bulk(reader, conflict_mode, allow_empty, chunk_size, stats, errors)
+            else:
+                for row_num, row in enumerate(reader, start=2):  # Start at 2 (after header)
+                    etrack_user_id = row.get('etrack_user_id', '').strip()
+
+                    if not etrack_user_id:
+                        errors.append(f"Row {row_num}: Missing etrack_user_id")
+                        stats['errors'] += 1
+                        continue
+
+                    # Check if account exists
+                    existing = self.am.get_account(etrack_user_id=etrack_user_id)
+
+                    try:
+                        if existing:
+                            if conflict_mode == 'fail':
+                                raise ValueError(f"Account with etrack_user_id '{etrack_user_id}' already exists")
+                            elif conflict_mode == 'skip':
                                 stats['skipped'] += 1
-                    else:
-                        # Add new record
-                        self.am.add_account(
-                            etrack_user_id=etrack_user_id,
-                            first_name=row.get('first_name', '').strip() or None,
-                            last_name=row.get('last_name', '').strip() or None,
-                            veritas_email=row.get('veritas_email', '').strip() or None,
-                            cohesity_email=row.get('cohesity_email', '').strip() or None,
-                            community_account=row.get('community_account', '').strip() or None,
-                            jira_account=row.get('jira_account', '').strip() or None,
-                            manual_verified=row.get('manual_verified', 'no').strip() or 'no',
-                            notes=row.get('notes', '').strip() or None
-                        )
+                                continue
+                            elif conflict_mode == 'update':
+                                # Update existing record
+                                update_data = {}
+                                fields = ['first_name', 'last_name', 'veritas_email', 'cohesity_email',
+                                          'community_account', 'jira_account', 'manual_verified', 'notes']
+
+                                for field in fields:
+                                    if field in row:
+                                        value = row[field].strip() if row[field] else ''
+                                        if value:  # Non-empty value - always update
+                                            update_data[field] = value
+                                        elif allow_empty:  # Empty value with --allow-empty
+                                            update_data[field] = None
+
+                                if update_data:
+                                    self.am.update_account(etrack_user_id, **update_data)
+                                    self.am.log_action('import_accounts', 'account', etrack_user_id,
+                                                      new_value=str(update_data), status='success')
+                                    stats['updated'] += 1
+                                else:
+                                    stats['skipped'] += 1
+                        else:
+                            # Add new record
+                            self.am.add_account(
+                                etrack_user_id=etrack_user_id,
+                                first_name=row.get('first_name', '').strip() or None,
+                                last_name=row.get('last_name', '').strip() or None,
+                                veritas_email=row.get('veritas_email', '').strip() or None,
+                                cohesity_email=row.get('cohesity_email', '').strip() or None,
+                                community_account=row.get('community_account', '').strip() or None,
+                                jira_account=row.get('jira_account', '').strip() or None,
+                                manual_verified=row.get('manual_verified', 'no').strip() or 'no',
+                                notes=row.get('notes', '').strip() or None
+                            )
+                            self.am.log_action('import_accounts', 'account', etrack_user_id,
+                                              new_value='added', status='success')
+                            stats['added'] += 1
+
+                    except Exception as e:
+                        errors.append(f"Row {row_num} (etrack_user_id: {etrack_user_id}): {str(e)}")
                         self.am.log_action('import_accounts', 'account', etrack_user_id,
-                                          new_value='added', status='success')
-                        stats['added'] += 1
-
-                except Exception as e:
-                    errors.append(f"Row {row_num} (etrack_user_id: {etrack_user_id}): {str(e)}")
-                    self.am.log_action('import_accounts', 'account', etrack_user_id,
-                                      status='failed', details=str(e))
-                    stats['errors'] += 1
+                                          status='failed', details=str(e))
+                        stats['errors'] += 1
 
         # Print summary
         print(f"\nImport completed from {filename}")
@@ -158,33 +173,135 @@ class IOUtils:
 
         return stats
 
+    def _import_rows_bulk(self, reader: Iterator[Dict[str, str]], conflict_mode: str, allow_empty: bool,
+                          chunk_size: int, stats: Dict[str, int], errors: List[str]):
+        """
+        Bulk path of import_from_csv: plan each chunk in memory, write it in one transaction
+
+        Conflict modes and allow_empty behave exactly as in the per-row path;
+        an etrack_user_id repeated in the file counts as existing after its
+        first row.
+
+        Args:
+            reader: csv.DictReader positioned after the header
+            conflict_mode: 'skip', 'update' or 'fail'
+            allow_empty: Empty CSV values clear existing data (update mode)
+            chunk_size: Rows per transaction
+            stats: Statistics dictionary updated in place
+            errors: Error messages list extended in place
+        """
+        rows = enumerate(reader, start=2)  # Start at 2 (after header)
+        while True:
+            chunk = list(islice(rows, max(1, chunk_size)))
+            if not chunk:
+                break
+
+            ids = [(row.get('etrack_user_id') or '').strip() for _, row in chunk]
+            known = self.am.existing_etrack_user_ids([i for i in ids if i])
+            new_accounts, updates, actions = [], [], []
+            delta = dict.fromkeys(stats, 0)
+            chunk_errors = []
+
+            for (row_num, row), etrack_user_id in zip(chunk, ids):
+                if not etrack_user_id:
+                    chunk_errors.append(f"Row {row_num}: Missing etrack_user_id")
+                    delta['errors'] += 1
+                    continue
+
+                try:
+                    if etrack_user_id in known:
+                        if conflict_mode == 'fail':
+                            raise ValueError(f"Account with etrack_user_id '{etrack_user_id}' already exists")
+                        if conflict_mode == 'skip':
+                            delta['skipped'] += 1
+                            continue
+
+                        update_data = {}
+                        for field in ACCOUNT_FIELDS:
+                            if field in row:
+                                value = row[field].strip() if row[field] else ''
+                                if value:  # Non-empty value - always update
+                                    update_data[field] = value
+                                elif allow_empty:  # Empty value with --allow-empty
+                                    update_data[field] = None
+                        if not update_data:
+                            delta['skipped'] += 1
+                            continue
+
+                        logged = str(update_data)
+                        if 'manual_verified' in update_data:
+                            update_data['manual_verified'] = normalize_verification_status(
+                                update_data['manual_verified'])
+                        updates.append(dict(update_data, etrack_user_id=etrack_user_id))
+                        actions.append(('import_accounts', 'account', etrack_user_id,
+                                        None, logged, 'success', None))
+                        delta['updated'] += 1
+                    else:
+                        if not is_valid_etrack_user_id(etrack_user_id):
+                            raise ValueError(f"Invalid etrack_user_id: '{etrack_user_id}' "
+                                             "(cannot be empty, '-', 'N/A', etc.)")
+                        account = {field: (row.get(field) or '').strip() or None for field in ACCOUNT_FIELDS}
+                        account['etrack_user_id'] = etrack_user_id
+                        account['manual_verified'] = normalize_verification_status(
+                            account['manual_verified'] or 'no')
+                        new_accounts.append(account)
+                        known.add(etrack_user_id)
+                        actions.append(('import_accounts', 'account', etrack_user_id,
+                                        None, 'added', 'success', None))
+                        delta['added'] += 1
+
+                except ValueError as e:
+                    chunk_errors.append(f"Row {row_num} (etrack_user_id: {etrack_user_id}): {str(e)}")
+                    actions.append(('import_accounts', 'account', etrack_user_id,
+                                    None, None, 'failed', str(e)))
+                    delta['errors'] += 1
+
+            try:
+                self.am.apply_account_batch(new_accounts, updates, actions)
+            except Exception as e:
+                # Nothing from this chunk was written
+                errors.append(f"Rows {chunk[0][0]}-{chunk[-1][0]}: {str(e)}")
+                stats['errors'] += len(chunk)
+                continue
+
+            for key, count in delta.items():
+                stats[key] += count
+            errors.extend(chunk_errors)
+
     def export_action_log(self, filename: str = "action_log_export.csv", limit: int = None,
                           since: str = None):
         """
         Export action log to CSV file
 
+        Entries are streamed page by page, so memory use does not grow with
+        the size of the log.
+
         Args:
             filename: Output CSV filename
             limit: Maximum number of entries to export (None = all)
             since: Only export entries on or after this date (YYYY-MM-DD)
         """
-        # Get all action log entries (use high limit if not specified)
-        actions = self.am.get_action_log(limit=limit or 100000, since=since)
+        actions = self.am.iter_action_log(limit=limit, since=since)
+        first = next(actions, None)
 
-        if not actions:
+        if first is None:
             print("No action log entries to export")
             return
 
+        count = 0
         with open(filename, 'w', newline='') as csvfile:
             fieldnames = ['id', 'action_type', 'target_type', 'target_id',
                          'old_value', 'new_value', 'status', 'details', 'created_at']
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
 
             writer.writeheader()
+            writer.writerow(first)
+            count = 1
             for action in actions:
                 writer.writerow(action)
+                count += 1
 
-        print(f"Exported {len(actions)} action log entries to {filename}")
+        print(f"Exported {count} action log entries to {filename}")
 
     def import_action_log(self, filename: str) -> Dict[str, int]:
         """
@@ -211,21 +328,30 @@ class IOUtils:
                 if field not in reader.fieldnames:
                     raise ValueError(f"CSV must contain '{field}' column")
 
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    self.am.log_action(
-                        action_type=row.get('action_type', '').strip(),
-                        target_type=row.get('target_type', '').strip() or None,
-                        target_id=row.get('target_id', '').strip() or None,
-                        old_value=row.get('old_value', '').strip() or None,
-                        new_value=row.get('new_value', '').strip() or None,
-                        status=row.get('status', 'success').strip() or 'success',
-                        details=row.get('details', '').strip() or None
-                    )
-                    stats['added'] += 1
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-                    stats['errors'] += 1
+            # One transaction per batch instead of one commit per row; a row
+            # only counts as added once its batch is committed
+            written_before = self.am.action_log_written
+            rows = 0
+            try:
+                with self.am.buffered_action_log():
+                    for row_num, row in enumerate(reader, start=2):
+                        rows += 1
+                        try:
+                            self.am.log_action(
+                                action_type=row.get('action_type', '').strip(),
+                                target_type=row.get('target_type', '').strip() or None,
+                                target_id=row.get('target_id', '').strip() or None,
+                                old_value=row.get('old_value', '').strip() or None,
+                                new_value=row.get('new_value', '').strip() or None,
+                                status=row.get('status', 'success').strip() or 'success',
+                                details=row.get('details', '').strip() or None
+                            )
+                        except Exception as e:
+                            errors.append(f"Row {row_num}: {str(e)}")
+            except (sqlite3.Error, DatabaseLockedError) as e:
+                errors.append(f"Last batch not written: {str(e)}")
+            stats['added'] = self.am.action_log_written - written_before
+            stats['errors'] = rows - stats['added']
 
         print(f"\nImport completed from {filename}")
         print(f"  Added:  {stats['added']}")
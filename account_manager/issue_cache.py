@@ -0,0 +1,321 @@
+"""
+Issue Cache - Persistent SQLite cache of Jira issues with TTL and revalidation
+
+Entries are keyed by (issue_key, field set). Fresh entries are served from
+disk; stale entries are revalidated with one cheap ``key in (...)`` query per
+batch that returns only the 'updated' field, so just the issues that actually
+changed are fetched again and issues deleted from Jira are dropped. Missing
+entries are fetched normally.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Default cache location (override with JIRA_ISSUE_CACHE_DB)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'account_manager', 'jira_issue_cache.db')
+
+# Seconds an entry is trusted without revalidation (override default with JIRA_ISSUE_CACHE_TTL).
+# An entry's TTL is the smallest TTL among its fields.
+DEFAULT_TTL = 3600
+FIELD_TTLS = {
+    'assignee': 900,
+    'status': 900,
+    'resolution': 900,
+    'priority': 1800,
+    'updated': 900,
+    'summary': 86400,
+    'description': 86400,
+    'created': 7 * 86400,
+}
+
+# Fields that already include 'updated' in the response
+_WILDCARD_FIELDS = {'*all', '*navigable'}
+
+# search_fn(jql, fields, max_results) -> list of raw issues, or None on failure
+SearchFn = Callable[[str, List[str], int], Optional[List[Dict]]]
+
+
+def _field_set_key(fields: List[str]) -> str:
+    """Normalize a field list into a stable cache key."""
+    return ','.join(sorted(set(fields))) if fields else '*all'
+
+
+class IssueCache:
+    """Persistent on-disk cache of Jira issue JSON keyed by issue key and field set"""
+
+    def __init__(self, db_path: str = None, default_ttl: int = None,
+                 field_ttls: Dict[str, int] = None, refresh: bool = False):
+        """
+        Initialize the issue cache
+
+        Args:
+            db_path: SQLite file path (default: $JIRA_ISSUE_CACHE_DB or ~/.cache/account_manager/jira_issue_cache.db)
+            default_ttl: TTL in seconds for fields not in field_ttls (default: $JIRA_ISSUE_CACHE_TTL or 3600)
+            field_ttls: Per-field TTL overrides in seconds
+            refresh: If True, ignore cached entries (but still store fresh results)
+        """
+        self.db_path = db_path or os.getenv('JIRA_ISSUE_CACHE_DB') or DEFAULT_CACHE_PATH
+        if default_ttl is None:
+            try:
+                default_ttl = int(os.getenv('JIRA_ISSUE_CACHE_TTL', DEFAULT_TTL))
+            except ValueError:
+                default_ttl = DEFAULT_TTL
+        self.default_ttl = default_ttl
+        self.field_ttls = dict(FIELD_TTLS)
+        if field_ttls:
+            self.field_ttls.update(field_ttls)
+        self.refresh = refresh
+        self.stats = {'hits': 0, 'revalidated': 0, 'changed': 0, 'fetched': 0, 'stale': 0}
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS issue_cache (
+                issue_key TEXT NOT NULL,
+                field_set TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated TEXT,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (issue_key, field_set)
+            )
+        """)
+        self.conn.commit()
+
+    def ttl_for(self, fields: List[str]) -> int:
+        """Get the TTL (seconds) for a field set: the smallest TTL among its fields."""
+        if not fields or set(fields) & _WILDCARD_FIELDS:
+            return min([self.default_ttl] + list(self.field_ttls.values()))
+        return min(self.field_ttls.get(f, self.default_ttl) for f in fields)
+
+    def lookup(self, issue_keys: List[str], fields: List[str]) -> Tuple[Dict[str, Dict], Dict[str, float], List[str]]:
+        """
+        Classify issue keys by cache state
+
+        Args:
+            issue_keys: Issue keys to look up
+            fields: Field set the caller needs
+
+        Returns:
+            Tuple of (fresh: key -> issue, stale: key -> fetched_at, missing: [keys])
+        """
+        field_set = _field_set_key(fields)
+        ttl = self.ttl_for(fields)
+        now = time.time()
+        fresh, stale, missing = {}, {}, []
+
+        if self.refresh:
+            return fresh, stale, list(issue_keys)
+
+        rows = {}
+        with self._lock:
+            for i in range(0, len(issue_keys), 500):
+                chunk = issue_keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = self.conn.execute(
+                    f"SELECT issue_key, data, fetched_at FROM issue_cache "
+                    f"WHERE field_set = ? AND issue_key IN ({placeholders})",
+                    [field_set] + list(chunk)
+                )
+                for key, data, fetched_at in cursor.fetchall():
+                    rows[key] = (data, fetched_at)
+
+        for key in issue_keys:
+            if key not in rows:
+                missing.append(key)
+                continue
+            data, fetched_at = rows[key]
+            if now - fetched_at <= ttl:
+                fresh[key] = json.loads(data)
+            else:
+                stale[key] = fetched_at
+
+        return fresh, stale, missing
+
+    def store(self, issues: List[Dict], fields: List[str]):
+        """
+        Store raw Jira issues for a field set
+
+        Args:
+            issues: Raw issue dicts from the Jira search API
+            fields: Field set the issues were fetched with
+        """
+        field_set = _field_set_key(fields)
+        now = time.time()
+        rows = [
+            (issue.get('key'), field_set, json.dumps(issue),
+             (issue.get('fields') or {}).get('updated'), now)
+            for issue in issues if issue.get('key')
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO issue_cache (issue_key, field_set, data, updated, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            self.conn.commit()
+
+    def touch(self, issue_keys: List[str], fields: List[str]):
+        """Mark cached entries as revalidated now (unchanged on the server)."""
+        if not issue_keys:
+            return
+        field_set = _field_set_key(fields)
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "UPDATE issue_cache SET fetched_at = ? WHERE issue_key = ? AND field_set = ?",
+                [(now, key, field_set) for key in issue_keys]
+            )
+            self.conn.commit()
+
+    def get_cached(self, issue_keys: List[str], fields: List[str]) -> Dict[str, Dict]:
+        """Get cached issues regardless of age."""
+        field_set = _field_set_key(fields)
+        result = {}
+        with self._lock:
+            for i in range(0, len(issue_keys), 500):
+                chunk = issue_keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = self.conn.execute(
+                    f"SELECT issue_key, data FROM issue_cache "
+                    f"WHERE field_set = ? AND issue_key IN ({placeholders})",
+                    [field_set] + list(chunk)
+                )
+                for key, data in cursor.fetchall():
+                    result[key] = json.loads(data)
+        return result
+
+    def invalidate(self, issue_keys: List[str]):
+        """Drop all cached field sets for the given issues (e.g., after an update)."""
+        if not issue_keys:
+            return
+        with self._lock:
+            self.conn.executemany("DELETE FROM issue_cache WHERE issue_key = ?",
+                                  [(key,) for key in issue_keys])
+            self.conn.commit()
+
+    def clear(self) -> int:
+        """Remove all cached entries. Returns number of rows deleted."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM issue_cache")
+            self.conn.commit()
+            return cursor.rowcount
+
+    def fetch(self, issue_keys: List[str], fields: List[str], search_fn: SearchFn,
+              batch_size: int = 50, max_workers: int = 1) -> Tuple[Dict[str, Dict], List[str]]:
+        """
+        Get issues through the cache, revalidating stale and fetching missing entries
+
+        Stale entries are revalidated with a ``key in (...)`` query for the
+        'updated' field only: unchanged issues are served from disk, changed
+        ones are fetched again, and issues Jira no longer returns are dropped
+        from the cache. If revalidation fails the stale copies are served
+        (counted in stats['stale']).
+
+        Args:
+            issue_keys: Issue keys to fetch
+            fields: Jira fields needed (None/empty = all fields)
+            search_fn: Callable(jql, fields, max_results) returning raw issues or None on failure
+            batch_size: Keys per JQL request
+            max_workers: Concurrent JQL requests
+
+        Returns:
+            Tuple of (key -> raw issue, keys whose requests failed)
+            Keys absent from both were not found in Jira.
+        """
+        fields = list(fields) if fields else ['*all']
+        request_fields = list(fields)
+        if 'updated' not in request_fields and not set(request_fields) & _WILDCARD_FIELDS:
+            request_fields.append('updated')
+
+        unique_keys = list(dict.fromkeys(issue_keys))
+        fresh, stale, missing = self.lookup(unique_keys, fields)
+        self.stats['hits'] += len(fresh)
+        results = dict(fresh)
+        failed = []
+
+        def batches(kind, keys):
+            return [(kind, keys[i:i + batch_size]) for i in range(0, len(keys), batch_size)]
+
+        # First pass: revalidate stale entries and fetch missing ones;
+        # second pass: fetch the entries revalidation found changed
+        jobs = batches('revalidate', list(stale.keys())) + batches('fetch', missing)
+        while jobs:
+            outputs = self._run_jobs(jobs, request_fields, search_fn, max_workers)
+            changed = []
+            for (kind, batch), issues in zip(jobs, outputs):
+                if issues is None:
+                    if kind == 'revalidate':
+                        # Serve the stale copy rather than nothing; retry next run
+                        cached = self.get_cached(batch, fields)
+                        results.update(cached)
+                        self.stats['stale'] += len(cached)
+                        failed.extend(key for key in batch if key not in cached)
+                    else:
+                        failed.extend(batch)
+                elif kind == 'revalidate':
+                    current = {issue.get('key'): (issue.get('fields') or {}).get('updated') for issue in issues}
+                    cached = self.get_cached(batch, fields)
+                    unchanged = [key for key in batch if key in current and key in cached
+                                 and current[key] == (cached[key].get('fields') or {}).get('updated')]
+                    self.touch(unchanged, fields)
+                    results.update((key, cached[key]) for key in unchanged)
+                    self.invalidate([key for key in batch if key not in current])
+                    changed.extend(key for key in batch if key in current and key not in unchanged)
+                    self.stats['revalidated'] += len(batch)
+                else:
+                    self.store(issues, fields)
+                    for issue in issues:
+                        results[issue.get('key')] = issue
+                    self.stats['fetched'] += len(issues)
+            self.stats['changed'] += len(changed)
+            jobs = batches('fetch', changed)
+
+        return results, failed
+
+    @staticmethod
+    def _run_jobs(jobs: List[Tuple[str, List[str]]], request_fields: List[str], search_fn: SearchFn,
+                  max_workers: int) -> List[Optional[List[Dict]]]:
+        """Run one search per (kind, keys) job, concurrently when max_workers > 1."""
+        def run(job):
+            kind, batch = job
+            if kind == 'revalidate':
+                return search_fn(f"key in ({', '.join(batch)})", ['updated'], len(batch))
+            return search_fn(f"key in ({', '.join(batch)})", request_fields, len(batch))
+
+        workers = min(max(1, max_workers), len(jobs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(run, jobs))
+        return [run(job) for job in jobs]
+
+    def format_stats(self) -> str:
+        """Format hit/revalidation counters for display."""
+        text = (f"{self.stats['hits']} fresh hit(s), {self.stats['revalidated']} revalidated "
+                f"({self.stats['changed']} changed), {self.stats['fetched']} fetched")
+        if self.stats['stale']:
+            text += f", {self.stats['stale']} stale (revalidation failed)"
+        return text
+
+    def close(self):
+        """Close the cache database"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
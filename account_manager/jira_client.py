@@ -7,8 +7,13 @@ Based on existing Jira integration patterns
 import os
 import requests
 import json
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from dotenv import load_dotenv
+from .http_session import create_session, get_connection_stats, get_batch_workers
+from .issue_cache import IssueCache
+from .jira_user_cache import JiraUserCache
+from .jira_field_cache import JiraFieldIndex
 
 
 class JiraClient:
@@ -17,13 +22,26 @@ class JiraClient:
     Uses environment variables for authentication
     """
 
-    def __init__(self, jira_url: str = None, api_token: str = None):
+    # Fields fetched by get_fi_details_batch()
+    DETAIL_FIELDS = ['summary', 'status', 'priority', 'assignee', 'created', 'updated', 'description']
+
+    def __init__(self, jira_url: str = None, api_token: str = None,
+                 pool_size: int = None, max_retries: int = None,
+                 max_workers: int = None, rate_limit: float = None,
+                 issue_cache: Optional[IssueCache] = None,
+                 user_cache: Optional[JiraUserCache] = None):
         """
         Initialize Jira client
 
         Args:
             jira_url: Jira server URL (defaults to env JIRA_SERVER_NAME)
             api_token: API token (defaults to env JIRA_ACC_TOKEN)
+            pool_size: Keep-alive connection pool size (defaults to env JIRA_POOL_SIZE or 10)
+            max_retries: Retries on connection errors/429/5xx (defaults to env JIRA_MAX_RETRIES or 3)
+            max_workers: Concurrent batch requests, 1 = serial (defaults to env JIRA_BATCH_WORKERS or 4)
+            rate_limit: Max requests per second to the Jira host (defaults to env JIRA_RATE_LIMIT or 10)
+            issue_cache: Optional persistent IssueCache consulted by the batch methods
+            user_cache: Optional persistent JiraUserCache consulted by search_users()
         """
         # Load environment variables
         load_dotenv()
@@ -44,46 +62,143 @@ class JiraClient:
         }
 
         self.timeout = 20  # Default timeout in seconds
-        self._field_id_cache = {}
+        # Lowercased field name -> field ID, refetched once on a miss
+        self._field_index = JiraFieldIndex(self.jira_url, self._fetch_fields,
+                                           normalize=lambda name: name.strip().lower())
 
-    def get_field_id_by_name(self, field_name: str) -> Optional[str]:
+        # Pooled keep-alive session shared by all API calls
+        self.max_workers = get_batch_workers(max_workers)
+        if pool_size is None:
+            pool_size = max(self.max_workers, 10)
+        self.session = create_session(pool_size=pool_size, max_retries=max_retries,
+                                      rate_limit=rate_limit)
+        self.session.headers.update(self.headers)
+        self.issue_cache = issue_cache
+        self.user_cache = user_cache
+
+    def _search_jql(self, jql: str, fields: List[str], max_results: int) -> Optional[List[Dict[str, Any]]]:
         """
-        Resolve a Jira field display name to its field ID.
+        Run one JQL search page.
 
         Args:
-            field_name: Jira field display name (e.g., 'Case Priority')
+            jql: JQL query
+            fields: Fields to return
+            max_results: Max issues to return
 
         Returns:
-            Field ID (e.g., 'customfield_12345') or None if not found
+            List of raw issues, or None if the request failed
         """
-        if not field_name:
+        try:
+            url = f"{self.jira_url}/rest/api/2/search"
+            params = {
+                'jql': jql,
+                'maxResults': max_results,
+                'fields': ','.join(fields)
+            }
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
+
+            if response.status_code == 200:
+                return response.json().get('issues', [])
+
+            print(f"Search failed (status {response.status_code})")
             return None
 
-        cache_key = field_name.strip().lower()
-        if cache_key in self._field_id_cache:
-            return self._field_id_cache[cache_key]
+        except requests.exceptions.RequestException as e:
+            print(f"Search request error: {e}")
+            return None
 
-        try:
-            url = f"{self.jira_url}/rest/api/2/field"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+    def _fetch_cached(self, issue_keys: List[str], fields: List[str],
+                      batch_size: int) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        Get raw issues through the issue cache.
 
-            if response.status_code != 200:
-                print(f"Error fetching Jira fields: Status {response.status_code}, {response.text}")
-                return None
+        Args:
+            issue_keys: Issue keys to fetch
+            fields: Fields needed
+            batch_size: Keys per JQL request
 
-            fields = response.json()
-            for field in fields:
-                name = (field.get('name') or '').strip().lower()
-                if name == cache_key:
-                    field_id = field.get('id')
-                    self._field_id_cache[cache_key] = field_id
-                    return field_id
+        Returns:
+            Tuple of (key -> raw issue, keys that could not be resolved)
+        """
+        return self.issue_cache.fetch(issue_keys, fields, self._search_jql,
+                                      batch_size=batch_size, max_workers=self.max_workers)
+
+    def _run_batches(self, keys: List[str], batch_size: int,
+                     fetch_batch: Callable[[List[str]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run fetch_batch over batch_size slices of keys, concurrently when max_workers > 1.
 
+        Args:
+            keys: Issue keys to fetch
+            batch_size: Keys per batch request
+            fetch_batch: Function taking one batch and returning a result dict
+
+        Returns:
+            List of batch results, in the same order as the batches
+        """
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        workers = min(self.max_workers, len(batches))
+
+        if workers <= 1:
+            return [fetch_batch(batch) for batch in batches]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields results in submission order
+            return list(executor.map(fetch_batch, batches))
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Get connection reuse statistics for this client's session
+
+        Returns:
+            Dictionary: {'requests': n, 'new_connections': n, 'reused': n}
+        """
+        return get_connection_stats(self.session)
+
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+        if self.issue_cache:
+            self.issue_cache.close()
+        if self.user_cache:
+            self.user_cache.close()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    def get_field_id_by_name(self, field_name: str) -> Optional[str]:
+        """
+        Resolve a Jira field display name to its field ID.
+
+        Args:
+            field_name: Jira field display name (e.g., 'Case Priority')
+
+        Returns:
+            Field ID (e.g., 'customfield_12345') or None if not found
+        """
+        if not field_name:
             return None
 
+        try:
+            return self._field_index.get(field_name)
         except requests.exceptions.RequestException as e:
             print(f"Request error fetching Jira field '{field_name}': {e}")
-            return None
+        except RuntimeError as e:
+            print(f"Error fetching Jira fields: {e}")
+        return None
+
+    def _fetch_fields(self) -> List[Dict[str, Any]]:
+        """Download the Jira field list (used through the field cache)."""
+        url = f"{self.jira_url}/rest/api/2/field"
+        response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+        if response.status_code != 200:
+            raise RuntimeError(f"Status {response.status_code}, {response.text}")
+        return response.json()
 
     @staticmethod
     def extract_field_display_value(field_value: Any) -> Optional[str]:
@@ -127,7 +242,7 @@ class JiraClient:
         """
         try:
             url = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
 
             if response.status_code == 200:
                 return response.json()
@@ -220,7 +335,7 @@ class JiraClient:
             url = f"{self.jira_url}/rest/api/2/issue/{issue_key}/assignee"
             payload = {'name': assignee_name}
 
-            response = requests.put(
+            response = self.session.put(
                 url,
                 headers=self.headers,
                 data=json.dumps(payload),
@@ -229,6 +344,8 @@ class JiraClient:
 
             if response.status_code == 204:
                 print(f"+ Successfully updated assignee for {issue_key} to {assignee_name}")
+                if self.issue_cache:
+                    self.issue_cache.invalidate([issue_key])
                 return True
             else:
                 print(f"X Failed to update assignee for {issue_key}: Status {response.status_code}, {response.text}")
@@ -266,7 +383,7 @@ class JiraClient:
 
         for payload in payload_options:
             try:
-                response = requests.put(
+                response = self.session.put(
                     url,
                     headers=self.headers,
                     data=json.dumps(payload),
@@ -275,6 +392,8 @@ class JiraClient:
 
                 if response.status_code == 204:
                     print(f"+ Successfully updated {field_name} for {issue_key} to {field_value}")
+                    if self.issue_cache:
+                        self.issue_cache.invalidate([issue_key])
                     return True
 
                 last_error = f"Status {response.status_code}, {response.text}"
@@ -303,11 +422,16 @@ class JiraClient:
 
         # Initialize all keys with None (handles not found cases)
         assignees = {key: None for key in issue_keys}
+        remaining = issue_keys
 
-        # Process in batches
-        for i in range(0, len(issue_keys), batch_size):
-            batch = issue_keys[i:i + batch_size]
-            batch_result = self._fetch_assignees_batch(batch)
+        if self.issue_cache:
+            issues, remaining = self._fetch_cached(issue_keys, ['assignee'], batch_size)
+            for key, issue in issues.items():
+                assignee = issue.get('fields', {}).get('assignee')
+                assignees[key] = assignee.get('name') if assignee else None
+
+        # Process in batches (concurrently when max_workers > 1)
+        for batch_result in self._run_batches(remaining, batch_size, self._fetch_assignees_batch):
             assignees.update(batch_result)
 
         return assignees
@@ -337,7 +461,7 @@ class JiraClient:
                 'fields': 'assignee'  # Only fetch assignee field for efficiency
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
 
             if response.status_code == 200:
                 data = response.json()
@@ -378,7 +502,7 @@ class JiraClient:
                 'fields': 'summary,status,priority,created,updated'
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
 
             if response.status_code == 200:
                 data = response.json()
@@ -400,7 +524,7 @@ class JiraClient:
         """
         try:
             url = f"{self.jira_url}/rest/api/2/myself"
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
 
             if response.status_code == 200:
                 user_data = response.json()
@@ -432,15 +556,51 @@ class JiraClient:
             return {}
 
         results = {}
-
-        # Process in batches
-        for i in range(0, len(fi_ids), batch_size):
-            batch = fi_ids[i:i + batch_size]
-            batch_result = self._fetch_details_batch(batch)
+        remaining = fi_ids
+
+        if self.issue_cache:
+            issues, remaining = self._fetch_cached(fi_ids, self.DETAIL_FIELDS, batch_size)
+            for fi_id in fi_ids:
+                if fi_id in issues:
+                    results[fi_id] = self._parse_issue_details(issues[fi_id])
+                elif fi_id not in remaining:
+                    results[fi_id] = {'error': 'Not found'}
+
+        # Process in batches (concurrently when max_workers > 1)
+        for batch_result in self._run_batches(remaining, batch_size, self._fetch_details_batch):
             results.update(batch_result)
 
         return results
 
+    @staticmethod
+    def _parse_issue_details(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a raw search result issue into the FI details dictionary.
+
+        Args:
+            issue: Raw issue from the Jira search API
+
+        Returns:
+            Dictionary of key issue fields
+        """
+        fields = issue.get('fields', {})
+        assignee = fields.get('assignee', {})
+        status = fields.get('status', {})
+        priority = fields.get('priority', {})
+
+        return {
+            'key': issue.get('key'),
+            'summary': fields.get('summary'),
+            'status': status.get('name') if status else None,
+            'assignee': assignee.get('name') if assignee else None,
+            'assignee_display_name': assignee.get('displayName') if assignee else None,
+            'assignee_email': assignee.get('emailAddress') if assignee else None,
+            'priority': priority.get('name') if priority else None,
+            'created': fields.get('created'),
+            'updated': fields.get('updated'),
+            'description': fields.get('description'),
+        }
+
     def _fetch_details_batch(self, fi_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Internal method to fetch details for a batch of FIs using JQL.
@@ -463,34 +623,17 @@ class JiraClient:
             params = {
                 'jql': jql,
                 'maxResults': len(fi_ids),
-                'fields': 'summary,status,priority,assignee,created,updated,description'
+                'fields': ','.join(self.DETAIL_FIELDS)
             }
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
 
             if response.status_code == 200:
                 data = response.json()
                 results = {}
 
                 for issue in data.get('issues', []):
-                    key = issue.get('key')
-                    fields = issue.get('fields', {})
-                    assignee = fields.get('assignee', {})
-                    status = fields.get('status', {})
-                    priority = fields.get('priority', {})
-
-                    results[key] = {
-                        'key': key,
-                        'summary': fields.get('summary'),
-                        'status': status.get('name') if status else None,
-                        'assignee': assignee.get('name') if assignee else None,
-                        'assignee_display_name': assignee.get('displayName') if assignee else None,
-                        'assignee_email': assignee.get('emailAddress') if assignee else None,
-                        'priority': priority.get('name') if priority else None,
-                        'created': fields.get('created'),
-                        'updated': fields.get('updated'),
-                        'description': fields.get('description'),
-                    }
+                    results[issue.get('key')] = self._parse_issue_details(issue)
 
                 # Mark missing FIs
                 for fi_id in fi_ids:
@@ -524,34 +667,58 @@ class JiraClient:
             return {}
 
         results = {key: None for key in issue_keys}
+        remaining = issue_keys
 
-        # Process in batches
-        for i in range(0, len(issue_keys), batch_size):
-            batch = issue_keys[i:i + batch_size]
-            try:
-                keys_str = ', '.join(batch)
-                jql = f'key in ({keys_str})'
-
-                url = f"{self.jira_url}/rest/api/2/search"
-                params = {
-                    'jql': jql,
-                    'maxResults': len(batch),
-                    'fields': field
-                }
-
-                response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    for issue in data.get('issues', []):
-                        key = issue.get('key')
-                        value = issue.get('fields', {}).get(field)
-                        results[key] = value
-                else:
-                    print(f"Batch field search failed (status {response.status_code})")
+        if self.issue_cache:
+            issues, remaining = self._fetch_cached(issue_keys, [field], batch_size)
+            for key, issue in issues.items():
+                results[key] = issue.get('fields', {}).get(field)
 
-            except requests.exceptions.RequestException as e:
-                print(f"Batch request error: {e}")
+        # Process in batches (concurrently when max_workers > 1)
+        def fetch_batch(batch):
+            return self._fetch_field_batch(batch, field)
+
+        for batch_result in self._run_batches(remaining, batch_size, fetch_batch):
+            results.update(batch_result)
+
+        return results
+
+    def _fetch_field_batch(self, issue_keys: List[str], field: str) -> Dict[str, Any]:
+        """
+        Internal method to fetch one field for a batch of issues using JQL.
+
+        Args:
+            issue_keys: List of issue keys (max ~50-100 for one request)
+            field: Field name or ID to fetch
+
+        Returns:
+            Dictionary mapping issue_key to field value (empty on failure)
+        """
+        results = {}
+        try:
+            keys_str = ', '.join(issue_keys)
+            jql = f'key in ({keys_str})'
+
+            url = f"{self.jira_url}/rest/api/2/search"
+            params = {
+                'jql': jql,
+                'maxResults': len(issue_keys),
+                'fields': field
+            }
+
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
+
+            if response.status_code == 200:
+                data = response.json()
+                for issue in data.get('issues', []):
+                    key = issue.get('key')
+                    value = issue.get('fields', {}).get(field)
+                    results[key] = value
+            else:
+                print(f"Batch field search failed (status {response.status_code})")
+
+        except requests.exceptions.RequestException as e:
+            print(f"Batch request error: {e}")
 
         return results
 
@@ -586,6 +753,25 @@ class JiraClient:
         Returns:
             List of user dictionaries with accountId (key), displayName (name), emailAddress
         """
+        if self.user_cache:
+            cached = self.user_cache.get(query, max_results)
+            if cached is not None:
+                return cached
+
+        users = self._search_users(query, max_results)
+        if users is None:
+            return []
+        if self.user_cache:
+            self.user_cache.store(query, max_results, users)
+        return users
+
+    def _search_users(self, query: str, max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run one user search request.
+
+        Returns:
+            List of normalized user dicts, or None if the request failed
+        """
         # Use the same API as j.getUserId.py: /rest/api/2/user/search?username=
         url = f"{self.jira_url}/rest/api/2/user/search"
         params = {
@@ -594,7 +780,7 @@ class JiraClient:
         }
 
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.timeout)
 
             if response.status_code == 200:
                 try:
@@ -616,14 +802,14 @@ class JiraClient:
 
                 except (json.JSONDecodeError, requests.exceptions.JSONDecodeError) as e:
                     print(f"Error decoding JSON: {e}")
-                    return []
+                    return None
             else:
                 print(f"Failed to retrieve user data for query '{query}': Status {response.status_code}")
-                return []
+                return None
 
         except requests.exceptions.RequestException as e:
             print(f"Error searching users: {e}")
-            return []
+            return None
 
 
 class MockJiraClient:
@@ -664,6 +850,14 @@ class MockJiraClient:
             }
         return None
 
+    def connection_stats(self) -> Dict[str, int]:
+        """Mock connection stats (no real connections)"""
+        return {'requests': 0, 'new_connections': 0, 'reused': 0}
+
+    def close(self):
+        """Mock close"""
+        pass
+
     def test_connection(self) -> bool:
         """Mock connection test"""
         print("+ Using Mock Jira Client (no actual connection)")
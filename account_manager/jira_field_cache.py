@@ -0,0 +1,284 @@
+"""
+Jira Field Cache - Persistent SQLite cache of Jira field metadata
+
+/rest/api/2/field returns every field of the instance (thousands of custom
+fields on a large server) and changes rarely, yet each script used to
+download and parse it on every start. load_jira_fields() keeps a trimmed
+copy (id, name, custom, schema) per Jira server on disk for a TTL, and in
+memory for the rest of the process, so name-to-id maps are built once from
+a small local blob. Failed fetches are never cached. JiraFieldIndex wraps
+the list in a name lookup that refetches it once on a miss, so fields
+created since the list was cached are still found.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Default cache location (override with JIRA_FIELD_CACHE_DB)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'account_manager', 'jira_field_cache.db')
+
+# Seconds the field list is trusted (override with JIRA_FIELD_CACHE_TTL; 0 disables the disk cache)
+DEFAULT_TTL = 86400
+
+# Field keys kept in the cache
+FIELD_KEYS = ('id', 'name', 'custom', 'schema')
+
+# Field lists already loaded by this process, keyed by server
+_loaded: Dict[str, List[Dict[str, Any]]] = {}
+_loaded_lock = threading.Lock()
+
+
+def normalize_field_name(name: str) -> str:
+    """Normalize a field display name for lookups ('  Case  STATUS ' -> 'case status')."""
+    return ' '.join((name or '').split()).casefold()
+
+
+def _server_key(server: str) -> str:
+    """Cache key for a Jira server ('https://jira.example.com/' -> 'jira.example.com')."""
+    server = (server or '').strip().rstrip('/')
+    for prefix in ('https://', 'http://'):
+        if server.lower().startswith(prefix):
+            server = server[len(prefix):]
+    return server.lower()
+
+
+def _trim(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep only FIELD_KEYS of each field (drops clauseNames, navigable, ...)."""
+    return [{key: field[key] for key in FIELD_KEYS if key in field}
+            for field in fields if isinstance(field, dict) and field.get('id')]
+
+
+class JiraFieldCache:
+    """Persistent on-disk cache of the Jira field list, one entry per server"""
+
+    def __init__(self, db_path: str = None, ttl: int = None, refresh: bool = False):
+        """
+        Initialize the field cache
+
+        Args:
+            db_path: SQLite file path (default: $JIRA_FIELD_CACHE_DB or ~/.cache/account_manager/jira_field_cache.db)
+            ttl: Seconds a field list is trusted (default: $JIRA_FIELD_CACHE_TTL or 86400; 0 disables the cache)
+            refresh: If True, ignore the cached list (but still store the fresh one)
+        """
+        self.db_path = db_path or os.getenv('JIRA_FIELD_CACHE_DB') or DEFAULT_CACHE_PATH
+        if ttl is None:
+            try:
+                ttl = int(os.getenv('JIRA_FIELD_CACHE_TTL', DEFAULT_TTL))
+            except ValueError:
+                ttl = DEFAULT_TTL
+        self.ttl = ttl
+        self.refresh = refresh
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jira_fields (
+                server TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    @property
+    def enabled(self) -> bool:
+        """True if cached field lists are consulted"""
+        return self.ttl > 0 and not self.refresh
+
+    def get(self, server: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a fresh cached field list
+
+        Args:
+            server: Jira server name or base URL
+
+        Returns:
+            List of field dicts, or None if not cached or expired
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data, fetched_at FROM jira_fields WHERE server = ?",
+                (_server_key(server),)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def store(self, server: str, fields: List[Dict[str, Any]]):
+        """
+        Store a field list
+
+        Args:
+            server: Jira server name or base URL
+            fields: Field dicts as returned by /rest/api/2/field (trimmed before storing)
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO jira_fields (server, data, fetched_at) VALUES (?, ?, ?)",
+                (_server_key(server), json.dumps(_trim(fields), separators=(',', ':')), time.time())
+            )
+            self.conn.commit()
+
+    def clear(self) -> int:
+        """Remove all cached field lists. Returns number of rows deleted."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM jira_fields")
+            self.conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        """Close the cache database"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+
+def load_jira_fields(server: str, fetch: Callable[[], List[Dict[str, Any]]],
+                     refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get the Jira field list from memory, the disk cache, or fetch()
+
+    Args:
+        server: Jira server name or base URL (cache key)
+        fetch: Callable returning the /rest/api/2/field response list; its
+            exceptions propagate and nothing is cached
+        refresh: If True, call fetch() even if a cached list exists
+
+    Returns:
+        List of field dicts with the keys in FIELD_KEYS
+    """
+    key = _server_key(server)
+    with _loaded_lock:
+        if not refresh and key in _loaded:
+            return _loaded[key]
+
+    try:
+        cache = JiraFieldCache(refresh=refresh)
+    except (OSError, sqlite3.Error):
+        cache = None  # Unwritable cache location: fetch every run
+
+    try:
+        try:
+            fields = cache.get(key) if cache else None
+        except (sqlite3.Error, ValueError):
+            fields = None  # Unreadable or corrupt entry: refetch and overwrite it
+        if fields is None:
+            fields = _trim(fetch())
+            if cache:
+                try:
+                    cache.store(key, fields)
+                except sqlite3.Error:
+                    pass
+    finally:
+        if cache:
+            cache.close()
+
+    with _loaded_lock:
+        _loaded[key] = fields
+    return fields
+
+
+def build_name_index(fields: List[Dict[str, Any]],
+                     normalize: Callable[[str], str] = normalize_field_name) -> Dict[str, str]:
+    """
+    Map normalized field names to field IDs (the first field with a name wins)
+
+    Args:
+        fields: Field dicts with 'id' and 'name'
+        normalize: Name normalization shared by the index and its lookups
+
+    Returns:
+        Dictionary: normalized name -> field ID
+    """
+    index = {}
+    for field in fields:
+        name = field.get('name')
+        if isinstance(name, str) and isinstance(field.get('id'), str):
+            index.setdefault(normalize(name), field['id'])
+    return index
+
+
+class JiraFieldIndex:
+    """
+    Name lookups over one server's field list, refetched once on a miss
+
+    The first lookup loads the list through load_jira_fields(); the first
+    lookup that misses reloads it with refresh=True and rebuilds the index,
+    later misses are answered from the index.
+    """
+
+    def __init__(self, server: str, fetch: Callable[[], List[Dict[str, Any]]],
+                 normalize: Callable[[str], str] = normalize_field_name,
+                 build: Callable[[List[Dict[str, Any]]], Dict[str, Any]] = None):
+        """
+        Initialize the index
+
+        Args:
+            server: Jira server name or base URL (cache key)
+            fetch: Callable returning the /rest/api/2/field response list; its
+                exceptions propagate from load() and get()
+            normalize: Name normalization shared by the index and its lookups
+            build: Callable(fields) -> {normalized name: value}
+                   (default: build_name_index(), values are field IDs)
+        """
+        self.server = server
+        self.fetch = fetch
+        self.normalize = normalize
+        self.build = build or (lambda fields: build_name_index(fields, normalize))
+        self.fields: Optional[List[Dict[str, Any]]] = None
+        self.index: Optional[Dict[str, Any]] = None
+        self.refreshed = False
+
+    def load(self, refresh: bool = False) -> Dict[str, Any]:
+        """(Re)build the index from the field list and return it."""
+        self.fields = load_jira_fields(self.server, self.fetch, refresh=refresh)
+        self.index = self.build(self.fields)
+        return self.index
+
+    def all_fields(self) -> List[Dict[str, Any]]:
+        """The field list (loaded on first use; replaced when a miss refetches it)."""
+        if self.fields is None:
+            self.load()
+        return self.fields
+
+    def get(self, name: str) -> Any:
+        """
+        Look up a field by display name
+
+        Args:
+            name: Field display name
+
+        Returns:
+            Indexed value (field ID by default), or None if not found
+        """
+        if not name:
+            return None
+        if self.index is None:
+            self.load()
+        key = self.normalize(name)
+        value = self.index.get(key)
+        if value is None and not self.refreshed:
+            # The cached list may predate the field: refetch once
+            self.refreshed = True
+            value = self.load(refresh=True).get(key)
+        return value
@@ -2,9 +2,12 @@
 JIRA Integration - Fetch JIRA IDs using first and last names
 """
 
-from typing import Optional, Dict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple
+from dataclasses import dataclass, field
+from .http_session import get_batch_workers
 from .jira_client import JiraClient, MockJiraClient
+from .jira_user_cache import JiraUserCache
 
 
 @dataclass
@@ -15,15 +18,24 @@ class JiraUserInfo:
     email_address: Optional[str] = None
 
 
+@dataclass
+class JiraUserResolution:
+    """Outcome of resolving one user: the match (if any) and lines to report"""
+    user: Optional[JiraUserInfo] = None
+    conflict: bool = False
+    messages: List[str] = field(default_factory=list)
+
+
 class JiraIdFetcher:
     """Fetch JIRA account IDs using first and last names."""
 
-    def __init__(self, use_mock: bool = False):
+    def __init__(self, use_mock: bool = False, user_cache: Optional[JiraUserCache] = None):
         """
         Initialize the JIRA ID fetcher.
 
         Args:
             use_mock: If True, use mock client for testing
+            user_cache: Optional persistent JiraUserCache for user search results
         """
         self.use_mock = use_mock
         self.last_search_was_conflict = False  # Track if last search had multiple matches
@@ -32,7 +44,7 @@ class JiraIdFetcher:
             self.client = MockJiraClient()
         else:
             try:
-                self.client = JiraClient()
+                self.client = JiraClient(user_cache=user_cache)
             except ValueError as e:
                 raise RuntimeError(f"Failed to initialize JIRA client: {e}")
 
@@ -49,11 +61,27 @@ class JiraIdFetcher:
         Returns:
             JiraUserInfo if user found, None otherwise
         """
-        self.last_search_was_conflict = False  # Reset flag
+        result = self.resolve_user(first_name, last_name, veritas_email)
+        for message in result.messages:
+            print(message)
+        self.last_search_was_conflict = result.conflict
+        return result.user
+
+    def resolve_user(self, first_name: str, last_name: str,
+                     veritas_email: str = None) -> JiraUserResolution:
+        """
+        Resolve a JIRA user by name without printing (safe to call from worker threads).
+
+        Args:
+            first_name: User's first name
+            last_name: User's last name
+            veritas_email: Optional Veritas email to help disambiguate multiple results
 
+        Returns:
+            JiraUserResolution with the user (or None), conflict flag and report lines
+        """
         if not first_name or not last_name:
-            print("Warning: Both first name and last name are required")
-            return None
+            return JiraUserResolution(messages=["Warning: Both first name and last name are required"])
 
         # Construct search query (full name)
         search_query = f"{first_name} {last_name}"
@@ -72,8 +100,7 @@ class JiraIdFetcher:
                 users = self.client.search_users(last_name)
 
             if not users:
-                print(f"Warning: No JIRA user found for {first_name} {last_name}")
-                return None
+                return JiraUserResolution(messages=[f"Warning: No JIRA user found for {first_name} {last_name}"])
 
             if len(users) == 1:
                 # Single match - use it
@@ -82,26 +109,24 @@ class JiraIdFetcher:
                 # Multiple matches - try to find best match
                 user = self._find_best_match(users, first_name, last_name, veritas_email)
                 if not user:
-                    self.last_search_was_conflict = True  # Mark as conflict
-                    print(f"CONFLICT: Multiple JIRA users found for {first_name} {last_name}")
-                    print("  Candidates:")
+                    messages = [f"CONFLICT: Multiple JIRA users found for {first_name} {last_name}",
+                                "  Candidates:"]
                     for u in users[:5]:  # Show first 5
-                        print(f"    - {u.get('displayName', 'N/A')} ({u.get('emailAddress', 'N/A')})")
+                        messages.append(f"    - {u.get('displayName', 'N/A')} ({u.get('emailAddress', 'N/A')})")
                     if len(users) > 5:
-                        print(f"    ... and {len(users) - 5} more")
-                    print("  Action: Please update manually using:")
-                    print(f"    python3 -m account_manager.cli update <etrack_user_id> jira_account=<correct_value>")
-                    return None
+                        messages.append(f"    ... and {len(users) - 5} more")
+                    messages.append("  Action: Please update manually using:")
+                    messages.append("    python3 -m account_manager.cli update <etrack_user_id> jira_account=<correct_value>")
+                    return JiraUserResolution(conflict=True, messages=messages)
 
-            return JiraUserInfo(
+            return JiraUserResolution(user=JiraUserInfo(
                 account_id=user.get('accountId', ''),
                 display_name=user.get('displayName', ''),
                 email_address=user.get('emailAddress')
-            )
+            ))
 
         except Exception as e:
-            print(f"Error searching JIRA for {first_name} {last_name}: {e}")
-            return None
+            return JiraUserResolution(messages=[f"Error searching JIRA for {first_name} {last_name}: {e}"])
 
     def _find_best_match(self, users: list, first_name: str, last_name: str,
                          veritas_email: str = None) -> Optional[dict]:  # noqa: ARG002
@@ -116,6 +141,9 @@ class JiraIdFetcher:
         2. Exact display name match (FirstName LastName) - only if exactly one
         3. Email matches firstname.lastname@cohesity.com exactly - only if exactly one
 
+        Each candidate is scored once with the highest level it reaches; the
+        answer is the only candidate at the best level, if there is just one.
+
         Args:
             users: List of user dicts from JIRA API
             first_name: Expected first name
@@ -132,60 +160,40 @@ class JiraIdFetcher:
         # Standard pattern is firstname.lastname (without numeric suffix)
         expected_email_pattern = f"{first_name.lower()}.{last_name.lower()}"
 
-        exact_name_with_cohesity = []
-        exact_name_matches = []
-        cohesity_pattern_matches = []
+        best_score = 0
+        best_user = None
+        best_count = 0
 
         for user in users:
-            display_name = user.get('displayName', '').lower()
-            user_email = user.get('emailAddress', '').lower()
-            user_email_prefix = user_email.split('@')[0] if user_email else ''
-
-            # Check for exact name match
-            is_exact_name = (display_name == expected_name)
+            display_name = (user.get('displayName') or '').lower()
+            user_email = (user.get('emailAddress') or '').lower()
+            is_exact_name = display_name == expected_name
             is_cohesity_email = '@cohesity.com' in user_email
 
-            # Exact name + cohesity email (highest priority)
             if is_exact_name and is_cohesity_email:
-                exact_name_with_cohesity.append(user)
-
-            # Exact name match
-            if is_exact_name:
-                exact_name_matches.append(user)
-
-            # Cohesity email follows first.last pattern exactly (without numeric suffix)
-            if is_cohesity_email and user_email_prefix == expected_email_pattern:
-                cohesity_pattern_matches.append(user)
-
-        # Return match ONLY if there's exactly ONE unambiguous candidate
-        # If multiple matches at any level, return None (conflict)
-
-        if len(exact_name_with_cohesity) == 1:
-            return exact_name_with_cohesity[0]
-        elif len(exact_name_with_cohesity) > 1:
-            # Multiple exact name matches with cohesity emails - conflict
-            return None
-
-        if len(exact_name_matches) == 1:
-            return exact_name_matches[0]
-        elif len(exact_name_matches) > 1:
-            # Multiple exact name matches - conflict
-            return None
+                score = 3  # Exact name + cohesity email (highest priority)
+            elif is_exact_name:
+                score = 2  # Exact name match
+            elif is_cohesity_email and user_email.split('@')[0] == expected_email_pattern:
+                score = 1  # Cohesity email follows first.last pattern exactly
+            else:
+                continue
 
-        if len(cohesity_pattern_matches) == 1:
-            return cohesity_pattern_matches[0]
-        elif len(cohesity_pattern_matches) > 1:
-            # Multiple pattern matches - conflict
-            return None
+            if score > best_score:
+                best_score, best_user, best_count = score, user, 1
+            elif score == best_score:
+                best_count += 1
 
-        # No matches found at all - can't disambiguate
-        return None
+        # Return match ONLY if there's exactly ONE candidate at the best level
+        # (several at the best level is a conflict; no candidates at all can't be disambiguated)
+        return best_user if best_count == 1 else None
 
 
 class JiraIdUpdater:
     """Update accounts with missing JIRA IDs using first and last names."""
 
-    def __init__(self, account_manager, verbose: bool = False, use_mock: bool = False):
+    def __init__(self, account_manager, verbose: bool = False, use_mock: bool = False,
+                 max_workers: int = None, user_cache: Optional[JiraUserCache] = None):
         """
         Initialize the updater.
 
@@ -193,10 +201,36 @@ class JiraIdUpdater:
             account_manager: AccountManager instance
             verbose: If True, print detailed progress
             use_mock: If True, use mock JIRA client
+            max_workers: Concurrent user resolutions (default: $JIRA_BATCH_WORKERS or 4)
+            user_cache: Optional persistent JiraUserCache for user search results
         """
         self.account_manager = account_manager
         self.verbose = verbose
-        self.fetcher = JiraIdFetcher(use_mock=use_mock)
+        self.max_workers = get_batch_workers(max_workers)
+        self.fetcher = JiraIdFetcher(use_mock=use_mock, user_cache=user_cache)
+
+    def resolve_users(self, names: List[Tuple[str, str, Optional[str]]]) -> Dict[Tuple[str, str, Optional[str]], JiraUserResolution]:
+        """
+        Resolve many users with a bounded pool of workers
+
+        Each distinct (first_name, last_name, veritas_email) is searched once.
+
+        Args:
+            names: (first_name, last_name, veritas_email) tuples
+
+        Returns:
+            Dictionary of name tuple -> JiraUserResolution
+        """
+        unique = list(dict.fromkeys(names))
+
+        def resolve(name):
+            return self.fetcher.resolve_user(*name)
+
+        workers = min(self.max_workers, len(unique))
+        if workers <= 1:
+            return {name: resolve(name) for name in unique}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(unique, executor.map(resolve, unique)))
 
     def update_missing_jira_ids(self, dry_run: bool = False) -> Dict[str, int]:
         """
@@ -208,6 +242,9 @@ class JiraIdUpdater:
         - jira_account is NULL or empty
         - manual_verified is 'no'
 
+        Users are resolved concurrently (see resolve_users) and all updates are
+        written in one transaction; output stays in account order.
+
         Args:
             dry_run: If True, don't actually update the database
 
@@ -222,17 +259,16 @@ class JiraIdUpdater:
         print(f"Scanning {len(accounts)} accounts...")
         print()
 
+        pending = []
         for account in accounts:
             etrack_user_id = account['etrack_user_id']
             first_name = account.get('first_name')
             last_name = account.get('last_name')
-            jira_account = account.get('jira_account')
-            cohesity_email = account.get('cohesity_email')
             manual_verified = account.get('manual_verified', 'no')
 
             # Check if update is needed
-            needs_jira = not jira_account
-            needs_cohesity_email = not cohesity_email
+            needs_jira = not account.get('jira_account')
+            needs_cohesity_email = not account.get('cohesity_email')
             has_names = first_name and last_name
             not_verified = manual_verified == 'no'
 
@@ -258,19 +294,27 @@ class JiraIdUpdater:
                 continue
 
             stats['total'] += 1
+            pending.append((account, (first_name, last_name, account.get('veritas_email')),
+                            needs_jira, needs_cohesity_email))
 
-            # Fetch JIRA user info
-            veritas_email = account.get('veritas_email')
+        results = self.resolve_users([name for _, name, _, _ in pending])
+
+        updates = []
+        for account, name, needs_jira, needs_cohesity_email in pending:
+            etrack_user_id = account['etrack_user_id']
+            first_name, last_name, _ = name
             if self.verbose:
                 print(f"Processing {etrack_user_id} ({first_name} {last_name})...", end=" ")
             else:
                 print(f"Processing {etrack_user_id}...", end=" ")
 
-            user_info = self.fetcher.search_user_by_name(first_name, last_name, veritas_email)
+            result = results[name]
+            for message in result.messages:
+                print(message)
+            user_info = result.user
 
             if not user_info or not user_info.account_id:
-                # search_user_by_name already prints the conflict details
-                if self.fetcher.last_search_was_conflict:
+                if result.conflict:
                     stats['conflicts'] += 1
                 else:
                     stats['failed'] += 1
@@ -293,21 +337,21 @@ class JiraIdUpdater:
                 elif self.verbose:
                     print(f"(skipping non-cohesity email: {user_info.email_address})", end=" ")
 
-            # Update the account
             if dry_run:
                 print(f"Would update {', '.join(updates_desc)}")
-                stats['updated'] += 1
             else:
-                try:
-                    self.account_manager.update_account(
-                        etrack_user_id=etrack_user_id,
-                        **update_fields
-                    )
-                    print(f"Updated {', '.join(updates_desc)}")
-                    stats['updated'] += 1
-                except Exception as e:
-                    print(f"Error updating {etrack_user_id}: {e}")
-                    stats['failed'] += 1
+                print(f"Updated {', '.join(updates_desc)}")
+                update_fields['etrack_user_id'] = etrack_user_id
+                updates.append(update_fields)
+            stats['updated'] += 1
+
+        if updates:
+            try:
+                self.account_manager.apply_account_batch(updates=updates)
+            except Exception as e:
+                print(f"Error updating accounts (no changes saved): {e}")
+                stats['failed'] += len(updates)
+                stats['updated'] -= len(updates)
 
         return stats
 
@@ -0,0 +1,131 @@
+"""
+Jira User Cache - Persistent SQLite cache of Jira user search results
+
+Results are keyed by the normalized query text (case and whitespace folded)
+and the result limit, so "John  Smith" and "john smith" share one entry.
+Empty results are cached as well: a name with no Jira user is the common
+case on repeated update-jira-ids runs. Failed requests are never cached.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Default cache location (override with JIRA_USER_CACHE_DB)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'account_manager', 'jira_user_cache.db')
+
+# Seconds a search result is trusted (override with JIRA_USER_CACHE_TTL)
+DEFAULT_TTL = 86400
+
+
+def normalize_user_query(query: str) -> str:
+    """Normalize a user search query into a cache key ('  John  SMITH ' -> 'john smith')."""
+    return ' '.join((query or '').split()).lower()
+
+
+class JiraUserCache:
+    """Persistent on-disk cache of Jira user search results keyed by normalized query"""
+
+    def __init__(self, db_path: str = None, ttl: int = None, refresh: bool = False):
+        """
+        Initialize the user search cache
+
+        Args:
+            db_path: SQLite file path (default: $JIRA_USER_CACHE_DB or ~/.cache/account_manager/jira_user_cache.db)
+            ttl: Seconds a result is trusted (default: $JIRA_USER_CACHE_TTL or 86400)
+            refresh: If True, ignore cached results (but still store fresh ones)
+        """
+        self.db_path = db_path or os.getenv('JIRA_USER_CACHE_DB') or DEFAULT_CACHE_PATH
+        if ttl is None:
+            try:
+                ttl = int(os.getenv('JIRA_USER_CACHE_TTL', DEFAULT_TTL))
+            except ValueError:
+                ttl = DEFAULT_TTL
+        self.ttl = ttl
+        self.refresh = refresh
+        self.stats = {'hits': 0, 'fetched': 0}
+
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS user_search_cache (
+                query TEXT NOT NULL,
+                max_results INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (query, max_results)
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, query: str, max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get a fresh cached search result
+
+        Args:
+            query: User search query
+            max_results: Result limit the search was made with
+
+        Returns:
+            List of user dicts (possibly empty), or None if not cached or expired
+        """
+        if self.refresh:
+            return None
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data, fetched_at FROM user_search_cache WHERE query = ? AND max_results = ?",
+                (normalize_user_query(query), max_results)
+            ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                return None
+            self.stats['hits'] += 1
+        return json.loads(row[0])
+
+    def store(self, query: str, max_results: int, users: List[Dict[str, Any]]):
+        """
+        Store a search result
+
+        Args:
+            query: User search query
+            max_results: Result limit the search was made with
+            users: Normalized user dicts returned by the search
+        """
+        with self._lock:
+            self.conn.execute("""
+                INSERT OR REPLACE INTO user_search_cache (query, max_results, data, fetched_at)
+                VALUES (?, ?, ?, ?)
+            """, (normalize_user_query(query), max_results, json.dumps(users), time.time()))
+            self.conn.commit()
+            self.stats['fetched'] += 1
+
+    def clear(self) -> int:
+        """Remove all cached results. Returns number of rows deleted."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM user_search_cache")
+            self.conn.commit()
+            return cursor.rowcount
+
+    def format_stats(self) -> str:
+        """Format hit counters for display."""
+        return f"{self.stats['hits']} cached search(es), {self.stats['fetched']} fetched"
+
+    def close(self):
+        """Close the cache database"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
@@ -0,0 +1,94 @@
+"""
+JQL Pager - Parallel, total-aware pagination of Jira /search results
+
+The first page is fetched alone to learn 'total' (and the page size the
+server actually honours); the remaining startAt offsets are then fetched
+concurrently, at most max_workers at a time, and pages are yielded in
+offset order as they complete. Callers keep their own retry/backoff inside
+fetch_page(); an exception from any page stops the iteration.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator
+
+from .http_session import get_batch_workers
+
+# Default issues per /search request (Jira caps it server-side anyway)
+DEFAULT_PAGE_SIZE = 100
+
+# Pages requested ahead of the consumer, per worker
+PREFETCH_PER_WORKER = 2
+
+
+def iter_jql_pages(fetch_page: Callable[[int, int], Dict[str, Any]], max_results: int = 0,
+                   page_size: int = DEFAULT_PAGE_SIZE, max_workers: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch all pages of a JQL search, in parallel after the first one
+
+    Args:
+        fetch_page: Callable(start_at, max_results) returning the /search JSON
+            payload ('issues', 'total', ...); must be safe to call from threads
+        max_results: Maximum issues to fetch (0 = all)
+        page_size: Issues requested per page
+        max_workers: Concurrent page requests, 1 = serial (default: $JIRA_BATCH_WORKERS or 4)
+
+    Yields:
+        Search payloads in startAt order
+    """
+    first = fetch_page(0, page_size if not max_results else min(page_size, max_results))
+    yield first
+
+    issues = first.get('issues') or []
+    total = first.get('total', len(issues))
+    limit = min(total, max_results) if max_results else total
+    step = len(issues)  # The server may return fewer than requested per page
+    if not step or step >= limit:
+        return
+
+    offsets = iter(range(step, limit, step))
+    workers = get_batch_workers(max_workers)
+    if workers <= 1:
+        for start_at in offsets:
+            yield fetch_page(start_at, min(step, limit - start_at))
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        def submit_next() -> bool:
+            start_at = next(offsets, None)
+            if start_at is None:
+                return False
+            pending.append(executor.submit(fetch_page, start_at, min(step, limit - start_at)))
+            return True
+
+        for _ in range(workers * PREFETCH_PER_WORKER):
+            if not submit_next():
+                break
+        try:
+            while pending:
+                page = pending.popleft().result()
+                submit_next()
+                yield page
+        finally:
+            # Consumer stopped early or a page failed: drop queued requests
+            for future in pending:
+                future.cancel()
+
+
+def iter_jql_issues(fetch_page: Callable[[int, int], Dict[str, Any]], max_results: int = 0,
+                    page_size: int = DEFAULT_PAGE_SIZE, max_workers: int = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the issues of a JQL search in result order (see iter_jql_pages())
+
+    Yields:
+        Issue dictionaries, at most max_results (0 = all)
+    """
+    count = 0
+    for page in iter_jql_pages(fetch_page, max_results, page_size, max_workers):
+        for issue in page.get('issues') or []:
+            if max_results and count >= max_results:
+                return
+            count += 1
+            yield issue
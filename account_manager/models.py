@@ -2,13 +2,49 @@
 Database models and core account management functionality
 """
 
+import os
 import sqlite3
+import sys
+import threading
 import time
-from typing import Optional, Dict, List, Any
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterator, List, Any, Tuple
 
 # Database lock retry settings
 DB_LOCK_RETRIES = 5
 DB_LOCK_DELAY = 0.5  # seconds
+# Pragmas applied to every connection when WAL is enabled ($ET_JR_ACCOUNTS_WAL=1 or wal=True).
+# WAL lets readers (other CLI runs, j.et.rpt.py) work while one writer commits;
+# synchronous=NORMAL is durable in WAL mode except for the last commits on power loss.
+WAL_PRAGMAS = [
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('cache_size', -16000),      # KiB (negative = size, not pages): 16 MB page cache
+    ('mmap_size', 268435456),    # 256 MB memory-mapped reads
+]
+# Action log group commit: entries are written immediately unless a batch size > 1 is set
+# (ACTION_LOG_BATCH_SIZE / ACTION_LOG_FLUSH_INTERVAL, or buffered_action_log() for bulk jobs)
+DEFAULT_ACTION_LOG_BATCH_SIZE = 1
+DEFAULT_ACTION_LOG_FLUSH_INTERVAL = 5.0  # seconds a buffered entry may wait before flushing
+BULK_ACTION_LOG_BATCH_SIZE = 1000
+# Editable account columns (everything but the etrack_user_id key and timestamps)
+ACCOUNT_FIELDS = ['first_name', 'last_name', 'veritas_email', 'cohesity_email',
+                  'community_account', 'jira_account', 'manual_verified', 'notes']
+# SQLite limits bound parameters per statement (999 before 3.32)
+SQLITE_MAX_PARAMS = 900
+# Columns in the accounts_fts trigram index (search_accounts pre-filters text searches with it)
+FTS_FIELDS = ['etrack_user_id', 'first_name', 'last_name', 'veritas_email', 'cohesity_email',
+              'community_account', 'jira_account', 'notes']
+# Triggers that keep accounts_fts in sync with accounts
+FTS_TRIGGERS = ('accounts_fts_insert', 'accounts_fts_delete', 'accounts_fts_update')
+# Shortest value the trigram index can match (shorter values are LIKE-only)
+FTS_MIN_LENGTH = 3
+# Rows fetched per keyset page by iter_action_log
+ACTION_LOG_PAGE_SIZE = 1000
+# Columns translate() and the in-memory identity index look identifiers up by, in priority order
+IDENTITY_FIELDS = ['etrack_user_id', 'veritas_email', 'cohesity_email',
+                   'community_account', 'jira_account']
+
 # Invalid etrack_user_id values (placeholders, empty, etc.)
 INVALID_ETRACK_USER_IDS = {'-', 'n/a', 'na', 'none', 'null', 'unknown', 'unassigned', ''}
 
@@ -40,6 +76,25 @@ def is_valid_verification_status(status: str) -> bool:
     return status.strip().lower() in VALID_VERIFICATION_STATUSES
 
 
+def normalize_verification_status(status: str) -> str:
+    """
+    Validate and normalize a manual_verified value
+
+    Args:
+        status: The verification status to normalize
+
+    Returns:
+        Lowercase status
+
+    Raises:
+        ValueError: If status is not a valid value
+    """
+    if not is_valid_verification_status(status):
+        valid_options = ', '.join(sorted(VALID_VERIFICATION_STATUSES))
+        raise ValueError(f"Invalid manual_verified value: '{status}'. Valid options: {valid_options}")
+    return status.strip().lower()
+
+
 def is_valid_etrack_user_id(etrack_user_id: str) -> bool:
     """
     Validate that etrack_user_id is a valid value.
@@ -91,27 +146,107 @@ def retry_on_lock(func):
 class AccountManager:
     """Manages employee accounts across different platforms"""
 
-    def __init__(self, db_path: str = "accounts.db"):
+    def __init__(self, db_path: str = "accounts.db", preload_index: bool = False,
+                 action_log_batch_size: int = None, action_log_flush_interval: float = None,
+                 wal: bool = None):
         """
         Initialize the Account Manager
 
         Args:
             db_path: Path to the SQLite database file
+            preload_index: Serve translate()/get_account() from an in-memory index
+                           (one table scan, rebuilt after add/update/delete)
+            action_log_batch_size: Buffer this many log_action() entries per commit
+                                   (default: $ACTION_LOG_BATCH_SIZE or 1 = write through)
+            action_log_flush_interval: Flush buffered entries once the oldest is this many
+                                       seconds old (default: $ACTION_LOG_FLUSH_INTERVAL or 5)
+            wal: Use WAL journal mode with WAL_PRAGMAS (default: $ET_JR_ACCOUNTS_WAL, off
+                 unless '1'). WAL mode persists in the database file once set.
         """
         self.db_path = db_path
+        if wal is None:
+            wal = os.getenv('ET_JR_ACCOUNTS_WAL', '') not in ('', '0')
+        self.wal = wal
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()  # Per-thread connections for readers off the main thread
+        self._thread_conns = []
+        self._thread_conns_lock = threading.Lock()
+        self.fts_enabled = False  # Set by _create_fts() when SQLite has FTS5
         self.conn = None
         self.cursor = None
+        self.use_index = preload_index
+        self._index = None  # field -> {value: account dict}
+        if action_log_batch_size is None:
+            action_log_batch_size = int(os.getenv('ACTION_LOG_BATCH_SIZE', DEFAULT_ACTION_LOG_BATCH_SIZE))
+        if action_log_flush_interval is None:
+            action_log_flush_interval = float(os.getenv('ACTION_LOG_FLUSH_INTERVAL',
+                                                        DEFAULT_ACTION_LOG_FLUSH_INTERVAL))
+        self.action_log_batch_size = max(1, action_log_batch_size)
+        self.action_log_flush_interval = action_log_flush_interval
+        self._action_buffer = []       # Pending action_log rows (group-committed by flush_action_log)
+        self._action_buffer_since = 0.0  # monotonic time of the oldest pending row
+        self.action_log_written = 0    # action_log rows committed by this instance
         self._connect()
         self._create_table()
+        if preload_index:
+            self.build_index()
 
     def _connect(self):
         """Establish database connection with timeout for lock handling"""
-        self.conn = sqlite3.connect(self.db_path, timeout=30.0)
-        self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        self.conn = self.connect()
         self.cursor = self.conn.cursor()
 
+    def connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        Open a new connection to this database with the manager's settings
+
+        Args:
+            check_same_thread: Passed to sqlite3.connect
+
+        Returns:
+            sqlite3.Connection with Row factory (and WAL_PRAGMAS when WAL is on)
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=check_same_thread)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        if self.wal:
+            for pragma, value in WAL_PRAGMAS:
+                conn.execute(f"PRAGMA {pragma} = {value}")
+        return conn
+
+    def thread_connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection
+
+        The creating thread gets the main connection; every other thread
+        (e.g., parallel validation workers) gets its own, opened on first
+        use and closed by close(). With WAL, these readers never block the
+        writer.
+
+        Returns:
+            sqlite3.Connection owned by the calling thread
+        """
+        if threading.get_ident() == self._owner_thread:
+            return self.conn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # check_same_thread=False only so close() can close it from the owner thread
+            conn = self.connect(check_same_thread=False)
+            self._local.conn = conn
+            with self._thread_conns_lock:
+                self._thread_conns.append(conn)
+        return conn
+
+    def _read_cursor(self) -> sqlite3.Cursor:
+        """Cursor for read queries: the shared cursor on the owner thread, else a per-thread one."""
+        if threading.get_ident() == self._owner_thread:
+            return self.cursor
+        return self.thread_connection().cursor()
+
     def _create_table(self):
         """Create the accounts table if it doesn't exist"""
+        # Lets compact_action_log() return freed pages incrementally (only takes
+        # effect on a new, empty database; existing ones are converted by VACUUM)
+        self.cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
         self.cursor.execute("""
             CREATE TABLE IF NOT EXISTS accounts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -162,21 +297,93 @@ class AccountManager:
             )
         """)
 
-        # Index for querying action logs
-        self.cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_action_type
-            ON action_log(action_type)
-        """)
+        # Indexes for querying action logs: each ends in created_at (and implicitly id),
+        # so filtered, date-bounded queries walk one index in keyset order
         self.cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_action_created
             ON action_log(created_at)
         """)
         self.cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_action_target
-            ON action_log(target_type, target_id)
+            CREATE INDEX IF NOT EXISTS idx_action_type_created
+            ON action_log(action_type, created_at)
+        """)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_action_target_created
+            ON action_log(target_type, target_id, created_at)
+        """)
+        # Superseded by the composite indexes above
+        self.cursor.execute("DROP INDEX IF EXISTS idx_action_type")
+        self.cursor.execute("DROP INDEX IF EXISTS idx_action_target")
+
+        # Daily counters for archived action_log entries (see action_archive.py);
+        # summaries add them to the counts from the live table
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS action_log_daily (
+                day TEXT NOT NULL,
+                action_type TEXT NOT NULL,
+                status TEXT,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (day, action_type, status)
+            )
         """)
 
         self.conn.commit()
+        self._create_fts()
+
+    def _create_fts(self):
+        """Create the accounts_fts full-text index and its sync triggers (if FTS5 is available)
+
+        The index needs FTS5 with the trigram tokenizer (SQLite 3.34+). Without
+        it the triggers are dropped again, since they would make every write to
+        accounts fail, and search_accounts keeps using LIKE. A later open with
+        FTS5 recreates them and rebuilds the index.
+        """
+        try:
+            self.cursor.execute("CREATE VIRTUAL TABLE temp.accounts_fts_probe USING fts5(x, tokenize='trigram')")
+            self.cursor.execute("DROP TABLE temp.accounts_fts_probe")
+        except sqlite3.OperationalError:
+            for trigger in FTS_TRIGGERS:
+                self.cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            self.conn.commit()
+            return
+
+        self.cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'accounts_fts'")
+        exists = self.cursor.fetchone()[0] > 0
+        self.cursor.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(FTS_TRIGGERS))})",
+                            FTS_TRIGGERS)
+        synced = self.cursor.fetchone()[0] == len(FTS_TRIGGERS)
+
+        columns = ', '.join(FTS_FIELDS)
+        new_values = ', '.join(f"new.{f}" for f in FTS_FIELDS)
+        old_values = ', '.join(f"old.{f}" for f in FTS_FIELDS)
+        # External content table: the index stores trigrams only, rows stay in accounts
+        self.cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS accounts_fts USING fts5(
+                {columns}, content='accounts', content_rowid='id', tokenize='trigram'
+            )
+        """)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS accounts_fts_insert AFTER INSERT ON accounts BEGIN
+                INSERT INTO accounts_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """)
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS accounts_fts_delete AFTER DELETE ON accounts BEGIN
+                INSERT INTO accounts_fts(accounts_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        self.cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS accounts_fts_update AFTER UPDATE ON accounts BEGIN
+                INSERT INTO accounts_fts(accounts_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO accounts_fts(rowid, {columns}) VALUES (new.id, {new_values});
+            END
+        """)
+        if not (exists and synced):
+            # Index accounts added before the index existed or while the triggers were missing
+            self.cursor.execute("INSERT INTO accounts_fts(accounts_fts) VALUES ('rebuild')")
+        self.conn.commit()
+        self.fts_enabled = True
 
     @retry_on_lock
     def add_account(self, etrack_user_id: str, first_name: str = None,
@@ -216,13 +423,8 @@ class AccountManager:
         if not is_valid_etrack_user_id(etrack_user_id):
             raise ValueError(f"Invalid etrack_user_id: '{etrack_user_id}' (cannot be empty, '-', 'N/A', etc.)")
         
-        # Validate manual_verified
-        if not is_valid_verification_status(manual_verified):
-            valid_options = ', '.join(sorted(VALID_VERIFICATION_STATUSES))
-            raise ValueError(f"Invalid manual_verified value: '{manual_verified}'. Valid options: {valid_options}")
-        
-        # Normalize to lowercase
-        manual_verified = manual_verified.strip().lower()
+        # Validate and normalize manual_verified
+        manual_verified = normalize_verification_status(manual_verified)
         
         try:
             self.cursor.execute("""
@@ -234,6 +436,7 @@ class AccountManager:
                   community_account, jira_account, manual_verified, notes))
 
             self.conn.commit()
+            self._index = None
             return self.cursor.lastrowid
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Account with etrack_user_id '{etrack_user_id}' already exists") from e
@@ -257,20 +460,14 @@ class AccountManager:
         Raises:
             ValueError: If manual_verified has invalid value
         """
-        allowed_fields = ['first_name', 'last_name', 'veritas_email', 'cohesity_email',
-                         'community_account', 'jira_account', 'manual_verified', 'notes']
-        updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        updates = {k: v for k, v in kwargs.items() if k in ACCOUNT_FIELDS}
 
         if not updates:
             return False
 
-        # Validate manual_verified if being updated
+        # Validate and normalize manual_verified if being updated
         if 'manual_verified' in updates:
-            if not is_valid_verification_status(updates['manual_verified']):
-                valid_options = ', '.join(sorted(VALID_VERIFICATION_STATUSES))
-                raise ValueError(f"Invalid manual_verified value: '{updates['manual_verified']}'. Valid options: {valid_options}")
-            # Normalize to lowercase
-            updates['manual_verified'] = updates['manual_verified'].strip().lower()
+            updates['manual_verified'] = normalize_verification_status(updates['manual_verified'])
 
         # Build UPDATE query dynamically
         set_clause = ", ".join([f"{field} = ?" for field in updates.keys()])
@@ -284,6 +481,7 @@ class AccountManager:
         """, values)
 
         self.conn.commit()
+        self._index = None
         return self.cursor.rowcount > 0
 
     @retry_on_lock
@@ -299,8 +497,91 @@ class AccountManager:
         """
         self.cursor.execute("DELETE FROM accounts WHERE etrack_user_id = ?", (etrack_user_id,))
         self.conn.commit()
+        self._index = None
         return self.cursor.rowcount > 0
 
+    def existing_etrack_user_ids(self, etrack_user_ids: List[str]) -> set:
+        """
+        Find which etrack_user_ids already have an account (set-based lookup)
+
+        Args:
+            etrack_user_ids: IDs to check
+
+        Returns:
+            Set of the IDs that exist
+        """
+        ids = list(dict.fromkeys(etrack_user_ids))
+        cursor = self._read_cursor()
+        found = set()
+        for start in range(0, len(ids), SQLITE_MAX_PARAMS):
+            chunk = ids[start:start + SQLITE_MAX_PARAMS]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(
+                f"SELECT etrack_user_id FROM accounts WHERE etrack_user_id IN ({placeholders})", chunk)
+            found.update(row[0] for row in cursor.fetchall())
+        return found
+
+    @retry_on_lock
+    def apply_account_batch(self, new_accounts: List[Dict[str, Any]] = None,
+                            updates: List[Dict[str, Any]] = None,
+                            actions: List[tuple] = None) -> Dict[str, int]:
+        """
+        Insert, update and log a batch of accounts in one transaction
+
+        Inserts run before updates, so an update may target an account added
+        in the same batch; updates are applied in list order. Rows are not
+        validated here (callers use normalize_verification_status etc.).
+
+        Args:
+            new_accounts: Account dicts (etrack_user_id plus ACCOUNT_FIELDS, manual_verified
+                          set); existing etrack_user_ids are left untouched (upsert do-nothing)
+            updates: Dicts with etrack_user_id plus only the fields to change
+            actions: action_log rows (action_type, target_type, target_id,
+                     old_value, new_value, status, details)
+
+        Returns:
+            Dictionary: {'inserted': n, 'updated': n}
+        """
+        self.flush_action_log()
+        columns = ['etrack_user_id'] + ACCOUNT_FIELDS
+        set_clause = ', '.join(f"{f} = CASE WHEN ? THEN ? ELSE {f} END" for f in ACCOUNT_FIELDS)
+        result = {'inserted': 0, 'updated': 0}
+        try:
+            if new_accounts:
+                self.cursor.executemany(f"""
+                    INSERT INTO accounts ({', '.join(columns)})
+                    VALUES ({', '.join('?' * len(columns))})
+                    ON CONFLICT(etrack_user_id) DO NOTHING
+                """, [[a.get(c) for c in columns] for a in new_accounts])
+                result['inserted'] = self.cursor.rowcount
+            if updates:
+                # One statement for every column set: unchanged columns keep their value
+                params = []
+                for u in updates:
+                    row = []
+                    for f in ACCOUNT_FIELDS:
+                        row += [f in u, u.get(f)]
+                    params.append(row + [u['etrack_user_id']])
+                self.cursor.executemany(f"""
+                    UPDATE accounts
+                    SET {set_clause}, updated_at = CURRENT_TIMESTAMP
+                    WHERE etrack_user_id = ?
+                """, params)
+                result['updated'] = self.cursor.rowcount
+            if actions:
+                self.cursor.executemany("""
+                    INSERT INTO action_log
+                    (action_type, target_type, target_id, old_value, new_value, status, details)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, actions)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        if new_accounts or updates:
+            self._index = None
+        return result
+
     def get_account(self, **kwargs) -> Optional[Dict[str, Any]]:
         """
         Get a single account by any field
@@ -321,8 +602,13 @@ class AccountManager:
         if field not in allowed_fields:
             raise ValueError(f"Invalid field: {field}")
 
-        self.cursor.execute(f"SELECT * FROM accounts WHERE {field} = ?", (value,))
-        row = self.cursor.fetchone()
+        if self.use_index and field in IDENTITY_FIELDS:
+            account = self._get_index()[field].get(value)
+            return dict(account) if account else None
+
+        cursor = self._read_cursor()
+        cursor.execute(f"SELECT * FROM accounts WHERE {field} = ?", (value,))
+        row = cursor.fetchone()
 
         return dict(row) if row else None
 
@@ -330,16 +616,22 @@ class AccountManager:
         """
         Search accounts with partial matching
 
+        Every criterion is a LIKE '%value%' substring match; results are
+        ordered by etrack_user_id. Text values of FTS_MIN_LENGTH or more
+        characters first narrow the candidates through the accounts_fts
+        trigram index, so the LIKE predicates only check those rows.
+
         Args:
-            **kwargs: Fields to search (supports LIKE queries)
+            **kwargs: Fields to search (name= matches first or last name)
 
         Returns:
             List of matching account dictionaries
         """
+        cursor = self._read_cursor()
         if not kwargs:
             # Return all accounts if no search criteria
-            self.cursor.execute("SELECT * FROM accounts ORDER BY etrack_user_id")
-            return [dict(row) for row in self.cursor.fetchall()]
+            cursor.execute("SELECT * FROM accounts ORDER BY etrack_user_id")
+            return [dict(row) for row in cursor.fetchall()]
 
         allowed_fields = {
             'id',
@@ -373,10 +665,39 @@ class AccountManager:
             conditions.append(f"{field} LIKE ?")
             values.append(f"%{value}%")
 
+        match = self._fts_prefilter(kwargs) if self.fts_enabled else None
+        if match:
+            conditions.insert(0, "id IN (SELECT rowid FROM accounts_fts WHERE accounts_fts MATCH ?)")
+            values.insert(0, match)
+
         query = f"SELECT * FROM accounts WHERE {' AND '.join(conditions)} ORDER BY etrack_user_id"
-        self.cursor.execute(query, values)
+        cursor.execute(query, values)
 
-        return [dict(row) for row in self.cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _fts_prefilter(criteria: Dict[str, Any]) -> Optional[str]:
+        """
+        Build an accounts_fts MATCH expression for the indexable criteria
+
+        A trigram phrase matches every row containing the value as a
+        (case-insensitive) substring, so the candidates are a superset of
+        the LIKE matches and the LIKE predicates decide the result.
+
+        Returns:
+            MATCH expression, or None if no criterion can use the index
+        """
+        matches = []
+        for field, value in criteria.items():
+            value = str(value)
+            if len(value) < FTS_MIN_LENGTH:
+                continue
+            phrase = '"' + value.replace('"', '""') + '"'
+            if field == 'name':
+                matches.append(f"{{first_name last_name}} : {phrase}")
+            elif field in FTS_FIELDS:
+                matches.append(f"{field} : {phrase}")
+        return ' AND '.join(matches) or None
 
     def translate(self, identifier: str, return_field: str) -> Optional[str]:
         """
@@ -393,25 +714,94 @@ class AccountManager:
             translate('ET12345', 'jira_account')  -> 'john.doe'
             translate('john@vcompany.com', 'cohesity_email')  -> 'john@ccompany.com'
         """
-        allowed_fields = ['etrack_user_id', 'veritas_email', 'cohesity_email',
-                         'community_account', 'jira_account']
-
-        if return_field not in allowed_fields:
+        if return_field not in IDENTITY_FIELDS:
             raise ValueError(f"Invalid return field: {return_field}")
 
-        # Try to find the record by searching all fields
-        search_fields = ['etrack_user_id', 'veritas_email', 'cohesity_email',
-                        'community_account', 'jira_account']
+        if self.use_index:
+            return self._translate_indexed(self._get_index(), identifier, return_field)
 
-        for field in search_fields:
-            self.cursor.execute(f"SELECT {return_field} FROM accounts WHERE {field} = ?",
-                              (identifier,))
-            result = self.cursor.fetchone()
+        # Try to find the record by searching all fields
+        cursor = self._read_cursor()
+        for field in IDENTITY_FIELDS:
+            cursor.execute(f"SELECT {return_field} FROM accounts WHERE {field} = ?",
+                           (identifier,))
+            result = cursor.fetchone()
             if result and result[0]:
                 return result[0]
 
         return None
 
+    def translate_many(self, identifiers: List[str], return_field: str) -> Dict[str, Optional[str]]:
+        """
+        Translate many identifiers at once using the in-memory identity index
+
+        Builds the index (one table scan) if it is not loaded; each lookup is
+        then a dict hit instead of up to five SQL queries.
+
+        Args:
+            identifiers: Identifiers (etrack_user_id, email, jira_account, etc.)
+            return_field: Field to return (e.g., 'jira_account', 'veritas_email')
+
+        Returns:
+            Dictionary mapping each identifier to the requested value (or None)
+        """
+        if return_field not in IDENTITY_FIELDS:
+            raise ValueError(f"Invalid return field: {return_field}")
+
+        index = self._get_index()
+        return {identifier: self._translate_indexed(index, identifier, return_field)
+                for identifier in identifiers}
+
+    @staticmethod
+    def _translate_indexed(index: Dict[str, Dict[str, Dict[str, Any]]], identifier: str,
+                           return_field: str) -> Optional[str]:
+        """Index equivalent of translate()'s per-field queries (same field priority)."""
+        for field in IDENTITY_FIELDS:
+            account = index[field].get(identifier)
+            if account and account[return_field]:
+                return account[return_field]
+        return None
+
+    def build_index(self) -> int:
+        """
+        Load the in-memory identity index with one scan of the accounts table
+
+        Each identity field maps its values to the account row; when a value
+        appears in several rows the lowest id wins, as with the SQL lookups.
+
+        Returns:
+            Number of accounts indexed
+        """
+        cursor = self._read_cursor()
+        cursor.execute("SELECT * FROM accounts ORDER BY id")
+        index = {field: {} for field in IDENTITY_FIELDS}
+        count = 0
+        for row in cursor.fetchall():
+            account = dict(row)
+            count += 1
+            for field in IDENTITY_FIELDS:
+                value = account[field]
+                if value is not None:
+                    index[field].setdefault(value, account)
+        self._index = index
+        return count
+
+    def enable_index(self) -> int:
+        """
+        Serve translate()/get_account() from the in-memory index from now on
+
+        Returns:
+            Number of accounts indexed
+        """
+        self.use_index = True
+        return self.build_index()
+
+    def _get_index(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get the identity index, rebuilding it if a write invalidated it."""
+        if self._index is None:
+            self.build_index()
+        return self._index
+
     def get_all_accounts(self) -> List[Dict[str, Any]]:
         """
         Get all accounts
@@ -419,17 +809,20 @@ class AccountManager:
         Returns:
             List of all account dictionaries
         """
-        self.cursor.execute("SELECT * FROM accounts ORDER BY etrack_user_id")
-        return [dict(row) for row in self.cursor.fetchall()]
+        cursor = self._read_cursor()
+        cursor.execute("SELECT * FROM accounts ORDER BY etrack_user_id")
+        return [dict(row) for row in cursor.fetchall()]
 
-    @retry_on_lock
     def log_action(self, action_type: str, target_type: str = None,
                    target_id: str = None, old_value: str = None,
                    new_value: str = None, status: str = 'success',
-                   details: str = None) -> int:
+                   details: str = None) -> Optional[int]:
         """
         Log an action taken by the script
 
+        With a batch size > 1 the entry is buffered (keeping its own timestamp)
+        and written with the rest of the batch in a single transaction.
+
         Args:
             action_type: Type of action (e.g., 'add_account', 'update_account',
                         'assign_fi', 'assign_etrack', 'fix_fi', 'verify_account')
@@ -441,16 +834,199 @@ class AccountManager:
             details: Additional details or error message
 
         Returns:
-            ID of the log entry
+            ID of the log entry, or None if it was buffered
         """
+        if self.action_log_batch_size <= 1 and not self._action_buffer:
+            return self._insert_action(action_type, target_type, target_id,
+                                       old_value, new_value, status, details)
+
+        if not self._action_buffer:
+            self._action_buffer_since = time.monotonic()
+        self._action_buffer.append((action_type, target_type, target_id, old_value,
+                                    new_value, status, details,
+                                    time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())))
+        if (len(self._action_buffer) >= self.action_log_batch_size or
+                time.monotonic() - self._action_buffer_since >= self.action_log_flush_interval):
+            self.flush_action_log()
+        return None
+
+    @retry_on_lock
+    def _insert_action(self, action_type: str, target_type: str, target_id: str,
+                       old_value: str, new_value: str, status: str, details: str) -> int:
+        """Write one action_log row and commit it."""
         self.cursor.execute("""
             INSERT INTO action_log
             (action_type, target_type, target_id, old_value, new_value, status, details)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """, (action_type, target_type, target_id, old_value, new_value, status, details))
         self.conn.commit()
+        self.action_log_written += 1
         return self.cursor.lastrowid
 
+    def flush_action_log(self) -> int:
+        """
+        Write all buffered action_log entries in one transaction
+
+        The buffer is taken before writing. If the write still fails after
+        the lock retries, the batch is dropped and the error raised, so one
+        failed batch does not make every later log_action() fail as well.
+        Callers that must know what was stored compare action_log_written.
+
+        Returns:
+            Number of entries written
+        """
+        if not self._action_buffer:
+            return 0
+        pending, self._action_buffer = self._action_buffer, []
+        self._write_actions(pending)
+        return len(pending)
+
+    @retry_on_lock
+    def _write_actions(self, rows: List[tuple]):
+        """Insert buffered action_log rows and commit (rolled back on failure, so retries never duplicate)."""
+        try:
+            self.cursor.executemany("""
+                INSERT INTO action_log
+                (action_type, target_type, target_id, old_value, new_value, status, details, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        self.action_log_written += len(rows)
+
+    @contextmanager
+    def buffered_action_log(self, batch_size: int = BULK_ACTION_LOG_BATCH_SIZE,
+                            flush_interval: float = None):
+        """
+        Group-commit log_action() entries for the duration of a bulk job
+
+        Usage:
+            with am.buffered_action_log():
+                for row in rows:
+                    am.log_action(...)
+
+        Args:
+            batch_size: Entries per transaction
+            flush_interval: Max seconds an entry stays buffered (default: unchanged)
+
+        Yields:
+            This AccountManager
+        """
+        saved = (self.action_log_batch_size, self.action_log_flush_interval)
+        self.action_log_batch_size = max(1, batch_size)
+        if flush_interval is not None:
+            self.action_log_flush_interval = flush_interval
+        try:
+            yield self
+        except BaseException:
+            self.action_log_batch_size, self.action_log_flush_interval = saved
+            try:
+                self.flush_action_log()
+            except (sqlite3.Error, DatabaseLockedError) as e:
+                # Report, but don't hide the job's own error behind it
+                print(f"Warning: buffered action log entries not written: {e}", file=sys.stderr)
+            raise
+        self.action_log_batch_size, self.action_log_flush_interval = saved
+        self.flush_action_log()
+
+    @staticmethod
+    def _action_log_filters(action_type: str = None, target_type: str = None,
+                            target_id: str = None, status: str = None,
+                            since: str = None, until: str = None) -> Tuple[List[str], List[Any]]:
+        """
+        Build WHERE conditions for action_log queries
+
+        Date bounds compare the raw created_at column ('YYYY-MM-DD HH:MM:SS')
+        against date(?), so SQLite can range-scan the created_at indexes.
+
+        Returns:
+            (conditions, params)
+        """
+        conditions = []
+        params = []
+        for column, value in (('action_type', action_type), ('target_type', target_type),
+                              ('target_id', target_id), ('status', status)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            conditions.append("created_at >= date(?)")
+            params.append(since)
+        if until:
+            conditions.append("created_at < date(?, '+1 day')")
+            params.append(until)
+        return conditions, params
+
+    def iter_action_log(self, action_type: str = None, target_type: str = None,
+                        target_id: str = None, status: str = None, since: str = None,
+                        until: str = None, limit: int = None,
+                        page_size: int = ACTION_LOG_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield action log entries, most recent first, one keyset page at a time
+
+        Each page resumes after the last (created_at, id) seen instead of using
+        OFFSET, so memory stays at one page and every page is an index seek,
+        however large the log is.
+
+        Args:
+            action_type: Filter by action type
+            target_type: Filter by target type
+            target_id: Filter by target ID
+            status: Filter by status
+            since: Entries on or after this date (YYYY-MM-DD)
+            until: Entries on or before this date (YYYY-MM-DD)
+            limit: Maximum number of entries (None = all)
+            page_size: Rows fetched per query
+
+        Yields:
+            Action log entry dictionaries
+        """
+        self.flush_action_log()
+        conditions, params = self._action_log_filters(action_type, target_type, target_id,
+                                                      status, since, until)
+        cursor = self._read_cursor()
+        last = None
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_conditions = list(conditions)
+            page_params = list(params)
+            if last is not None:
+                page_conditions.append("(created_at, id) < (?, ?)")
+                page_params.extend(last)
+            size = page_size if remaining is None else min(page_size, remaining)
+            where = f"WHERE {' AND '.join(page_conditions)}" if page_conditions else ""
+            cursor.execute(f"""
+                SELECT * FROM action_log {where}
+                ORDER BY created_at DESC, id DESC LIMIT ?
+            """, page_params + [size])
+            rows = cursor.fetchall()
+            for row in rows:
+                yield dict(row)
+            if len(rows) < size:
+                return
+            last = (rows[-1]['created_at'], rows[-1]['id'])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def count_action_log(self, action_type: str = None, target_type: str = None,
+                         target_id: str = None, status: str = None,
+                         since: str = None, until: str = None) -> int:
+        """
+        Count action log entries matching the filters (index-only for common filters)
+
+        Returns:
+            Number of matching entries
+        """
+        self.flush_action_log()
+        conditions, params = self._action_log_filters(action_type, target_type, target_id,
+                                                      status, since, until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self._read_cursor()
+        cursor.execute(f"SELECT COUNT(*) FROM action_log {where}", params)
+        return cursor.fetchone()[0]
+
     def get_action_log(self, limit: int = 50, action_type: str = None,
                        target_type: str = None, target_id: str = None,
                        status: str = None, since: str = None) -> List[Dict[str, Any]]:
@@ -468,34 +1044,13 @@ class AccountManager:
         Returns:
             List of action log entries (most recent first)
         """
-        query = "SELECT * FROM action_log WHERE 1=1"
-        params = []
-
-        if action_type:
-            query += " AND action_type = ?"
-            params.append(action_type)
-        if target_type:
-            query += " AND target_type = ?"
-            params.append(target_type)
-        if target_id:
-            query += " AND target_id = ?"
-            params.append(target_id)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-        if since:
-            query += " AND date(created_at) >= date(?)"
-            params.append(since)
-
-        query += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
-
-        self.cursor.execute(query, params)
-        return [dict(row) for row in self.cursor.fetchall()]
+        return list(self.iter_action_log(action_type=action_type, target_type=target_type,
+                                         target_id=target_id, status=status, since=since,
+                                         limit=limit, page_size=max(1, limit or ACTION_LOG_PAGE_SIZE)))
 
     def get_action_summary(self, since: str = None) -> Dict[str, Dict[str, int]]:
         """
-        Get summary statistics of actions
+        Get summary statistics of actions (including archived entries' rollups)
 
         Args:
             since: Filter by date (YYYY-MM-DD format, entries on or after)
@@ -503,23 +1058,32 @@ class AccountManager:
         Returns:
             Dictionary with action_type -> {status -> count}
         """
-        query = """
-            SELECT action_type, status, COUNT(*) as count
-            FROM action_log
-            WHERE 1=1
-        """
+        self.flush_action_log()
+        live_filter = rollup_filter = ""
         params = []
 
         if since:
-            query += " AND date(created_at) >= date(?)"
-            params.append(since)
-
-        query += " GROUP BY action_type, status ORDER BY action_type, status"
+            live_filter = "WHERE created_at >= date(?)"
+            rollup_filter = "WHERE day >= date(?)"
+            params = [since, since]
+
+        query = f"""
+            SELECT action_type, status, SUM(count) as count FROM (
+                SELECT action_type, status, COUNT(*) as count
+                FROM action_log {live_filter}
+                GROUP BY action_type, status
+                UNION ALL
+                SELECT action_type, status, count
+                FROM action_log_daily {rollup_filter}
+            )
+            GROUP BY action_type, status ORDER BY action_type, status
+        """
 
-        self.cursor.execute(query, params)
+        cursor = self._read_cursor()
+        cursor.execute(query, params)
 
         summary = {}
-        for row in self.cursor.fetchall():
+        for row in cursor.fetchall():
             action_type = row['action_type']
             status = row['status']
             count = row['count']
@@ -529,9 +1093,37 @@ class AccountManager:
 
         return summary
 
+    def get_daily_action_counts(self, since: str) -> List[Dict[str, Any]]:
+        """
+        Get per-day action counts (live entries plus archived rollups)
+
+        Args:
+            since: First day to include (YYYY-MM-DD, or any date() expression argument)
+
+        Returns:
+            List of {'day', 'action_type', 'status', 'count'}, newest day first
+        """
+        self.flush_action_log()
+        cursor = self._read_cursor()
+        cursor.execute("""
+            SELECT day, action_type, status, SUM(count) as count FROM (
+                SELECT date(created_at) as day, action_type, status, COUNT(*) as count
+                FROM action_log
+                WHERE created_at >= date(?)
+                GROUP BY date(created_at), action_type, status
+                UNION ALL
+                SELECT day, action_type, status, count
+                FROM action_log_daily
+                WHERE day >= date(?)
+            )
+            GROUP BY day, action_type, status
+            ORDER BY day DESC, action_type
+        """, (since, since))
+        return [dict(row) for row in cursor.fetchall()]
+
     def clear_action_log(self, before: str = None) -> int:
         """
-        Clear action log entries
+        Clear action log entries (and the daily rollups of archived entries)
 
         Args:
             before: Clear entries before this date (YYYY-MM-DD), or all if None
@@ -539,22 +1131,34 @@ class AccountManager:
         Returns:
             Number of entries deleted
         """
+        self.flush_action_log()
         if before:
             self.cursor.execute(
-                "DELETE FROM action_log WHERE date(created_at) < date(?)",
+                "DELETE FROM action_log WHERE created_at < date(?)",
                 (before,)
             )
+            deleted = self.cursor.rowcount
+            self.cursor.execute("DELETE FROM action_log_daily WHERE day < date(?)", (before,))
         else:
             self.cursor.execute("DELETE FROM action_log")
+            deleted = self.cursor.rowcount
+            self.cursor.execute("DELETE FROM action_log_daily")
 
-        deleted = self.cursor.rowcount
         self.conn.commit()
         return deleted
 
     def close(self):
-        """Close database connection"""
+        """Flush buffered action log entries and close all database connections"""
+        with self._thread_conns_lock:
+            thread_conns, self._thread_conns = self._thread_conns, []
+        for conn in thread_conns:
+            conn.close()
         if self.conn:
-            self.conn.close()
+            try:
+                self.flush_action_log()
+            finally:
+                self.conn.close()
+                self.conn = None
 
     def __enter__(self):
         """Context manager entry"""
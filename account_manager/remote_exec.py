@@ -0,0 +1,299 @@
+"""
+Remote Exec - Shared transport for esql/eset/euserls commands
+
+Commands run locally when no SSH target is given, otherwise over SSH with
+OpenSSH connection multiplexing (ControlMaster). The first command opens a
+master connection that stays up for ControlPersist seconds; every later
+command (in this or any other process) reuses it and skips the
+300-800 ms key exchange and authentication.
+"""
+
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Union
+
+# Multiplexing defaults (override with RMTCMD_CONTROL_DIR / RMTCMD_CONTROL_PERSIST,
+# disable with RMTCMD_MULTIPLEX=0)
+DEFAULT_CONTROL_PERSIST = 600  # seconds the idle master connection is kept
+DEFAULT_CONNECT_TIMEOUT = 10
+
+
+def _default_control_dir() -> str:
+    """Directory for ControlMaster sockets (kept short: socket paths are length-limited)."""
+    return os.getenv('RMTCMD_CONTROL_DIR') or os.path.join(
+        tempfile.gettempdir(), f"am-ssh-{os.getuid() if hasattr(os, 'getuid') else 'user'}")
+
+
+def ssh_options(multiplex: bool = None, batch_mode: bool = False) -> List[str]:
+    """
+    Build ssh -o options for a multiplexed connection
+
+    Args:
+        multiplex: Enable ControlMaster (default: $RMTCMD_MULTIPLEX, on unless '0')
+        batch_mode: Add BatchMode=yes (never prompt for passwords)
+
+    Returns:
+        List of ssh command-line arguments
+    """
+    if multiplex is None:
+        multiplex = os.getenv('RMTCMD_MULTIPLEX', '1') != '0'
+
+    options = ['-o', f'ConnectTimeout={DEFAULT_CONNECT_TIMEOUT}']
+    if batch_mode:
+        options += ['-o', 'BatchMode=yes']
+
+    if multiplex:
+        control_dir = _default_control_dir()
+        try:
+            os.makedirs(control_dir, mode=0o700, exist_ok=True)
+        except OSError:
+            return options
+        persist = os.getenv('RMTCMD_CONTROL_PERSIST', str(DEFAULT_CONTROL_PERSIST))
+        options += [
+            '-o', 'ControlMaster=auto',
+            '-o', f'ControlPath={os.path.join(control_dir, "%C")}',
+            '-o', f'ControlPersist={persist}',
+        ]
+    return options
+
+
+class RemoteExecutor:
+    """Run commands locally or over a persistent multiplexed SSH connection"""
+
+    def __init__(self, ssh_target: str = None, multiplex: bool = None,
+                 batch_mode: bool = False, log_latency: bool = None):
+        """
+        Initialize the executor
+
+        Args:
+            ssh_target: SSH target 'user@host', or None to run commands locally
+            multiplex: Reuse one master SSH connection (default: on, $RMTCMD_MULTIPLEX=0 disables)
+            batch_mode: Never prompt for SSH passwords
+            log_latency: Print each command's latency to stderr (default: $RMTCMD_LOG_LATENCY)
+        """
+        self.ssh_target = ssh_target
+        self.ssh_options = ssh_options(multiplex, batch_mode) if ssh_target else []
+        if log_latency is None:
+            log_latency = os.getenv('RMTCMD_LOG_LATENCY', '') not in ('', '0')
+        self.log_latency = log_latency
+        self.latencies = []  # (label, seconds) per command
+        self._lock = threading.Lock()
+
+    @property
+    def is_remote(self) -> bool:
+        """True if commands run over SSH"""
+        return bool(self.ssh_target)
+
+    def build_command(self, command: Union[str, List[str]]) -> Union[str, List[str]]:
+        """
+        Build the argv (or shell string) that subprocess will run
+
+        Args:
+            command: Shell command string or argv list
+
+        Returns:
+            ssh argv for remote targets, otherwise the command unchanged
+        """
+        if not self.ssh_target:
+            return command
+        remote_cmd = command if isinstance(command, str) else ' '.join(shlex.quote(c) for c in command)
+        return ['ssh'] + self.ssh_options + [self.ssh_target, remote_cmd]
+
+    def run(self, command: Union[str, List[str]], input_text: str = None,
+            timeout: int = 60, label: str = None) -> subprocess.CompletedProcess:
+        """
+        Run a command and record its latency
+
+        Args:
+            command: Shell command string or argv list (strings run through a shell)
+            input_text: Optional text passed via stdin
+            timeout: Command timeout in seconds
+            label: Short name used in latency output (default: first word of command)
+
+        Returns:
+            subprocess.CompletedProcess with bytes stdout/stderr
+
+        Raises:
+            subprocess.TimeoutExpired: If the command times out
+            OSError: If the command cannot be started
+        """
+        argv = self.build_command(command)
+        if label is None:
+            label = (command.split() or [''])[0] if isinstance(command, str) else command[0]
+
+        start = time.monotonic()
+        try:
+            return subprocess.run(
+                argv,
+                shell=isinstance(argv, str),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+                input=input_text.encode('utf-8') if input_text is not None else None
+            )
+        finally:
+            self._record(label, time.monotonic() - start)
+
+    def stream(self, command: Union[str, List[str]], input_text: str = None,
+               timeout: int = 60, label: str = None) -> Iterator[str]:
+        """
+        Run a command and yield its stdout lines as they arrive
+
+        Unlike run(), output is never buffered whole, so callers can parse
+        rows while the command is still producing them.
+
+        Args:
+            command: Shell command string or argv list (strings run through a shell)
+            input_text: Optional text passed via stdin
+            timeout: Command timeout in seconds (the process is killed when it expires)
+            label: Short name used in latency output (default: first word of command)
+
+        Yields:
+            Decoded stdout lines (with trailing newline)
+
+        Raises:
+            TimeoutError: If the command times out
+            RuntimeError: If the command exits nonzero (raised after the last line)
+            OSError: If the command cannot be started
+        """
+        argv = self.build_command(command)
+        if label is None:
+            label = (command.split() or [''])[0] if isinstance(command, str) else command[0]
+
+        start = time.monotonic()
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(
+                argv,
+                shell=isinstance(argv, str),
+                stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                # Own process group for local commands (ssh keeps the terminal for password prompts)
+                start_new_session=os.name == 'posix' and not self.ssh_target,
+            )
+        except OSError:
+            stderr_file.close()
+            self._record(label, time.monotonic() - start)
+            raise
+
+        timed_out = threading.Event()
+
+        def kill():
+            # Kill the whole process group: a shell's children would keep stdout open
+            if not self.ssh_target and hasattr(os, 'killpg'):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    return
+                except OSError:
+                    pass
+            proc.kill()
+
+        def expire():
+            timed_out.set()
+            kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+
+        if input_text is not None:
+            # Feed stdin from a thread so a large result cannot deadlock the pipe
+            def feed():
+                try:
+                    proc.stdin.write(input_text.encode('utf-8'))
+                    proc.stdin.close()
+                except OSError:
+                    pass
+            threading.Thread(target=feed, daemon=True).start()
+
+        try:
+            for raw in proc.stdout:
+                yield raw.decode('utf-8', errors='replace')
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                kill()
+                proc.wait()
+            proc.stdout.close()
+            self._record(label, time.monotonic() - start)
+
+        try:
+            if timed_out.is_set():
+                raise TimeoutError(f"{label} timed out after {timeout} seconds")
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                error = stderr_file.read().decode('utf-8', errors='replace').strip()
+                raise RuntimeError(f"{label} failed (exit {proc.returncode}): {error}")
+        finally:
+            stderr_file.close()
+
+    def _record(self, label: str, elapsed: float):
+        """Record one command's latency (and print it if enabled)."""
+        with self._lock:
+            self.latencies.append((label, elapsed))
+            count = len(self.latencies)
+        if self.log_latency:
+            where = self.ssh_target or 'local'
+            print(f"[{label} #{count}] {elapsed:.2f}s ({where})", file=sys.stderr)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get latency statistics
+
+        Returns:
+            Dictionary: {'commands': n, 'total': s, 'avg': s, 'max': s, 'first': s}
+        """
+        with self._lock:
+            times = [t for _, t in self.latencies]
+        if not times:
+            return {'commands': 0, 'total': 0.0, 'avg': 0.0, 'max': 0.0, 'first': 0.0}
+        return {
+            'commands': len(times),
+            'total': sum(times),
+            'avg': sum(times) / len(times),
+            'max': max(times),
+            'first': times[0],
+        }
+
+    def format_stats(self) -> str:
+        """Format latency statistics for display."""
+        s = self.stats()
+        return (f"{s['commands']} command(s), {s['total']:.2f}s total, "
+                f"avg {s['avg']:.2f}s, max {s['max']:.2f}s (first {s['first']:.2f}s)")
+
+    def close_master(self):
+        """Ask the SSH master connection to exit (otherwise it expires after ControlPersist)."""
+        if not self.ssh_target or 'ControlMaster=auto' not in self.ssh_options:
+            return
+        subprocess.run(['ssh'] + self.ssh_options + ['-O', 'exit', self.ssh_target],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+_executors: Dict[tuple, RemoteExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_remote_executor(ssh_target: Optional[str] = None, batch_mode: bool = False) -> RemoteExecutor:
+    """
+    Get the shared executor for a target, so latency stats cover every caller
+
+    Args:
+        ssh_target: SSH target 'user@host', or None for local execution
+        batch_mode: Never prompt for SSH passwords
+
+    Returns:
+        RemoteExecutor instance
+    """
+    key = (ssh_target, batch_mode)
+    with _executors_lock:
+        if key not in _executors:
+            _executors[key] = RemoteExecutor(ssh_target, batch_mode=batch_mode)
+        return _executors[key]
@@ -3,8 +3,9 @@ Report generation functionality for account data
 """
 
 import re
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, List, Dict, Any
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
 
 from .models import VALID_VERIFICATION_STATUSES
 
@@ -23,6 +24,31 @@ def _sort_fi_ids(fi_ids) -> list:
 if TYPE_CHECKING:
     from .models import AccountManager
 
+# Coverage counters for the summary report: name -> SQL condition (all computed in one pass)
+SUMMARY_COUNTERS = {
+    'with_first_name': "first_name IS NOT NULL",
+    'with_last_name': "last_name IS NOT NULL",
+    'with_both_names': "first_name IS NOT NULL AND last_name IS NOT NULL",
+    'with_veritas': "veritas_email IS NOT NULL",
+    'with_cohesity': "cohesity_email IS NOT NULL",
+    'with_community': "community_account IS NOT NULL",
+    'with_jira': "jira_account IS NOT NULL",
+    'with_notes': "notes IS NOT NULL AND notes != ''",
+}
+
+# Fields whose absence (NULL) puts an account in the missing-fields report
+MISSING_FIELD_LABELS = [
+    ('first_name', 'First Name'),
+    ('last_name', 'Last Name'),
+    ('veritas_email', 'Veritas Email'),
+    ('cohesity_email', 'Cohesity Email'),
+    ('community_account', 'Community Account'),
+    ('jira_account', 'Jira Account'),
+]
+
+# Report types rendered by 'report all'
+ALL_REPORT_TYPES = ['summary', 'verification', 'missing-fields', 'full']
+
 
 class ReportGenerator:
     """Generates various reports from account data"""
@@ -35,6 +61,92 @@ class ReportGenerator:
             account_manager: AccountManager instance
         """
         self.am = account_manager
+        self._snapshot = None  # {'accounts': [...], 'stats': {...}} while a snapshot is active
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Share one read of the accounts table across several reports
+
+        Inside the block, the account rows and summary statistics are each
+        read at most once and reused by every report.
+
+        Usage:
+            with report_gen.snapshot():
+                print(report_gen.generate_report('summary'))
+                print(report_gen.generate_report('verification'))
+        """
+        outer = self._snapshot
+        if outer is None:
+            self._snapshot = {}
+        try:
+            yield self
+        finally:
+            self._snapshot = outer
+
+    def _accounts(self) -> List[Dict[str, Any]]:
+        """All accounts ordered by etrack_user_id (from the active snapshot if any)."""
+        if self._snapshot is None:
+            return self.am.get_all_accounts()
+        if 'accounts' not in self._snapshot:
+            self._snapshot['accounts'] = self.am.get_all_accounts()
+        return self._snapshot['accounts']
+
+    def summary_stats(self) -> Dict[str, Any]:
+        """
+        Compute summary counters and the verification breakdown in one aggregate query
+
+        Returns:
+            Dictionary: {'total': n, <SUMMARY_COUNTERS keys>: n, 'manually_verified': n,
+                         'verification': {status: n}}
+        """
+        if self._snapshot is not None and 'stats' in self._snapshot:
+            return self._snapshot['stats']
+
+        statuses = sorted(VALID_VERIFICATION_STATUSES)
+        columns = ["COUNT(*)"]
+        columns += [f"COALESCE(SUM(CASE WHEN {cond} THEN 1 ELSE 0 END), 0)"
+                    for cond in SUMMARY_COUNTERS.values()]
+        columns += ["COALESCE(SUM(CASE WHEN COALESCE(manual_verified, 'no') = ? THEN 1 ELSE 0 END), 0)"
+                    for _ in statuses]
+        self.am.cursor.execute(f"SELECT {', '.join(columns)} FROM accounts", statuses)
+        row = list(self.am.cursor.fetchone())
+
+        stats = {'total': row[0]}
+        stats.update(zip(SUMMARY_COUNTERS, row[1:1 + len(SUMMARY_COUNTERS)]))
+        stats['verification'] = dict(zip(statuses, row[1 + len(SUMMARY_COUNTERS):]))
+        stats['manually_verified'] = stats['verification']['yes']
+
+        if self._snapshot is not None:
+            self._snapshot['stats'] = stats
+        return stats
+
+    def generate_reports(self, report_types: List[str], show_notes: bool = False) -> str:
+        """
+        Generate several reports from one shared snapshot
+
+        Args:
+            report_types: Report types (generate_report types plus 'compact', 'markdown';
+                          'all' expands to ALL_REPORT_TYPES)
+            show_notes: If True, include notes in the report output
+
+        Returns:
+            Reports joined by blank lines
+        """
+        types = []
+        for report_type in report_types:
+            types.extend(ALL_REPORT_TYPES if report_type == 'all' else [report_type])
+
+        with self.snapshot():
+            outputs = []
+            for report_type in types:
+                if report_type == 'compact':
+                    outputs.append(self.generate_compact_table(show_notes=show_notes))
+                elif report_type == 'markdown':
+                    outputs.append(self.generate_markdown_table(show_notes=show_notes))
+                else:
+                    outputs.append(self.generate_report(report_type, show_notes=show_notes))
+        return "\n\n".join(outputs)
 
     def generate_report(self, report_type: str = 'full', show_notes: bool = False) -> str:
         """
@@ -66,7 +178,7 @@ class ReportGenerator:
         Args:
             show_notes: If True, always show notes field (even if empty)
         """
-        accounts = self.am.get_all_accounts()
+        accounts = self._accounts()
 
         report = []
         report.append("=" * 100)
@@ -115,44 +227,18 @@ class ReportGenerator:
 
     def _generate_summary_report(self) -> str:
         """Generate a summary statistics report"""
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts")
-        total = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE first_name IS NOT NULL")
-        with_first_name = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE last_name IS NOT NULL")
-        with_last_name = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE first_name IS NOT NULL AND last_name IS NOT NULL")
-        with_both_names = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE veritas_email IS NOT NULL")
-        with_veritas = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE cohesity_email IS NOT NULL")
-        with_cohesity = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE community_account IS NOT NULL")
-        with_community = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE jira_account IS NOT NULL")
-        with_jira = self.am.cursor.fetchone()[0]
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE manual_verified = 'yes'")
-        manually_verified = self.am.cursor.fetchone()[0]
-
-        # Get breakdown by verification status
-        self.am.cursor.execute("""
-            SELECT COALESCE(manual_verified, 'no') as status, COUNT(*) as count
-            FROM accounts
-            GROUP BY COALESCE(manual_verified, 'no')
-            ORDER BY count DESC
-        """)
-        verification_breakdown = {row[0]: row[1] for row in self.am.cursor.fetchall()}
-
-        self.am.cursor.execute("SELECT COUNT(*) FROM accounts WHERE notes IS NOT NULL AND notes != ''")
-        with_notes = self.am.cursor.fetchone()[0]
+        stats = self.summary_stats()
+        total = stats['total']
+        with_first_name = stats['with_first_name']
+        with_last_name = stats['with_last_name']
+        with_both_names = stats['with_both_names']
+        with_veritas = stats['with_veritas']
+        with_cohesity = stats['with_cohesity']
+        with_community = stats['with_community']
+        with_jira = stats['with_jira']
+        manually_verified = stats['manually_verified']
+        verification_breakdown = stats['verification']
+        with_notes = stats['with_notes']
 
         report = []
         report.append("=" * 60)
@@ -197,7 +283,7 @@ class ReportGenerator:
 
     def _generate_verification_report(self) -> str:
         """Generate a report showing accounts grouped by verification status"""
-        accounts = self.am.get_all_accounts()
+        accounts = self._accounts()
 
         if not accounts:
             return "No accounts found"
@@ -268,18 +354,8 @@ class ReportGenerator:
         Args:
             show_notes: If True, show notes for each account
         """
-        self.am.cursor.execute("""
-            SELECT * FROM accounts
-            WHERE first_name IS NULL
-               OR last_name IS NULL
-               OR veritas_email IS NULL
-               OR cohesity_email IS NULL
-               OR community_account IS NULL
-               OR jira_account IS NULL
-            ORDER BY etrack_user_id
-        """)
-
-        accounts = [dict(row) for row in self.am.cursor.fetchall()]
+        accounts = [account for account in self._accounts()
+                    if any(account[field] is None for field, _ in MISSING_FIELD_LABELS)]
 
         report = []
         report.append("=" * 80)
@@ -291,19 +367,7 @@ class ReportGenerator:
         report.append("")
 
         for account in accounts:
-            missing = []
-            if not account.get('first_name'):
-                missing.append('First Name')
-            if not account.get('last_name'):
-                missing.append('Last Name')
-            if not account['veritas_email']:
-                missing.append('Veritas Email')
-            if not account['cohesity_email']:
-                missing.append('Cohesity Email')
-            if not account['community_account']:
-                missing.append('Community Account')
-            if not account['jira_account']:
-                missing.append('Jira Account')
+            missing = [label for field, label in MISSING_FIELD_LABELS if not account.get(field)]
 
             report.append(f"Etrack User ID: {account['etrack_user_id']}")
             report.append(f"  Missing: {', '.join(missing)}")
@@ -319,7 +383,7 @@ class ReportGenerator:
         Args:
             show_notes: If True, include a Notes column (truncated to 30 chars)
         """
-        accounts = self.am.get_all_accounts()
+        accounts = self._accounts()
 
         if not accounts:
             return "No accounts found"
@@ -394,7 +458,7 @@ class ReportGenerator:
         Args:
             show_notes: If True, include a Notes column (truncated to 25 chars)
         """
-        accounts = self.am.get_all_accounts()
+        accounts = self._accounts()
 
         if not accounts:
             return "No accounts found"
@@ -461,7 +525,7 @@ class ReportGenerator:
         Args:
             show_notes: If True, include a Notes column
         """
-        accounts = self.am.get_all_accounts()
+        accounts = self._accounts()
 
         if not accounts:
             return "No accounts found"
@@ -737,19 +801,9 @@ class ReportGenerator:
         report.append("=" * 60)
         report.append("")
 
-        # Query for daily stats
-        self.am.cursor.execute("""
-            SELECT date(created_at) as day,
-                   action_type,
-                   status,
-                   COUNT(*) as count
-            FROM action_log
-            WHERE date(created_at) >= date('now', ?)
-            GROUP BY date(created_at), action_type, status
-            ORDER BY date(created_at) DESC, action_type
-        """, (f'-{days} days',))
-
-        rows = self.am.cursor.fetchall()
+        # Daily stats from the live log plus rollups of archived entries
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+        rows = self.am.get_daily_action_counts(since)
 
         if not rows:
             report.append("No activity in this period.")
@@ -788,35 +842,52 @@ class ReportGenerator:
 
         return "\n".join(report)
 
-    def generate_target_history_report(self, target_type: str, target_id: str) -> str:
+    def generate_target_history_report(self, target_type: str, target_id: str,
+                                       limit: Optional[int] = 100) -> str:
         """
         Generate history of actions for a specific target
 
         Args:
             target_type: Type of target ('account', 'fi', 'etrack')
             target_id: ID of target
+            limit: Maximum number of actions (None = all)
 
         Returns:
             Formatted history report
         """
-        actions = self.am.get_action_log(
-            limit=100,
-            target_type=target_type,
-            target_id=target_id
-        )
+        return "\n".join(self.iter_target_history_report(target_type, target_id, limit=limit))
 
-        report = []
-        report.append("=" * 80)
-        report.append(f"ACTION HISTORY: {target_type}={target_id}")
-        report.append("=" * 80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total Actions: {len(actions)}")
-        report.append("=" * 80)
-        report.append("")
+    def iter_target_history_report(self, target_type: str, target_id: str,
+                                   limit: Optional[int] = None) -> Iterator[str]:
+        """
+        Lazily yield the lines of a target's action history report
 
-        if not actions:
-            report.append("No actions found for this target.")
-            return "\n".join(report)
+        Actions are read with the keyset iterator, so the full history of a
+        busy target prints in constant memory.
+
+        Args:
+            target_type: Type of target ('account', 'fi', 'etrack')
+            target_id: ID of target
+            limit: Maximum number of actions (None = all)
+
+        Yields:
+            Report lines
+        """
+        total = self.am.count_action_log(target_type=target_type, target_id=target_id)
+        if limit is not None:
+            total = min(total, limit)
+
+        yield "=" * 80
+        yield f"ACTION HISTORY: {target_type}={target_id}"
+        yield "=" * 80
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        yield f"Total Actions: {total}"
+        yield "=" * 80
+        yield ""
+
+        if not total:
+            yield "No actions found for this target."
+            return
 
         status_symbols = {
             'success': '+',
@@ -825,18 +896,16 @@ class ReportGenerator:
             'dry_run': '~'
         }
 
-        for action in actions:
+        for action in self.am.iter_action_log(target_type=target_type, target_id=target_id, limit=limit):
             symbol = status_symbols.get(action['status'], '?')
             timestamp = action['created_at'][:19] if action['created_at'] else 'N/A'
 
-            report.append(f"{symbol} [{timestamp}] {action['action_type']} ({action['status']})")
+            yield f"{symbol} [{timestamp}] {action['action_type']} ({action['status']})"
             if action['old_value'] or action['new_value']:
-                report.append(f"    {action['old_value'] or '(none)'} -> {action['new_value'] or '(none)'}")
+                yield f"    {action['old_value'] or '(none)'} -> {action['new_value'] or '(none)'}"
             if action['details']:
-                report.append(f"    {action['details']}")
-            report.append("")
-
-        return "\n".join(report)
+                yield f"    {action['details']}"
+            yield ""
 
     @staticmethod
     def generate_fi_reassignment_report(mismatches: List[Dict[str, Any]],
@@ -39,6 +39,9 @@ from collections import defaultdict
 from dotenv import load_dotenv
 from prettytable import PrettyTable
 
+# On-disk Jira field list and parallel JQL pager (optional; see jira_common.py)
+from jira_common import JiraFieldIndex, iter_jql_pages
+
 # Load environment variables
 load_dotenv()
 
@@ -111,8 +114,8 @@ TYPE_SYMBOLS = {
     'Bug': '- ',
 }
 
-# Cache for field name to ID mapping
-_fields_by_name = None
+# Field name to ID mapping (refetched once when a name is missing)
+_field_index = None
 
 
 def _normalize_field_selector(value: str) -> str:
@@ -120,6 +123,17 @@ def _normalize_field_selector(value: str) -> str:
     return re.sub(r"\s+", " ", value.strip()).casefold()
 
 
+def _build_fields_by_name(fields: list) -> dict:
+    """Map normalized field display names to field IDs."""
+    fields_by_name = {}
+    for field in fields:
+        name = field.get("name")
+        field_id = field.get("id")
+        if isinstance(name, str) and isinstance(field_id, str):
+            fields_by_name[_normalize_field_selector(name)] = field_id
+    return fields_by_name
+
+
 def get_field_key_by_name(display_name: str) -> str:
     """Get Jira field ID by display name.
 
@@ -129,26 +143,22 @@ def get_field_key_by_name(display_name: str) -> str:
     Returns:
         Field ID (e.g., 'customfield_12345') or None if not found
     """
-    global _fields_by_name
+    global _field_index
 
-    if _fields_by_name is None:
-        try:
+    if _field_index is None:
+        def fetch():
             url = f'{JIRA_URL}/rest/api/2/field'
             response = requests.get(url, headers=headers, timeout=30)
             response.raise_for_status()
+            return response.json()
 
-            _fields_by_name = {}
-            for field in response.json():
-                name = field.get("name")
-                field_id = field.get("id")
-                if isinstance(name, str) and isinstance(field_id, str):
-                    _fields_by_name[_normalize_field_selector(name)] = field_id
-        except requests.exceptions.RequestException as e:
-            print(f"[WARN] Unable to fetch Jira fields: {e}", file=sys.stderr)
-            _fields_by_name = {}
-
-    return _fields_by_name.get(_normalize_field_selector(display_name))
+        _field_index = JiraFieldIndex(JIRA_URL, fetch, _normalize_field_selector, _build_fields_by_name)
 
+    try:
+        return _field_index.get(display_name)
+    except requests.exceptions.RequestException as e:
+        print(f"[WARN] Unable to fetch Jira fields: {e}", file=sys.stderr)
+        return None
 
 def _field_value_by_name(issue: dict, display_name: str):
     """Extract field value from issue using display name.
@@ -252,50 +262,51 @@ def _extract_display_value(value) -> str:
 
 
 def get_issues_by_jql(jql_query: str, max_results: int = 200) -> list:
-    """Fetch issues from Jira based on JQL query."""
+    """Fetch issues from Jira based on JQL query (pages after the first in parallel)."""
     url = f'{JIRA_URL}/rest/api/2/search'
 
-    # Use *all fields and expand=names for dynamic field discovery
-    params = {
-        'jql': jql_query,
-        'maxResults': max_results,
-        'fields': '*all',
-        'expand': 'names'
-    }
-
     # Retry with increasing timeouts
     timeouts = [60, 120, 180]
-    last_error = None
 
-    for attempt, timeout in enumerate(timeouts, 1):
-        try:
-            print(f"[INFO] Attempt {attempt}/{len(timeouts)} (timeout={timeout}s)...", file=sys.stderr)
-            response = requests.get(url, headers=headers, params=params, timeout=timeout)
-            response.raise_for_status()
-
-            result = response.json()
-            issues = result.get('issues', [])
-
-            # Inject names mapping into each issue for _field_value_by_name() compatibility
-            names = result.get('names')
-            if names:
-                for issue in issues:
-                    issue['names'] = names
-
-            print(f"[INFO] Fetched {len(issues)} issues from Jira", file=sys.stderr)
-            return issues
+    def fetch_page(start_at, page_size):
+        # Use *all fields and expand=names for dynamic field discovery
+        params = {
+            'jql': jql_query,
+            'startAt': start_at,
+            'maxResults': page_size,
+            'fields': '*all',
+            'expand': 'names'
+        }
+        for attempt, timeout in enumerate(timeouts, 1):
+            try:
+                response = requests.get(url, headers=headers, params=params, timeout=timeout)
+                response.raise_for_status()
+                return response.json()
+            except requests.exceptions.Timeout:
+                if attempt == len(timeouts):
+                    raise
+                print(f"[WARN] Request timed out (startAt={start_at}), retrying "
+                      f"(attempt {attempt + 1}/{len(timeouts)}, timeout={timeouts[attempt]}s)...", file=sys.stderr)
+
+    issues = []
+    names = None
+    try:
+        for page in iter_jql_pages(fetch_page, max_results):
+            issues.extend(page.get('issues', []))
+            names = names or page.get('names')
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching issues from Jira: {e}", file=sys.stderr)
+        sys.exit(1)
+    if max_results:
+        issues = issues[:max_results]
 
-        except requests.exceptions.Timeout as e:
-            last_error = e
-            if attempt < len(timeouts):
-                print(f"[WARN] Request timed out, retrying...", file=sys.stderr)
-            continue
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching issues from Jira: {e}", file=sys.stderr)
-            sys.exit(1)
+    # Inject names mapping into each issue for _field_value_by_name() compatibility
+    if names:
+        for issue in issues:
+            issue['names'] = names
 
-    print(f"Error fetching issues from Jira: {last_error}", file=sys.stderr)
-    sys.exit(1)
+    print(f"[INFO] Fetched {len(issues)} issues from Jira", file=sys.stderr)
+    return issues
 
 
 def get_issue_key_with_type(issue: dict, for_board: bool = True, priority: str = None) -> str:
@@ -634,7 +645,7 @@ Environment Variables:
         '--max-results',
         type=int,
         default=200,
-        help='Maximum number of results to fetch (default: 200)'
+        help='Maximum number of results to fetch (default: 200, 0 = all)'
     )
 
     args = parser.parse_args()
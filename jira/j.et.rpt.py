@@ -28,6 +28,7 @@ Dependencies:
 Environment Variables:
     JIRA_SERVER_NAME    Jira server hostname (e.g., company.atlassian.net)
     JIRA_ACC_TOKEN      Jira API Bearer token
+    JIRA_ISSUE_CACHE_DB Persistent issue cache file (default: ~/.cache/account_manager/jira_issue_cache.db)
 """
 
 import os
@@ -43,6 +44,7 @@ else:
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
+import io
 import json
 import csv
 import argparse
@@ -50,6 +52,7 @@ import time
 import shutil
 import sqlite3
 import subprocess
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
@@ -76,6 +79,28 @@ try:
 except ImportError:
     pass  # dotenv is optional
 
+# Persistent issue cache, multiplexed esql transport and esql output parser
+# shared with account_manager (optional)
+try:
+    from account_manager.issue_cache import IssueCache
+    from account_manager.remote_exec import get_remote_executor
+    from account_manager.esql_parser import EsqlOutputParser
+except ImportError:
+    _workspace_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _workspace_root not in sys.path:
+        sys.path.insert(0, _workspace_root)
+    try:
+        from account_manager.issue_cache import IssueCache
+        from account_manager.remote_exec import get_remote_executor
+        from account_manager.esql_parser import EsqlOutputParser
+    except ImportError:
+        IssueCache = None
+        get_remote_executor = None
+        EsqlOutputParser = None
+
+# On-disk Jira field list and parallel JQL pager (optional; see jira_common.py)
+from jira_common import JiraFieldIndex, iter_jql_pages
+
 # ============================================================================
 # Terminal Colors
 # ============================================================================
@@ -289,7 +314,8 @@ class JiraReportClient:
     """Client for fetching Jira issues in bulk"""
 
     def __init__(self, jira_url: str = None, api_token: str = None,
-                 batch_size: int = DEFAULT_BATCH_SIZE, timeout: int = DEFAULT_TIMEOUT):
+                 batch_size: int = DEFAULT_BATCH_SIZE, timeout: int = DEFAULT_TIMEOUT,
+                 issue_cache=None):
         self.jira_url = jira_url or JIRA_URL
         self.api_token = api_token or JIRA_API_TOKEN
         self.batch_size = batch_size
@@ -300,9 +326,17 @@ class JiraReportClient:
         }
         self.api_calls = 0
         self.total_time = 0
+        self._stats_lock = threading.Lock()  # api_calls is also counted from pager/cache threads
 
-        # Cache for field metadata
+        # Cache for field metadata (and its name -> id index)
         self._field_cache = None
+        self._field_cache_source = None  # field list _field_cache was built from
+        # Name -> field ID (case-insensitive, trailing colon ignored), refetched once on a miss
+        self._field_index = JiraFieldIndex(self.jira_url, self._fetch_fields,
+                                           lambda name: name.lower().strip().rstrip(':'))
+
+        # Optional persistent IssueCache for fetch_issues_by_keys()
+        self.issue_cache = issue_cache
 
     def get_all_fields(self) -> Dict[str, Dict]:
         """
@@ -311,33 +345,47 @@ class JiraReportClient:
         Returns:
             Dictionary mapping field_id to field metadata
         """
-        if self._field_cache:
+        try:
+            fields = self._field_index.all_fields()
+        except RuntimeError as e:
+            print(f"Warning: {e}")
+            return {}
+        except Exception as e:
+            print(f"Warning: Error fetching field metadata: {e}")
+            return {}
+        if self._field_cache and self._field_cache_source is fields:
             return self._field_cache
 
+        self._field_cache_source = fields
+        self._field_cache = {
+            f['id']: {
+                'name': f.get('name', f['id']),
+                'type': f.get('schema', {}).get('type', 'string'),
+                'custom': f.get('custom', False),
+                'schema': f.get('schema', {})
+            }
+            for f in fields
+        }
+        return self._field_cache
+
+    def _fetch_fields(self) -> List[Dict]:
+        """Download the Jira field list (used through the field cache)."""
+        url = f'{self.jira_url}/rest/api/2/field'
+        response = requests.get(url, headers=self.headers, timeout=self.timeout)
+        self._count_api_call()
+        if response.status_code != 200:
+            raise RuntimeError(f"Could not fetch field metadata: {response.status_code}")
+        return response.json()
+
+    def _field_id_by_name(self, name: str) -> Optional[str]:
+        """Find a field ID by display name (case-insensitive, trailing colon ignored)."""
+        if not self.get_all_fields():
+            return None
         try:
-            url = f'{self.jira_url}/rest/api/2/field'
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            self.api_calls += 1
-
-            if response.status_code == 200:
-                fields = response.json()
-                self._field_cache = {
-                    f['id']: {
-                        'name': f.get('name', f['id']),
-                        'type': f.get('schema', {}).get('type', 'string'),
-                        'custom': f.get('custom', False),
-                        'schema': f.get('schema', {})
-                    }
-                    for f in fields
-                }
-                return self._field_cache
-            else:
-                print(f"Warning: Could not fetch field metadata: {response.status_code}")
-                return {}
-
+            return self._field_index.get(name)
         except Exception as e:
             print(f"Warning: Error fetching field metadata: {e}")
-            return {}
+            return None
 
     def resolve_field_name(self, field: str) -> Tuple[str, str]:
         """
@@ -357,20 +405,8 @@ class JiraReportClient:
         elif field.startswith('customfield_'):
             field_id = field
         else:
-            # Try to find field by name in Jira API
-            all_fields = self.get_all_fields()
-            field_id = None
-
-            # Search by exact name match (case-insensitive)
-            field_name_lower = field.lower().strip()
-            for fid, fmeta in all_fields.items():
-                if fmeta.get('name', '').lower().strip() == field_name_lower:
-                    field_id = fid
-                    break
-                # Also check without trailing colon (e.g., "Case FIs:" -> "Case FIs")
-                if fmeta.get('name', '').lower().strip().rstrip(':') == field_name_lower.rstrip(':'):
-                    field_id = fid
-                    break
+            # Find field by name in Jira API (case-insensitive; "Case FIs:" matches "Case FIs")
+            field_id = self._field_id_by_name(field)
 
             # If still not found, use field as-is
             if not field_id:
@@ -412,6 +448,22 @@ class JiraReportClient:
             if field_id != 'key':  # key is always included
                 resolved_fields.append(field_id)
 
+        # Requests may overlap, so time the whole fetch rather than summing requests
+        start_time = time.time()
+
+        # Serve fresh issues from the persistent cache, revalidate stale ones
+        if self.issue_cache:
+            api_calls_before = self.api_calls
+            issues_by_key, failed = self.issue_cache.fetch(
+                issue_keys, resolved_fields, self._search, batch_size=self.batch_size)
+            self.total_time += time.time() - start_time
+            if failed:
+                print(f"\nWarning: {len(failed)} issue(s) could not be fetched", file=sys.stderr)
+            if sys.stderr.isatty():
+                print(f"\rFetched {len(issues_by_key)} issues in {self.api_calls - api_calls_before} API calls "
+                      f"({self.issue_cache.format_stats()}).    ", file=sys.stderr)
+            return [issues_by_key[key] for key in dict.fromkeys(issue_keys) if key in issues_by_key]
+
         # Process in batches
         total_batches = (len(issue_keys) + self.batch_size - 1) // self.batch_size
 
@@ -424,6 +476,7 @@ class JiraReportClient:
 
             batch_issues = self._fetch_batch(batch, resolved_fields)
             all_issues.extend(batch_issues)
+        self.total_time += time.time() - start_time
 
         if sys.stderr.isatty():
             print(f"\rFetched {len(all_issues)} issues in {total_batches} API calls.    ", file=sys.stderr)
@@ -443,29 +496,40 @@ class JiraReportClient:
         """
         keys_str = ', '.join(issue_keys)
         jql = f'key in ({keys_str})'
+        return self._search(jql, fields, len(issue_keys)) or []
+
+    def _search(self, jql: str, fields: List[str], max_results: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run one JQL search request with retries.
+
+        Args:
+            jql: JQL query
+            fields: List of field IDs to fetch
+            max_results: Max issues to return
+
+        Returns:
+            List of issue data dictionaries, or None if the request failed
+        """
         url = f'{self.jira_url}/rest/api/2/search'
         params = {
             'jql': jql,
-            'maxResults': len(issue_keys),
+            'maxResults': max_results,
             'fields': ','.join(fields)
         }
 
         max_retries = 3
         for attempt in range(1, max_retries + 1):
-            start_time = time.time()
             try:
                 response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
-                self.api_calls += 1
-                self.total_time += time.time() - start_time
+                self._count_api_call()
 
                 if response.status_code == 200:
                     return response.json().get('issues', [])
                 else:
                     print(f"\nWarning: Batch fetch failed: {response.status_code} - {response.text[:200]}", file=sys.stderr)
-                    return []
+                    return None
 
             except Exception as e:
-                self.total_time += time.time() - start_time
                 if attempt < max_retries:
                     wait = 2 ** attempt
                     print(f"\nError fetching batch (attempt {attempt}/{max_retries}): {e}", file=sys.stderr)
@@ -473,15 +537,18 @@ class JiraReportClient:
                     time.sleep(wait)
                 else:
                     print(f"\nError fetching batch: {e}", file=sys.stderr)
-                    return []
+                    return None
 
-        return []  # unreachable but satisfies linter
+        return None  # unreachable but satisfies linter
 
     def fetch_issues_by_jql(self, jql: str, fields: List[str] = None,
                             max_results: int = DEFAULT_MAX_RESULTS) -> List[Dict[str, Any]]:
         """
         Fetch issues matching a JQL query.
 
+        The first page gives the total; the remaining pages are fetched in
+        parallel ($JIRA_BATCH_WORKERS) and returned in result order.
+
         Args:
             jql: JQL query string
             fields: List of field IDs to fetch
@@ -500,69 +567,59 @@ class JiraReportClient:
             if field_id != 'key':
                 resolved_fields.append(field_id)
 
-        start_at = 0
-        batch_num = 0
-
-        while start_at < max_results:
-            batch_num += 1
-            if sys.stderr.isatty():
-                print(f"\rFetching page {batch_num}...", end='', file=sys.stderr)
-
-            try:
-                start_time = time.time()
-                url = f'{self.jira_url}/rest/api/2/search'
-                params = {
-                    'jql': jql,
-                    'startAt': start_at,
-                    'maxResults': min(self.batch_size, max_results - start_at),
-                    'fields': ','.join(resolved_fields)
-                }
-
-                max_retries = 3
-                response = None
-                for attempt in range(1, max_retries + 1):
-                    req_start = time.time()
-                    try:
-                        response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
-                        self.api_calls += 1
-                        self.total_time += time.time() - req_start
-                        break
-                    except Exception as req_e:
-                        self.total_time += time.time() - req_start
-                        if attempt < max_retries:
-                            wait = 2 ** attempt
-                            print(f"\nError in JQL search (attempt {attempt}/{max_retries}): {req_e}", file=sys.stderr)
-                            print(f"Retrying in {wait}s...", file=sys.stderr)
-                            time.sleep(wait)
-                        else:
-                            raise
+        url = f'{self.jira_url}/rest/api/2/search'
 
-                if response is None:
+        def fetch_page(start_at: int, page_size: int) -> Dict[str, Any]:
+            params = {
+                'jql': jql,
+                'startAt': start_at,
+                'maxResults': page_size,
+                'fields': ','.join(resolved_fields)
+            }
+
+            max_retries = 3
+            for attempt in range(1, max_retries + 1):
+                try:
+                    response = requests.get(url, headers=self.headers, params=params, timeout=self.timeout)
+                    self._count_api_call()
                     break
+                except Exception as req_e:
+                    if attempt < max_retries:
+                        wait = 2 ** attempt
+                        print(f"\nError in JQL search (attempt {attempt}/{max_retries}): {req_e}", file=sys.stderr)
+                        print(f"Retrying in {wait}s...", file=sys.stderr)
+                        time.sleep(wait)
+                    else:
+                        raise
 
-                if response.status_code == 200:
-                    data = response.json()
-                    issues = data.get('issues', [])
-                    all_issues.extend(issues)
-
-                    total = data.get('total', 0)
-                    if len(issues) < self.batch_size or start_at + len(issues) >= total:
-                        break
-
-                    start_at += len(issues)
-                else:
-                    print(f"\nError: JQL search failed: {response.status_code} - {response.text[:200]}", file=sys.stderr)
-                    break
+            if response.status_code != 200:
+                raise RuntimeError(f"JQL search failed: {response.status_code} - {response.text[:200]}")
+            return response.json()
 
-            except Exception as e:
-                print(f"\nError in JQL search: {e}", file=sys.stderr)
-                break
+        batch_num = 0
+        start_time = time.time()  # Pages overlap, so time the whole loop
+        try:
+            for page in iter_jql_pages(fetch_page, max_results, self.batch_size):
+                batch_num += 1
+                all_issues.extend(page.get('issues', []))
+                if sys.stderr.isatty():
+                    print(f"\rFetching page {batch_num}...", end='', file=sys.stderr)
+        except RuntimeError as e:
+            print(f"\nError: {e}", file=sys.stderr)
+        except Exception as e:
+            print(f"\nError in JQL search: {e}", file=sys.stderr)
+        self.total_time += time.time() - start_time
 
         if sys.stderr.isatty():
             print(f"\rFetched {len(all_issues)} issues in {batch_num} API calls.    ", file=sys.stderr)
 
         return all_issues
 
+    def _count_api_call(self):
+        """Count one Jira request (thread-safe)"""
+        with self._stats_lock:
+            self.api_calls += 1
+
     def get_stats(self) -> Dict[str, Any]:
         """Get API usage statistics"""
         return {
@@ -628,42 +685,69 @@ class EtrackClient:
         Returns:
             Raw output from esql
         """
-        if RMTCMD_HOST and not self.esql_local:
-            # Execute via SSH
-            cmd = f"ssh {RMTCMD_HOST} esql"
+        remote = RMTCMD_HOST if RMTCMD_HOST and not self.esql_local else None
+
+        if get_remote_executor:
+            # Reuse one multiplexed SSH connection for every query
+            result = get_remote_executor(remote).run('esql', input_text=query, timeout=timeout, label='esql')
         else:
-            cmd = "esql"
-
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=timeout,
-            input=query.encode('utf-8')
-        )
+            cmd = f"ssh {remote} esql" if remote else "esql"
+            result = subprocess.run(
+                cmd,
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+                input=query.encode('utf-8')
+            )
 
         if result.returncode != 0:
             raise RuntimeError(f"esql failed: {result.stderr.decode('utf-8', errors='replace')[:200]}")
 
         return result.stdout.decode('utf-8', errors='replace')
 
-    def _parse_esql_output(self, output: str, fields: List[str]) -> Dict[str, Dict[str, str]]:
+    def _stream_esql(self, query: str, timeout: int = 120):
+        """
+        Execute esql query via stdin and yield output lines as they arrive.
+
+        Args:
+            query: SQL query string
+            timeout: Command timeout in seconds
+
+        Returns:
+            Iterator of raw output lines
+        """
+        if not get_remote_executor:
+            return iter(self._execute_esql(query, timeout).splitlines())
+        remote = RMTCMD_HOST if RMTCMD_HOST and not self.esql_local else None
+        return get_remote_executor(remote).stream('esql', input_text=query, timeout=timeout, label='esql')
+
+    def _parse_esql_output(self, output, fields: List[str]) -> Dict[str, Dict[str, str]]:
         """
         Parse esql output into dictionary of incident data.
 
         Handles both tab-separated and pipe-delimited (PrettyTable) formats.
+        Lines are consumed one at a time, so a streamed pipe is parsed while
+        esql is still writing it.
 
         Args:
-            output: Raw esql output
+            output: Raw esql output, or any iterable of lines
             fields: List of field names in SELECT order
 
         Returns:
             Dict mapping incident_id -> {field: value}
         """
         results = {}
-        lines = output.strip().split('\n')
 
+        if EsqlOutputParser:
+            # Format detected once; columns mapped by header name
+            for record in EsqlOutputParser(fields).iter_records(output):
+                incident_id = normalize_incident_id(record.get(fields[0].lower(), ''))
+                if incident_id:
+                    results[incident_id] = {field.lower(): record.get(field.lower(), '') for field in fields}
+            return results
+
+        lines = io.StringIO(output) if isinstance(output, str) else output
         for line in lines:
             line = line.strip()
             if not line:
@@ -782,11 +866,9 @@ class EtrackClient:
             start = time.time()
 
             try:
-                output = self._execute_esql(query)
+                batch_data = self._parse_esql_output(self._stream_esql(query), fields)
                 self.api_calls += 1
                 self.total_time += time.time() - start
-
-                batch_data = self._parse_esql_output(output, fields)
                 all_data.update(batch_data)
 
             except subprocess.TimeoutExpired:
@@ -3102,6 +3184,10 @@ Etrack Fields:
                              help=f'Max issues to fetch for JQL (default: {DEFAULT_MAX_RESULTS})')
     fetch_group.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT,
                              help=f'API timeout in seconds (default: {DEFAULT_TIMEOUT})')
+    fetch_group.add_argument('--no-cache', action='store_true',
+                             help='Do not use the persistent issue cache for -f/stdin/--from-incident keys')
+    fetch_group.add_argument('--refresh-cache', action='store_true',
+                             help='Ignore cached issues and re-fetch them (results are re-cached)')
 
     # Etrack integration
     etrack_group = parser.add_argument_group('Etrack Integration')
@@ -3499,9 +3585,17 @@ def main():
         sys.exit(1)
 
     # Create client
+    issue_cache = None
+    if IssueCache and not args.no_cache:
+        try:
+            issue_cache = IssueCache(refresh=args.refresh_cache)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Issue cache disabled: {e}", file=sys.stderr)
+
     client = JiraReportClient(
         batch_size=args.batch_size,
-        timeout=args.timeout
+        timeout=args.timeout,
+        issue_cache=issue_cache
     )
 
     # Handle --list-fields
@@ -3655,6 +3749,8 @@ def main():
         print(f"API calls: {stats['api_calls']}", file=sys.stderr)
         print(f"Total time: {stats['total_time']}s", file=sys.stderr)
         print(f"Avg time/call: {stats['avg_time']}s", file=sys.stderr)
+        if client.issue_cache:
+            print(f"Issue cache: {client.issue_cache.format_stats()}", file=sys.stderr)
 
 
 if __name__ == '__main__':
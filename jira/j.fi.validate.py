@@ -91,6 +91,9 @@ try:
 except ImportError:
     tabulate = None
 
+# Shared keep-alive transport (optional; see jira_common.py)
+from jira_common import ResilientTransport, send_request
+
 
 # ---------------------------------------------------------------------------
 # Configuration and Constants
@@ -161,10 +164,10 @@ class JiraClient:
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json',
-            'Connection': 'close',
         }
         self._field_cache: Optional[Dict[str, Dict]] = None
         self._user_groups_cache: Dict[str, List[str]] = {}  # username -> groups
+        self.transport = ResilientTransport() if ResilientTransport else None
 
     def _is_transient_error(self, exc: Exception) -> bool:
         """Check if error is transient and retryable."""
@@ -184,12 +187,9 @@ class JiraClient:
         last_exc = None
 
         for attempt in range(1, max_retries + 1):
-            session = requests.Session()
             try:
-                if method.upper() == 'GET':
-                    response = session.get(url, headers=self.headers, params=params, timeout=self.timeout)
-                else:
-                    response = session.request(method, url, headers=self.headers, params=params, timeout=self.timeout)
+                response = send_request(self.transport, method, url, headers=self.headers,
+                                        params=params, timeout=self.timeout)
 
                 if response.status_code in retryable_http and attempt < max_retries:
                     wait = min(2 ** attempt, 30)
@@ -223,9 +223,6 @@ class JiraClient:
                     continue
                 raise
 
-            finally:
-                session.close()
-
         if last_exc:
             raise last_exc
         raise RuntimeError(f"{operation} failed after retries")
@@ -9,10 +9,13 @@ Features:
 - Show latest comments via --show-comments
 - Show arbitrary fields via --show-field
 - Show raw Jira JSON via --verbose
+- Batch mode via --batch FILE (or - for stdin): one JSON line per issue, with
+  issues, linked FI statuses, remote links and etracks fetched in bulk
 
 Environment variables expected:
 - JIRA_SERVER_NAME
 - JIRA_ACC_TOKEN
+- JIRA_BATCH_WORKERS (optional, concurrent requests in --batch mode, default: 4)
 """
 
 import argparse
@@ -23,6 +26,7 @@ import re
 import sys
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -44,6 +48,21 @@ try:
 except ImportError:  # pragma: no cover
     tabulate = None
 
+# Persistent issue cache shared with account_manager (optional)
+try:
+    from account_manager.issue_cache import IssueCache
+except ImportError:  # pragma: no cover
+    _workspace_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _workspace_root not in sys.path:
+        sys.path.insert(0, _workspace_root)
+    try:
+        from account_manager.issue_cache import IssueCache
+    except ImportError:
+        IssueCache = None
+
+# Shared keep-alive transport and on-disk Jira field list (optional; see jira_common.py)
+from jira_common import ResilientTransport, send_request, JiraFieldIndex, get_batch_workers
+
 
 # Header abbreviations for console output (saves horizontal space)
 # Maps full label name -> short abbreviation
@@ -79,6 +98,9 @@ HEADER_ABBREVIATIONS: Dict[str, str] = {
     "Root Causes": "RootCause",
 }
 
+# Issues per JQL "key in (...)" page in --batch mode
+BATCH_PAGE_SIZE = 50
+
 # Track which abbreviations are used during output (reset per run)
 _used_abbreviations: Set[str] = set()
 # Global flag to enable/disable abbreviations (set by --no-abbrev)
@@ -762,11 +784,8 @@ def _fetch_customer_field_issue_rows(
     return rows
 
 
-def _fetch_etrack_details(etrack_ids: List[str]) -> Dict[str, Dict[str, str]]:
-    details: Dict[str, Dict[str, str]] = {}
-    if not etrack_ids:
-        return details
-
+def _load_etrack_executor() -> Any:
+    """Import EtrackExecutor from account_manager (raises ImportError if unavailable)."""
     try:
         from account_manager.etrack_integration import EtrackExecutor
     except ImportError:
@@ -774,26 +793,58 @@ def _fetch_etrack_details(etrack_ids: List[str]) -> Dict[str, Dict[str, str]]:
         workspace_root = os.path.dirname(script_dir)
         if workspace_root not in sys.path:
             sys.path.insert(0, workspace_root)
+        from account_manager.etrack_integration import EtrackExecutor
+    return EtrackExecutor
+
+
+def _etrack_detail_from_info(info: Any) -> Dict[str, str]:
+    """Build an etrack details row from an EtrackInfo (or None when not found)."""
+    if not info:
+        return {
+            "state": "-",
+            "assignee": "-",
+            "severity": "-",
+            "priority": "-",
+            "version": "-",
+            "target_version": "-",
+            "component": "-",
+            "type": "-",
+            "type_warning": "",
+            "abstract": "No etrack details found",
+        }
 
-        try:
-            from account_manager.etrack_integration import EtrackExecutor
-        except ImportError as exc:
-            for et in etrack_ids:
-                details[et] = {
-                    "state": "-",
-                    "assignee": "-",
-                    "severity": "-",
-                    "priority": "-",
-                    "version": "-",
-                    "target_version": "-",
-                    "component": "-",
-                    "abstract": f"Etrack module unavailable: {exc}",
-                }
-            return details
+    abstract = (info.abstract or "-").strip()
+    if len(abstract) > 140:
+        abstract = abstract[:140] + "..."
+
+    # Check if type is SERVICE_REQUEST
+    et_type = info.type or "-"
+    type_warning = ""
+    if et_type != "-" and et_type.upper() != "SERVICE_REQUEST":
+        type_warning = f" [WARNING: Type is '{et_type}', expected SERVICE_REQUEST]"
+
+    return {
+        "state": info.state or "-",
+        "assignee": info.assignee or "-",
+        "severity": info.severity or "-",
+        "priority": info.priority or "-",
+        "version": info.version or "-",
+        "target_version": info.target_version or "-",
+        "component": info.component or "-",
+        "type": et_type,
+        "type_warning": type_warning,
+        "abstract": abstract,
+    }
+
+
+def _fetch_etrack_details(etrack_ids: List[str]) -> Dict[str, Dict[str, str]]:
+    details: Dict[str, Dict[str, str]] = {}
+    if not etrack_ids:
+        return details
 
     try:
-        executor = EtrackExecutor()
-    except RuntimeError as exc:
+        EtrackExecutor = _load_etrack_executor()
+    except ImportError as exc:
         for et in etrack_ids:
             details[et] = {
                 "state": "-",
@@ -803,36 +854,14 @@ def _fetch_etrack_details(etrack_ids: List[str]) -> Dict[str, Dict[str, str]]:
                 "version": "-",
                 "target_version": "-",
                 "component": "-",
-                "abstract": f"Unable to initialize Etrack executor: {exc}",
+                "abstract": f"Etrack module unavailable: {exc}",
             }
         return details
 
-    for et in etrack_ids:
-        info = executor.get_etrack_info(et)
-        if info:
-            abstract = (info.abstract or "-").strip()
-            if len(abstract) > 140:
-                abstract = abstract[:140] + "..."
-
-            # Check if type is SERVICE_REQUEST
-            et_type = info.type or "-"
-            type_warning = ""
-            if et_type != "-" and et_type.upper() != "SERVICE_REQUEST":
-                type_warning = f" [WARNING: Type is '{et_type}', expected SERVICE_REQUEST]"
-
-            details[et] = {
-                "state": info.state or "-",
-                "assignee": info.assignee or "-",
-                "severity": info.severity or "-",
-                "priority": info.priority or "-",
-                "version": info.version or "-",
-                "target_version": info.target_version or "-",
-                "component": info.component or "-",
-                "type": et_type,
-                "type_warning": type_warning,
-                "abstract": abstract,
-            }
-        else:
+    try:
+        executor = EtrackExecutor()
+    except RuntimeError as exc:
+        for et in etrack_ids:
             details[et] = {
                 "state": "-",
                 "assignee": "-",
@@ -841,14 +870,46 @@ def _fetch_etrack_details(etrack_ids: List[str]) -> Dict[str, Dict[str, str]]:
                 "version": "-",
                 "target_version": "-",
                 "component": "-",
-                "type": "-",
-                "type_warning": "",
-                "abstract": "No etrack details found",
+                "abstract": f"Unable to initialize Etrack executor: {exc}",
             }
+        return details
+
+    for et in etrack_ids:
+        details[et] = _etrack_detail_from_info(executor.get_etrack_info(et))
 
     return details
 
 
+def fetch_etrack_infos(etrack_ids: List[str], max_workers: int = 4, batch_size: int = 50) -> Dict[str, Any]:
+    """Fetch raw EtrackInfo for many incidents (library use, e.g. j.validateAndSyncFIs.py).
+
+    Incidents are queried ``batch_size`` at a time (one esql call per batch)
+    and the batches run concurrently over the shared etrack transport.
+
+    Args:
+        etrack_ids: Etrack incident IDs (duplicates are ignored)
+        max_workers: Concurrent esql batches
+        batch_size: Incidents per esql query
+
+    Returns:
+        Dict mapping incident ID to EtrackInfo, or None if not found
+
+    Raises:
+        ImportError: account_manager.etrack_integration is not available
+        RuntimeError: esql is not reachable (no local esql and no RMTCMD_HOST)
+    """
+    ids = list(dict.fromkeys(str(et) for et in etrack_ids))
+    if not ids:
+        return {}
+    executor = _load_etrack_executor()()
+    batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    found: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as pool:
+        for batch_result in pool.map(executor.get_etrack_info_batch, batches):
+            found.update(batch_result)
+    return {et: found.get(et) for et in ids}
+
+
 def _normalize_for_comparison(value: str) -> str:
     """Normalize a string for fuzzy comparison.
 
@@ -1143,13 +1204,17 @@ def _print_etrack_fi_comparison(
 
 
 class JiraClient:
-    def __init__(self):
+    STATUS_FIELDS = ["status", "resolution", "assignee", "priority", "updated"]
+
+    def __init__(self, issue_cache: Optional["IssueCache"] = None):
         load_dotenv()
         self.server = os.getenv("JIRA_SERVER_NAME")
         self.token = os.getenv("JIRA_ACC_TOKEN")
         self.base_url = f"https://{self.server}" if self.server else None
         self.timeout = 30
-        self._fields_by_name: Optional[Dict[str, str]] = None
+        # Field name -> ID index (refetched once when a name is missing)
+        self._field_index = JiraFieldIndex(self.base_url, self._fetch_fields,
+                                           _normalize_field_selector, _build_fields_by_name)
 
         if not self.base_url or not self.token:
             raise RuntimeError("Missing JIRA_SERVER_NAME or JIRA_ACC_TOKEN in environment")
@@ -1158,85 +1223,79 @@ class JiraClient:
             "Authorization": f"Bearer {self.token}",
             "Content-Type": "application/json",
         }
+        # Optional persistent cache for get_issue_status_batch()
+        self.issue_cache = issue_cache
+        self.transport = ResilientTransport() if ResilientTransport else None
 
     def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """GET with retry on transient network/TLS errors (exponential backoff).
 
-        Uses a fresh Session per attempt with ``Connection: close`` to avoid
-        stale keep-alive sockets — a common cause of
+        Requests share one keep-alive pool. Stale sockets — a common cause of
         ``[SSL: UNEXPECTED_EOF_WHILE_READING]`` on macOS (LibreSSL) talking to
-        Jira behind a load balancer that may drop idle TLS sessions.
+        Jira behind a load balancer that drops idle TLS sessions — are handled
+        by ResilientTransport (idle eviction, immediate reconnect, fresh-socket
+        fallback after repeated failures) before this backoff loop sees them.
         """
         max_retries = 5
         last_exc: Optional[Exception] = None
-        request_headers = dict(self.headers)
-        request_headers["Connection"] = "close"
 
         for attempt in range(1, max_retries + 1):
-            session = requests.Session()
             try:
-                try:
-                    response = session.get(
-                        url,
-                        headers=request_headers,
-                        params=params,
-                        timeout=self.timeout,
-                    )
-                except requests.exceptions.SSLError as exc:
-                    # Transient SSL/EOF errors — retry.
-                    msg = str(exc)
-                    is_transient_ssl = (
-                        "UNEXPECTED_EOF_WHILE_READING" in msg
-                        or "EOF occurred in violation of protocol" in msg
-                        or "SSLEOFError" in msg
-                        or "ConnectionResetError" in msg
-                        or "bad record mac" in msg.lower()
-                    )
-                    if is_transient_ssl and attempt < max_retries:
-                        last_exc = exc
-                        wait = min(2 ** attempt, 30)
-                        print(
-                            f"Transient SSL error calling Jira (attempt {attempt}/{max_retries}): {exc}. "
-                            f"Retrying in {wait}s...",
-                            file=sys.stderr,
-                        )
-                        time.sleep(wait)
-                        continue
-                    raise RuntimeError(
-                        f"TLS/SSL error while connecting to Jira ({self.server}). "
-                        f"Please check VPN/proxy/certificate setup. Details: {exc}"
-                    ) from exc
-                except (requests.exceptions.ConnectionError,
-                        requests.exceptions.Timeout,
-                        requests.exceptions.ChunkedEncodingError) as exc:
+                response = send_request(self.transport, "GET", url, headers=self.headers,
+                                        params=params, timeout=self.timeout)
+            except requests.exceptions.SSLError as exc:
+                # Transient SSL/EOF errors — retry.
+                msg = str(exc)
+                is_transient_ssl = (
+                    "UNEXPECTED_EOF_WHILE_READING" in msg
+                    or "EOF occurred in violation of protocol" in msg
+                    or "SSLEOFError" in msg
+                    or "ConnectionResetError" in msg
+                    or "bad record mac" in msg.lower()
+                )
+                if is_transient_ssl and attempt < max_retries:
                     last_exc = exc
-                    if attempt < max_retries:
-                        wait = min(2 ** attempt, 30)
-                        print(
-                            f"Network error calling Jira (attempt {attempt}/{max_retries}): {exc}. "
-                            f"Retrying in {wait}s...",
-                            file=sys.stderr,
-                        )
-                        time.sleep(wait)
-                        continue
-                    raise RuntimeError(f"Network error while calling Jira ({self.server}): {exc}") from exc
-                except requests.exceptions.RequestException as exc:
-                    raise RuntimeError(f"Network error while calling Jira ({self.server}): {exc}") from exc
-
-                # Retry on transient server-side errors as well.
-                if response.status_code in (429, 500, 502, 503, 504) and attempt < max_retries:
                     wait = min(2 ** attempt, 30)
                     print(
-                        f"Jira returned {response.status_code} (attempt {attempt}/{max_retries}). "
+                        f"Transient SSL error calling Jira (attempt {attempt}/{max_retries}): {exc}. "
                         f"Retrying in {wait}s...",
                         file=sys.stderr,
                     )
                     time.sleep(wait)
                     continue
+                raise RuntimeError(
+                    f"TLS/SSL error while connecting to Jira ({self.server}). "
+                    f"Please check VPN/proxy/certificate setup. Details: {exc}"
+                ) from exc
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as exc:
+                last_exc = exc
+                if attempt < max_retries:
+                    wait = min(2 ** attempt, 30)
+                    print(
+                        f"Network error calling Jira (attempt {attempt}/{max_retries}): {exc}. "
+                        f"Retrying in {wait}s...",
+                        file=sys.stderr,
+                    )
+                    time.sleep(wait)
+                    continue
+                raise RuntimeError(f"Network error while calling Jira ({self.server}): {exc}") from exc
+            except requests.exceptions.RequestException as exc:
+                raise RuntimeError(f"Network error while calling Jira ({self.server}): {exc}") from exc
 
-                return response
-            finally:
-                session.close()
+            # Retry on transient server-side errors as well.
+            if response.status_code in (429, 500, 502, 503, 504) and attempt < max_retries:
+                wait = min(2 ** attempt, 30)
+                print(
+                    f"Jira returned {response.status_code} (attempt {attempt}/{max_retries}). "
+                    f"Retrying in {wait}s...",
+                    file=sys.stderr,
+                )
+                time.sleep(wait)
+                continue
+
+            return response
 
         # Should not reach here, but keep a safe fallback.
         raise RuntimeError(
@@ -1272,46 +1331,43 @@ class JiraClient:
         return issues
 
     def get_field_key_by_name(self, display_name: str) -> Optional[str]:
-        if self._fields_by_name is None:
-            url = f"{self.base_url}/rest/api/2/field"
-            response = self._get(url)
-            if response.status_code != 200:
-                raise RuntimeError(
-                    f"Failed to fetch Jira fields: {response.status_code} {response.text[:400]}"
-                )
-
-            self._fields_by_name = {}
-            for field in response.json():
-                name = field.get("name")
-                field_id = field.get("id")
-                if isinstance(name, str) and isinstance(field_id, str):
-                    self._fields_by_name[_normalize_field_selector(name)] = field_id
+        return self._field_index.get(display_name)
 
-        return self._fields_by_name.get(_normalize_field_selector(display_name))
+    def _fetch_fields(self) -> List[Dict[str, Any]]:
+        url = f"{self.base_url}/rest/api/2/field"
+        response = self._get(url)
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch Jira fields: {response.status_code} {response.text[:400]}"
+            )
+        return response.json()
 
     def get_issue_status_batch(self, issue_keys: List[str]) -> Dict[str, Dict[str, str]]:
         if not issue_keys:
             return {}
 
         unique_keys = sorted(set(issue_keys))
-        jql = f"key in ({', '.join(unique_keys)})"
 
-        url = f"{self.base_url}/rest/api/2/search"
-        params = {
-            "jql": jql,
-            "maxResults": len(unique_keys),
-            "fields": "status,resolution,assignee,priority,updated",
-        }
+        if self.issue_cache:
+            errors: List[str] = []
 
-        response = self._get(url, params=params)
-        if response.status_code != 200:
-            raise RuntimeError(
-                f"Failed to fetch linked issue statuses: {response.status_code} {response.text[:400]}"
-            )
+            def search(jql: str, fields: List[str], max_results: int) -> Optional[List[Dict[str, Any]]]:
+                try:
+                    return self._search_status(jql, fields, max_results)
+                except RuntimeError as exc:
+                    errors.append(str(exc))
+                    return None
+
+            cached, failed = self.issue_cache.fetch(unique_keys, self.STATUS_FIELDS, search)
+            if failed:
+                raise RuntimeError(errors[0] if errors else "Failed to fetch linked issue statuses")
+            issues = list(cached.values())
+        else:
+            jql = f"key in ({', '.join(unique_keys)})"
+            issues = self._search_status(jql, self.STATUS_FIELDS, len(unique_keys))
 
-        payload = response.json()
         result: Dict[str, Dict[str, str]] = {}
-        for issue in payload.get("issues", []):
+        for issue in issues:
             fields = issue.get("fields", {})
             result[issue.get("key", "")] = {
                 "status": _opt_value(fields.get("status")),
@@ -1333,6 +1389,21 @@ class JiraClient:
 
         return result
 
+    def _search_status(self, jql: str, fields: List[str], max_results: int) -> List[Dict[str, Any]]:
+        url = f"{self.base_url}/rest/api/2/search"
+        params = {
+            "jql": jql,
+            "maxResults": max_results,
+            "fields": ",".join(fields),
+        }
+
+        response = self._get(url, params=params)
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Failed to fetch linked issue statuses: {response.status_code} {response.text[:400]}"
+            )
+        return response.json().get("issues", [])
+
     def get_remote_links(self, issue_key: str) -> List[Dict[str, Any]]:
         """Fetch remote links for a Jira issue (includes PR links, commit links, etc.)."""
         url = f"{self.base_url}/rest/api/2/issue/{issue_key}/remotelink"
@@ -2763,6 +2834,16 @@ def _normalize_field_selector(value: str) -> str:
     return re.sub(r"\s+", " ", value.strip()).casefold()
 
 
+def _build_fields_by_name(fields: List[Dict[str, Any]]) -> Dict[str, str]:
+    fields_by_name: Dict[str, str] = {}
+    for field in fields:
+        name = field.get("name")
+        field_id = field.get("id")
+        if isinstance(name, str) and isinstance(field_id, str):
+            fields_by_name[_normalize_field_selector(name)] = field_id
+    return fields_by_name
+
+
 def _split_field_selectors(raw_values: List[str]) -> List[str]:
     selectors: List[str] = []
     for raw in raw_values:
@@ -2871,6 +2952,7 @@ def _build_json_output(
     customer_field_issues_meta: Optional[Dict[str, Any]] = None,
     fuzzy_match: bool = False,
     etrack_validation_errors: Optional[List[str]] = None,
+    code_links: Optional[List[Dict[str, str]]] = None,
 ) -> Dict[str, Any]:
     payload: Dict[str, Any] = {
         "profile": profile_type,
@@ -2950,6 +3032,9 @@ def _build_json_output(
     if subtasks:
         payload["subtasks"] = subtasks
 
+    if code_links:
+        payload["code_links"] = code_links
+
     if include_timeline_section and timeline_context:
         payload["timeline_context"] = timeline_context
 
@@ -2973,6 +3058,313 @@ def _build_json_output(
     return payload
 
 
+def build_etrack_validation_payload(
+    issue: Dict[str, Any],
+    etrack_info: Optional[Dict[str, Dict[str, str]]],
+    jira_base_url: str = "",
+    fuzzy_match: bool = False,
+) -> Dict[str, Any]:
+    """Build the etrack part of ``-e --format json`` output for an already fetched issue.
+
+    Library entry point for j.validateAndSyncFIs.py: returns the profile,
+    summary, etrack_validation_errors, etrack_details and etrack_fi_mismatches
+    keys exactly as the CLI would, without fetching anything.
+
+    Args:
+        issue: Issue JSON (from get_issue or search_issues, with "names")
+        etrack_info: Etrack details keyed by incident ID (see _etrack_detail_from_info);
+                     None builds the summary only
+        jira_base_url: Base URL for the Jira Link row
+        fuzzy_match: Use fuzzy component matching
+
+    Returns:
+        JSON payload dict
+    """
+    issue_key = issue.get("key", "")
+    fields = issue.get("fields", {})
+    profile_type = _resolve_profile_type("auto", issue_key)
+    etrack_sources, etrack_validation_errors = _extract_etrack_ids_with_sources(issue)
+    etrack_ids = sorted(etrack_sources.keys(), key=int) if etrack_sources else []
+    summary_rows = _build_summary_rows(
+        issue_key,
+        fields,
+        (fields.get("comment") or {}).get("comments", []),
+        fields.get("attachment", []),
+        (fields.get("watches") or {}).get("watchCount", "-"),
+        _get_default_optional_fields(issue, profile_type, etrack_ids),
+        jira_base_url=jira_base_url,
+    )
+    show_etrack = etrack_info is not None
+    return _build_json_output(
+        profile_type, summary_rows, [], {}, [], None,
+        show_etrack, etrack_ids, etrack_info,
+        0, [], [], [], [], {}, False, {}, False, [], False,
+        fuzzy_match=fuzzy_match,
+        etrack_validation_errors=etrack_validation_errors if show_etrack else None,
+    )
+
+
+def _read_batch_keys(source: str) -> List[str]:
+    """Read issue keys (PROJECT-123) from a file or "-" (stdin), deduplicated in input order."""
+    if source == "-":
+        text = sys.stdin.read()
+    else:
+        with open(os.path.expanduser(source), "r", encoding="utf-8", errors="replace") as handle:
+            text = handle.read()
+    keys: List[str] = []
+    seen: Set[str] = set()
+    for match in re.findall(r"\b[A-Za-z][A-Za-z0-9_]*-\d+\b", text):
+        key = match.upper()
+        if key not in seen:
+            seen.add(key)
+            keys.append(key)
+    return keys
+
+
+def fetch_issues_bulk(
+    jira: JiraClient, issue_keys: List[str], max_workers: int = 4
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Fetch many issues with paged JQL ``key in (...)`` searches run concurrently.
+
+    A page whose search fails (one deleted key fails the whole query) or
+    that misses keys (moved issues) falls back to one GET per missing key.
+
+    Args:
+        jira: JiraClient instance
+        issue_keys: Issue keys (uppercase)
+        max_workers: Concurrent searches
+
+    Returns:
+        Tuple of (issues by requested key, error message by key)
+    """
+    def fetch_page(keys: List[str]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            jql = f"key in ({', '.join(keys)}) ORDER BY key ASC"
+            for issue in jira.search_issues(jql, max_results=len(keys)):
+                found[str(issue.get("key", "")).upper()] = issue
+        except RuntimeError:
+            pass
+
+        issues: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        for key in keys:
+            if key in found:
+                issues[key] = found[key]
+                continue
+            try:
+                issues[key] = jira.get_issue(key)
+            except RuntimeError as exc:
+                errors[key] = str(exc)
+        return issues, errors
+
+    pages = [issue_keys[i:i + BATCH_PAGE_SIZE] for i in range(0, len(issue_keys), BATCH_PAGE_SIZE)]
+    issues: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    if not pages:
+        return issues, errors
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pages)))) as pool:
+        for page_issues, page_errors in pool.map(fetch_page, pages):
+            issues.update(page_issues)
+            errors.update(page_errors)
+    return issues, errors
+
+
+def _fetch_etrack_details_bulk(etrack_ids: List[str], max_workers: int = 4) -> Dict[str, Dict[str, str]]:
+    """Etrack details for many incidents via batched esql (same rows as _fetch_etrack_details)."""
+    try:
+        infos = fetch_etrack_infos(etrack_ids, max_workers=max_workers)
+    except (ImportError, RuntimeError):
+        # Placeholder rows explaining why etrack is unavailable
+        return _fetch_etrack_details(etrack_ids)
+    return {et: _etrack_detail_from_info(info) for et, info in infos.items()}
+
+
+def _wants_etrack_details(args: argparse.Namespace, enabled_sections: Set[str]) -> bool:
+    return (
+        args.show_etrack_details
+        or args.mode in {"investigate", "ops"}
+        or (bool(args.sections.strip()) and "etrack" in enabled_sections)
+    )
+
+
+def _wants_code_links(profile_type: str, args: argparse.Namespace, enabled_sections: Set[str]) -> bool:
+    return (
+        profile_type == "pvm"
+        or args.mode in {"investigate", "ops"}
+        or (bool(args.sections.strip()) and "code-links" in enabled_sections)
+    )
+
+
+def _fetch_batch_extras(
+    jira: JiraClient, issue: Dict[str, Any], args: argparse.Namespace, enabled_sections: Set[str]
+) -> Dict[str, Any]:
+    """Per-issue requests of --batch mode: remote links, Epic children, customer field issues."""
+    issue_key = issue.get("key", "")
+    fields = issue.get("fields", {})
+    extras: Dict[str, Any] = {}
+
+    if _wants_code_links(_resolve_profile_type(args.issue_type, issue_key), args, enabled_sections):
+        extras["remote_links"] = jira.get_remote_links(issue_key)
+
+    issue_type_name = str((fields.get("issuetype") or {}).get("name", "")).strip().lower()
+    if args.sub_tasks and not _extract_subtasks(fields) and issue_type_name == "epic":
+        epic_key_escaped = _jql_escape(issue_key)
+        for epic_jql in [
+            f'"Epic Link" = "{epic_key_escaped}" ORDER BY key ASC',
+            f'parent = "{epic_key_escaped}" ORDER BY key ASC',
+        ]:
+            try:
+                epic_children = jira.search_issues(epic_jql, max_results=500)
+            except RuntimeError:
+                continue
+            if epic_children:
+                extras["epic_children"] = epic_children
+                break
+
+    if args.list_customer_field_issues or args.list_active_customer_field_issues:
+        active_only = bool(args.list_active_customer_field_issues)
+        customer_name = _extract_case_account_name(issue, fields)
+        meta: Dict[str, Any] = {"customer_name": customer_name or "-", "active_only": active_only}
+        rows: List[List[str]] = []
+        if customer_name:
+            try:
+                rows = _fetch_customer_field_issue_rows(jira, customer_name, active_only=active_only)
+            except RuntimeError as exc:
+                meta["error"] = str(exc)
+        extras["customer_field_issues"] = (rows, meta)
+
+    return extras
+
+
+def _build_batch_record(
+    jira: JiraClient,
+    issue: Dict[str, Any],
+    args: argparse.Namespace,
+    enabled_sections: Set[str],
+    linked_status_all: Dict[str, Dict[str, str]],
+    etrack_info_all: Dict[str, Dict[str, str]],
+    extras: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build one --batch record: the --format json payload of an issue, from prefetched data."""
+    issue_key = issue.get("key", "")
+    profile_type = _resolve_profile_type(args.issue_type, issue_key)
+    fields = issue.get("fields", {})
+    comments = (fields.get("comment") or {}).get("comments", [])
+    etrack_sources, etrack_validation_errors = _extract_etrack_ids_with_sources(issue)
+    etrack_ids = sorted(etrack_sources.keys(), key=int) if etrack_sources else []
+    show_etrack_requested = _wants_etrack_details(args, enabled_sections)
+
+    requested_fields = _split_field_selectors(args.show_field)
+    selected_field_rows = _get_selected_field_rows(issue, requested_fields) if requested_fields else []
+    if args.fields_only:
+        return {"key": issue_key, **{row[1]: row[2] for row in selected_field_rows}}
+
+    linked_fis = _extract_linked_fis(issue)
+    linked_status = {fi_key: linked_status_all.get(fi_key, {}) for fi_key in linked_fis} if linked_fis else None
+
+    etrack_info = None
+    if show_etrack_requested and etrack_ids:
+        etrack_info = {et: etrack_info_all.get(et, {}) for et in etrack_ids}
+
+    subtasks = _extract_subtasks(fields)
+    if extras.get("epic_children"):
+        subtasks = _extract_subtasks_from_issues(extras["epic_children"])
+
+    code_links = None
+    if "remote_links" in extras:
+        code_links = _extract_code_links(issue, extras["remote_links"])
+
+    customer_rows, customer_meta = extras.get("customer_field_issues", ([], {}))
+
+    summary_rows = _build_summary_rows(
+        issue_key,
+        fields,
+        comments,
+        fields.get("attachment", []),
+        (fields.get("watches") or {}).get("watchCount", "-"),
+        _get_default_optional_fields(issue, profile_type, etrack_ids),
+        jira_base_url=jira.base_url,
+    )
+    payload = _build_json_output(
+        profile_type,
+        summary_rows,
+        _extract_sfdc_case_links(issue),
+        _extract_current_status_and_next_steps(fields, comments),
+        linked_fis,
+        linked_status,
+        show_etrack_requested,
+        etrack_ids,
+        etrack_info,
+        args.show_comments,
+        comments,
+        requested_fields,
+        selected_field_rows,
+        subtasks if "subtasks" in enabled_sections else [],
+        _extract_timeline_context(issue),
+        "timeline" in enabled_sections,
+        _extract_rca_ca_context(issue),
+        "rca-ca" in enabled_sections,
+        field_issues_for_customer_rows=customer_rows,
+        include_field_issues_for_customer_section="customer-field-issues" in enabled_sections,
+        customer_field_issues_meta=customer_meta,
+        fuzzy_match=args.fuzzy_match,
+        etrack_validation_errors=etrack_validation_errors if show_etrack_requested else None,
+        code_links=code_links,
+    )
+    return {"key": issue_key, **payload}
+
+
+def _run_batch(jira: JiraClient, issue_keys: List[str], args: argparse.Namespace, enabled_sections: Set[str]) -> int:
+    """Print one JSON line per issue key (--batch mode). Returns exit code."""
+    workers = get_batch_workers(args.workers)
+    issues, errors = fetch_issues_bulk(jira, issue_keys, max_workers=workers)
+    fetched = [issues[key] for key in issue_keys if key in issues]
+
+    # Linked FI statuses for all issues (page by page)
+    linked_status_all: Dict[str, Dict[str, str]] = {}
+    if not args.fields_only:
+        linked_keys = sorted({fi_key for issue in fetched for fi_key in _extract_linked_fis(issue)})
+        for i in range(0, len(linked_keys), BATCH_PAGE_SIZE):
+            page = linked_keys[i:i + BATCH_PAGE_SIZE]
+            try:
+                linked_status_all.update(jira.get_issue_status_batch(page))
+            except RuntimeError as exc:
+                linked_status_all.update({fi_key: {"error": str(exc)} for fi_key in page})
+
+    # Every referenced etrack, resolved with batched esql queries
+    etrack_info_all: Dict[str, Dict[str, str]] = {}
+    if _wants_etrack_details(args, enabled_sections) and not args.fields_only:
+        etrack_ids: Set[str] = set()
+        for issue in fetched:
+            etrack_ids.update(_extract_etrack_ids_with_sources(issue)[0])
+        etrack_info_all = _fetch_etrack_details_bulk(sorted(etrack_ids, key=int), max_workers=workers)
+
+    # Remote links and other per-issue requests, concurrently
+    extras_by_key: Dict[str, Dict[str, Any]] = {}
+    if fetched and not args.fields_only:
+        with ThreadPoolExecutor(max_workers=min(workers, len(fetched))) as pool:
+            extras_list = pool.map(lambda issue: _fetch_batch_extras(jira, issue, args, enabled_sections), fetched)
+            for issue, extras in zip(fetched, extras_list):
+                extras_by_key[issue.get("key", "")] = extras
+
+    for key in issue_keys:
+        if key in errors:
+            record: Dict[str, Any] = {"key": key, "error": errors[key]}
+        else:
+            issue = issues[key]
+            record = _build_batch_record(
+                jira, issue, args, enabled_sections,
+                linked_status_all, etrack_info_all, extras_by_key.get(issue.get("key", ""), {}),
+            )
+        print(json.dumps(record, ensure_ascii=False))
+
+    if errors:
+        print(f"{len(errors)} of {len(issue_keys)} issue(s) could not be fetched", file=sys.stderr)
+        return 1
+    return 0
+
+
 def _resolve_enabled_sections(mode: str, raw_sections: str) -> Set[str]:
     available_sections = {
         "summary",
@@ -3022,10 +3414,11 @@ def main() -> int:
             "[-E|--show-empty] [-l|--long-text-style {paragraph,wrapped,raw}] "
             "[-w|--wrap-width WRAP_WIDTH] [-d|--desc {none,short,mid,full}] "
             "[-v|--verbose] [-i|--include-empty-customfields] [-f|--show-field SHOW_FIELD] "
-            "[-F|--format {compact,grouped,table,minimal,json}] issue_key"
+            "[-F|--format {compact,grouped,table,minimal,json}] "
+            "[-b|--batch FILE] [--workers N] [issue_key]"
         ),
     )
-    parser.add_argument("issue_key", help="Issue key (for example, PROJ-12345)")
+    parser.add_argument("issue_key", nargs="?", default="", help="Issue key (for example, PROJ-12345)")
     parser.add_argument(
         "-t",
         "-p",
@@ -3217,11 +3610,43 @@ def main() -> int:
         action="store_true",
         help="Disable header abbreviations for console output (show full field names).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use the persistent issue cache for linked-issue statuses.",
+    )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached linked-issue statuses and re-fetch them (results are re-cached).",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        metavar="FILE",
+        help=(
+            "Batch mode: read issue keys from FILE (or - for stdin) and print one JSON line per issue "
+            "(the --format json payload plus \"key\"; {\"key\", \"error\"} for issues that cannot be fetched). "
+            "Issues, linked FI statuses, remote links and etracks are fetched in bulk."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Concurrent requests in --batch mode (default: $JIRA_BATCH_WORKERS or 4).",
+    )
     args = parser.parse_args()
     print(f"[CMD] {' '.join(sys.argv)}", file=sys.stderr)
 
     raw_issue_input = args.issue_key.strip()
-    if not raw_issue_input:
+    if args.batch:
+        if raw_issue_input or args.search:
+            print("Error: --batch reads issue keys from FILE; do not combine with issue_key or --search")
+            return 2
+        if args.raw:
+            print("Error: --raw is not supported with --batch")
+            return 2
+    elif not raw_issue_input:
         print("Issue key/search value cannot be empty")
         return 2
 
@@ -3238,7 +3663,7 @@ def main() -> int:
         return 2
 
     issue_key = raw_issue_input.upper()
-    if not args.search and not re.match(r"^[A-Z][A-Z0-9_]*-\d+$", issue_key):
+    if not args.batch and not args.search and not re.match(r"^[A-Z][A-Z0-9_]*-\d+$", issue_key):
         print(f"Invalid Jira issue key format: {issue_key}. Expected PROJECT-<digits>")
         return 2
 
@@ -3265,8 +3690,25 @@ def main() -> int:
         print(f"Error: {exc}")
         return 2
 
+    issue_cache = None
+    if IssueCache and not args.no_cache:
+        try:
+            issue_cache = IssueCache(refresh=args.refresh_cache)
+        except Exception as exc:
+            print(f"Warning: issue cache disabled: {exc}", file=sys.stderr)
+
     try:
-        jira = JiraClient()
+        jira = JiraClient(issue_cache=issue_cache)
+        if args.batch:
+            try:
+                batch_keys = _read_batch_keys(args.batch)
+            except OSError as exc:
+                print(f"Error: {exc}")
+                return 1
+            if not batch_keys:
+                print(f"Error: No issue keys found in {args.batch}")
+                return 1
+            return _run_batch(jira, batch_keys, args, enabled_sections)
         if args.search:
             search_jql = _build_fi_search_jql(jira, raw_issue_input)
             issues = jira.search_issues(search_jql)
@@ -130,6 +130,9 @@ try:
 except ImportError:
     PrettyTable = None
 
+# Shared keep-alive transport and parallel JQL pager (optional; see jira_common.py)
+from jira_common import ResilientTransport, send_request, iter_jql_pages
+
 # Force line-buffered stdout/stderr so progress prints appear immediately
 # even when output is piped or redirected to a file (instead of being
 # fully buffered and only flushed at process exit).
@@ -209,8 +212,8 @@ class JiraClient:
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json',
-            'Connection': 'close',
         }
+        self.transport = ResilientTransport() if ResilientTransport else None
 
     def _is_transient_error(self, exc: Exception) -> bool:
         """Check if error is transient and retryable."""
@@ -231,15 +234,9 @@ class JiraClient:
         last_exc = None
 
         for attempt in range(1, max_retries + 1):
-            session = requests.Session()
             try:
-                response = session.request(
-                    method, url,
-                    headers=self.headers,
-                    params=params,
-                    data=data,
-                    timeout=self.timeout
-                )
+                response = send_request(self.transport, method, url, headers=self.headers,
+                                        params=params, data=data, timeout=self.timeout)
 
                 if response.status_code in retryable_http and attempt < max_retries:
                     wait = min(2 ** attempt, 30)
@@ -279,9 +276,6 @@ class JiraClient:
                     continue
                 raise
 
-            finally:
-                session.close()
-
         if last_exc:
             raise last_exc
         raise RuntimeError(f"{operation}: Max retries exceeded")
@@ -352,18 +346,16 @@ class JiraClient:
         return response.json()
 
     def search_issues(self, jql: str, fields: List[str], max_results: int = 0) -> List[Dict]:
-        """Search issues using JQL query."""
+        """Search issues using JQL query (pages after the first are fetched in parallel)."""
         url = f"{self.base_url}/rest/api/2/search"
         all_issues = []
         seen_keys = set()
-        start_at = 0
-        batch_size = 100
 
-        while True:
+        def fetch_page(start_at: int, page_size: int) -> Dict:
             params = {
                 'jql': jql,
                 'startAt': start_at,
-                'maxResults': batch_size if max_results == 0 else min(batch_size, max_results - len(all_issues)),
+                'maxResults': page_size,
                 'fields': ','.join(fields),
             }
 
@@ -382,28 +374,17 @@ class JiraClient:
                 sys.exit(1)
 
             self._friendly_check(response, 'Issue search')
+            return response.json()
 
-            payload = response.json()
-            issues = payload.get('issues', [])
-            total = payload.get('total', 0)
-
-            if not issues:
-                break
-
-            for issue in issues:
+        for payload in iter_jql_pages(fetch_page, max_results):
+            for issue in payload.get('issues', []):
                 key = issue.get('key', '')
                 if key and key not in seen_keys:
                     seen_keys.add(key)
                     all_issues.append(issue)
 
-            if max_results > 0 and len(all_issues) >= max_results:
-                all_issues = all_issues[:max_results]
-                break
-
-            start_at += len(issues)
-            if start_at >= total:
-                break
-
+        if max_results > 0:
+            all_issues = all_issues[:max_results]
         return all_issues
 
     # --- Built-in Watchers API (for 'watches' field) ---
@@ -72,6 +72,21 @@ try:
 except ImportError:
     HAS_TABULATE = False
 
+# Persistent issue cache shared with account_manager (optional)
+try:
+    from account_manager.issue_cache import IssueCache
+except ImportError:
+    _workspace_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _workspace_root not in sys.path:
+        sys.path.insert(0, _workspace_root)
+    try:
+        from account_manager.issue_cache import IssueCache
+    except ImportError:
+        IssueCache = None
+
+# Shared keep-alive transport and on-disk Jira field list (optional; see jira_common.py)
+from jira_common import ResilientTransport, send_request, JiraFieldIndex
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -89,6 +104,18 @@ TAG_PATTERN = re.compile(r'^(NBSM|NBSVRUP)_(\d+\.\d+)_(\d{4})$')
 _field_cache: Optional[Dict[str, Dict]] = None
 
 
+def _index_fields_by_name(fields: List[Dict]) -> Dict[str, Dict]:
+    """Map lowercase field names to {id, name, custom}."""
+    index = {}
+    for field in fields:
+        index[field['name'].lower()] = {
+            'id': field['id'],
+            'name': field['name'],
+            'custom': field.get('custom', False)
+        }
+    return index
+
+
 def parse_env_multi_values(raw_value: str) -> List[str]:
     """Parse env var values that may be space or comma separated."""
     if not raw_value:
@@ -218,15 +245,18 @@ class JiraClient:
     TIMEOUT_UPDATE = 30       # Updates should be quick
 
     def __init__(self, url: str = JIRA_URL, token: str = JIRA_API_TOKEN,
-                 circuit_breaker: CircuitBreaker = None):
+                 circuit_breaker: CircuitBreaker = None, issue_cache=None):
         self.url = url.rstrip('/')
         self.token = token
         self.headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
         }
-        self._field_cache: Optional[Dict[str, Dict]] = None
+        # Lowercase field name -> {id, name, custom}, refetched once on a miss
+        self._field_index = JiraFieldIndex(self.url, self._fetch_fields, str.lower, _index_fields_by_name)
         self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.issue_cache = issue_cache  # Optional persistent IssueCache for get_issues_bulk()
+        self.transport = ResilientTransport() if (ResilientTransport and HAS_REQUESTS) else None
 
     def _format_request_error(self, method: str, url: str, timeout: int,
                               exc: Exception) -> str:
@@ -299,18 +329,11 @@ class JiraClient:
                 or "bad record mac" in details.lower()
             )
 
-        headers = dict(self.headers)
-        # Avoid stale keep-alive sockets when the network edge is unstable.
-        headers['Connection'] = 'close'
-
         last_exc: Optional[Exception] = None
         for attempt in range(1, max_retries + 1):
-            session = requests.Session()
             try:
-                response = session.request(
-                    method, url, headers=headers,
-                    json=data, timeout=timeout
-                )
+                response = send_request(self.transport, method, url, headers=self.headers,
+                                        json=data, timeout=timeout)
 
                 if response.status_code in retryable_http and attempt < max_retries:
                     wait = min(2 ** attempt, 30)
@@ -364,9 +387,6 @@ class JiraClient:
                 self._circuit_breaker.record_failure()
                 raise RuntimeError(self._format_request_error(method, url, timeout, exc)) from exc
 
-            finally:
-                session.close()
-
         if last_exc:
             self._circuit_breaker.record_failure()
             raise RuntimeError(self._format_request_error(method, url, timeout, last_exc)) from last_exc
@@ -377,26 +397,18 @@ class JiraClient:
 
         Uses longer timeout since field list can be large.
         """
-        if self._field_cache is not None:
-            return self._field_cache
+        if self._field_index.index is None:
+            self._field_index.load()
+        return self._field_index.index
 
+    def _fetch_fields(self) -> List[Dict]:
         response = self._request('GET', 'field', timeout=self.TIMEOUT_FETCH_FIELDS)
         response.raise_for_status()
-
-        self._field_cache = {}
-        for field in response.json():
-            name_lower = field['name'].lower()
-            self._field_cache[name_lower] = {
-                'id': field['id'],
-                'name': field['name'],
-                'custom': field.get('custom', False)
-            }
-        return self._field_cache
+        return response.json()
 
     def get_field_id(self, field_name: str) -> Optional[str]:
         """Get field ID by name (case-insensitive)."""
-        fields = self.get_all_fields()
-        field_info = fields.get(field_name.lower())
+        field_info = self._field_index.get(field_name)
         return field_info['id'] if field_info else None
 
     def get_issue(self, issue_key: str, timeout: int = None) -> Dict:
@@ -481,12 +493,37 @@ class JiraClient:
         all_issues = []
         not_found = set(issue_keys)  # Track which keys we haven't found yet
         total_keys = len(issue_keys)
+        pending_keys = issue_keys
+
+        # Serve fresh issues from the persistent cache, revalidate stale ones;
+        # only keys whose requests failed go through the batch loop below
+        if self.issue_cache:
+            def search(jql: str, search_fields: List[str], max_results: int) -> Optional[List[Dict]]:
+                try:
+                    response = self._request('POST', 'search',
+                                             data={'jql': jql, 'maxResults': max_results,
+                                                   'startAt': 0, 'fields': search_fields},
+                                             timeout=self.TIMEOUT_SEARCH)
+                    response.raise_for_status()
+                    return response.json().get('issues', [])
+                except Exception as e:
+                    print(f"\n  Warning: Cached bulk fetch failed: {e}")
+                    return None
+
+            cached, pending_keys = self.issue_cache.fetch(
+                issue_keys, fields or ['*navigable'], search, batch_size=batch_size)
+            for key in issue_keys:
+                if key in cached and key in not_found:
+                    all_issues.append(cached[key])
+                    not_found.discard(key)
+            if show_progress:
+                print(f"  Issue cache: {self.issue_cache.format_stats()}")
 
         # Process in batches (JQL has limits on query length)
-        for batch_start in range(0, len(issue_keys), batch_size):
-            batch_keys = issue_keys[batch_start:batch_start + batch_size]
+        for batch_start in range(0, len(pending_keys), batch_size):
+            batch_keys = pending_keys[batch_start:batch_start + batch_size]
             batch_num = (batch_start // batch_size) + 1
-            total_batches = (len(issue_keys) + batch_size - 1) // batch_size
+            total_batches = (len(pending_keys) + batch_size - 1) // batch_size
 
             if show_progress:
                 print(f"  Bulk fetching: batch {batch_num}/{total_batches} "
@@ -952,6 +989,10 @@ class JiraClient:
             else:
                 result['success'] = False
 
+        # Cached copies of this issue are now out of date
+        if self.issue_cache:
+            self.issue_cache.invalidate([issue_key])
+
         return result
 
 
@@ -1907,6 +1948,10 @@ For detailed examples, run: %(prog)s help
                        help=f'Repository path (default: {DEFAULT_REPO})')
         p.add_argument('-b', '--branch', default='origin/master',
                        help='Git branch to fetch before operations (default: origin/master)')
+        p.add_argument('--no-cache', action='store_true',
+                       help='Do not use the persistent Jira issue cache')
+        p.add_argument('--refresh-cache', action='store_true',
+                       help='Ignore cached Jira issues and re-fetch them (results are re-cached)')
 
     def add_range_args(p):
         p.add_argument('-t', '--tag', help='Single tag (compare with predecessor)')
@@ -2216,7 +2261,13 @@ def main():
 
     try:
         # Initialize
-        jira = JiraClient() if args.command in ['update', 'process', 'report', 'validate', 'validate-properties'] else None
+        issue_cache = None
+        if IssueCache and not getattr(args, 'no_cache', False):
+            try:
+                issue_cache = IssueCache(refresh=getattr(args, 'refresh_cache', False))
+            except Exception as e:
+                print(f"Warning: Jira issue cache disabled: {e}")
+        jira = JiraClient(issue_cache=issue_cache) if args.command in ['update', 'process', 'report', 'validate', 'validate-properties'] else None
         branch = args.branch if hasattr(args, 'branch') else 'origin/master'
         processor = ReleaseProcessor(repos, jira, branch=branch)
 
@@ -17,6 +17,10 @@ from datetime import datetime
 from collections import OrderedDict
 from urllib.parse import urlparse
 
+# Shared keep-alive transport, on-disk Jira field list and parallel JQL pager
+# (optional; see jira_common.py)
+from jira_common import ResilientTransport, send_request, JiraFieldIndex, iter_jql_pages
+
 # Keep console output safe even when shell locale is ASCII.
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -28,12 +32,14 @@ else:  # pragma: no cover
 
 load_dotenv()
 
-# Cache for field name to ID mapping
-_field_cache = None
+# Field name to ID mapping (refetched once when a name is missing)
+_field_index = None
+FIELD_TIMEOUT = 20
 
 # Jira credentials and URL
 JIRA_URL = "https://" + os.getenv('JIRA_SERVER_NAME')
 JIRA_API_TOKEN = os.getenv('JIRA_ACC_TOKEN')
+FIELD_URL = f'{JIRA_URL}/rest/api/2/field'
 
 # JQL query to filter issues
 JQL_QUERY = 'labels = Tracking and labels = NBServerMigrator_2.4'
@@ -45,6 +51,9 @@ headers = {
     'Content-Type': 'application/json'
 }
 
+# One connection pool for every Jira call of this run
+_transport = ResilientTransport() if ResilientTransport else None
+
 
 # Set up the command line argument parser
 
@@ -445,15 +454,12 @@ def jira_get_with_retry(url, operation, timeout=20, params=None):
     """GET Jira endpoint with retries/backoff for transient network/TLS failures."""
     max_retries = 5
     retryable_http = {429, 500, 502, 503, 504}
-    request_headers = dict(headers)
-    request_headers['Connection'] = 'close'
 
     last_exc = None
 
     for attempt in range(1, max_retries + 1):
-        session = requests.Session()
         try:
-            response = session.get(url, headers=request_headers, params=params, timeout=timeout)
+            response = send_request(_transport, 'GET', url, headers=headers, params=params, timeout=timeout)
 
             if response.status_code in retryable_http and attempt < max_retries:
                 wait = min(2 ** attempt, 30)
@@ -497,45 +503,53 @@ def jira_get_with_retry(url, operation, timeout=20, params=None):
                 continue
             raise
 
-        finally:
-            session.close()
-
     if last_exc:
         raise last_exc
     raise RuntimeError(f"{operation} failed after retries")
 
 
+def _index_fields_by_name(fields):
+    """Create mapping: lowercase name -> {id, name, custom}."""
+    index = {}
+    for field in fields:
+        index[field['name'].lower()] = {
+            'id': field['id'],
+            'name': field['name'],
+            'custom': field.get('custom', False)
+        }
+    return index
+
+
+def _fetch_fields():
+    """Download the Jira field list (used through the field cache)."""
+    response = jira_get_with_retry(FIELD_URL, operation='Field discovery', timeout=FIELD_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def _lookup_field(field_name=None):
+    """Load the field index and look up field_name; prints and returns None on request errors."""
+    global _field_index
+    if _field_index is None:
+        _field_index = JiraFieldIndex(JIRA_URL, _fetch_fields, lambda name: name.lower().strip(),
+                                      _index_fields_by_name)
+    try:
+        if _field_index.index is None:
+            _field_index.load()
+        return _field_index.get(field_name) if field_name else None
+    except requests.exceptions.RequestException as e:
+        print(format_jira_request_error('Field discovery', FIELD_URL, FIELD_TIMEOUT, e))
+        return None
+
+
 def get_all_fields():
     """Fetches all Jira fields and returns a name-to-ID mapping.
 
     Returns:
         dict: A dictionary mapping field names (lowercase) to their IDs.
     """
-    global _field_cache
-    if _field_cache is not None:
-        return _field_cache
-
-    timeout = 20
-    url = f'{JIRA_URL}/rest/api/2/field'
-
-    try:
-        response = jira_get_with_retry(url, operation='Field discovery', timeout=timeout)
-        response.raise_for_status()
-
-        fields = response.json()
-        # Create mapping: lowercase name -> {id, name, custom}
-        _field_cache = {}
-        for field in fields:
-            name_lower = field['name'].lower()
-            _field_cache[name_lower] = {
-                'id': field['id'],
-                'name': field['name'],
-                'custom': field.get('custom', False)
-            }
-        return _field_cache
-    except requests.exceptions.RequestException as e:
-        print(format_jira_request_error('Field discovery', url, timeout, e))
-        return {}
+    _lookup_field()
+    return _field_index.index or {}
 
 
 def get_field_id_by_name(field_name):
@@ -547,8 +561,7 @@ def get_field_id_by_name(field_name):
     Returns:
         tuple: (field_id, actual_name) or (None, None) if not found.
     """
-    fields = get_all_fields()
-    field_info = fields.get(field_name.lower().strip())
+    field_info = _lookup_field(field_name)
     if field_info:
         return field_info['id'], field_info['name']
     return None, None
@@ -760,6 +773,10 @@ def _sanitize_jql(jql):
     return jql
 
 
+class _JqlRejected(Exception):
+    """Issue search rejected with 400 (details already printed)."""
+
+
 # Function to get issues by JQL
 def get_issues_by_jql(jql, extra_field_ids=None, max_results=MAX_RESULTS):
     """Fetches issues from Jira based on the provided JQL query.
@@ -805,20 +822,11 @@ def get_issues_by_jql(jql, extra_field_ids=None, max_results=MAX_RESULTS):
             print("Error: --max must be 0 or a positive integer.")
             return None
 
-        all_issues = []
-        start_at = 0
-        page_size = 100
-        remaining = None if max_results == 0 else max_results
-
-        while True:
-            batch_size = page_size if remaining is None else min(page_size, remaining)
-            if batch_size <= 0:
-                break
-
+        def fetch_page(start_at, page_size):
             params = {
                 'jql': jql,
                 'startAt': start_at,
-                'maxResults': batch_size,
+                'maxResults': page_size,
                 'fields': base_fields
             }
 
@@ -847,31 +855,19 @@ def get_issues_by_jql(jql, extra_field_ids=None, max_results=MAX_RESULTS):
                     print("  - Ensure string values are quoted: key = \"ABC-123\"", file=sys.stderr)
                 except Exception:
                     pass
-                return None
+                raise _JqlRejected()
 
             response.raise_for_status()  # Raises an HTTPError if the response code was unsuccessful
+            return response.json()
 
-            payload = response.json()
-            issues = payload.get('issues', [])
-            total = payload.get('total', 0)
-
-            if not issues:
-                break
-
-            all_issues.extend(issues)
-            fetched = len(issues)
-            start_at += fetched
-
-            if remaining is not None:
-                remaining -= fetched
-                if remaining <= 0:
-                    break
-
-            if fetched < batch_size or start_at >= total:
-                break
-
-        return all_issues
+        # First page gives the total; the rest are fetched in parallel, in order
+        all_issues = []
+        for payload in iter_jql_pages(fetch_page, max_results):
+            all_issues.extend(payload.get('issues', []))
+        return all_issues[:max_results] if max_results else all_issues
 
+    except _JqlRejected:
+        return None
     except requests.exceptions.RequestException as e:
         print(format_jira_request_error('Issue search', url, timeout, e))
         return None
@@ -40,6 +40,9 @@ from collections import defaultdict
 from dotenv import load_dotenv
 from prettytable import PrettyTable
 
+# On-disk Jira field list and parallel JQL pager (optional; see jira_common.py)
+from jira_common import JiraFieldIndex, iter_jql_pages
+
 # Load environment variables
 load_dotenv()
 
@@ -92,28 +95,30 @@ TYPE_SYMBOLS = {
 }
 
 _SPRINT_FIELD_ID = None
+_field_index = None  # Field name -> ID (refetched once when a name is missing)
 
 
 def get_sprint_field_id():
     """Get Jira custom field ID for Sprint (e.g., customfield_10020)."""
-    global _SPRINT_FIELD_ID
+    global _SPRINT_FIELD_ID, _field_index
     if _SPRINT_FIELD_ID:
         return _SPRINT_FIELD_ID
 
+    if _field_index is None:
+        def fetch():
+            url = f'{JIRA_URL}/rest/api/2/field'
+            response = requests.get(url, headers=headers, timeout=30)
+            response.raise_for_status()
+            return response.json()
+
+        _field_index = JiraFieldIndex(JIRA_URL, fetch, lambda name: name.strip().lower())
+
     try:
-        url = f'{JIRA_URL}/rest/api/2/field'
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-
-        fields = response.json()
-        for field in fields:
-            if (field.get('name') or '').strip().lower() == 'sprint':
-                _SPRINT_FIELD_ID = field.get('id')
-                return _SPRINT_FIELD_ID
+        _SPRINT_FIELD_ID = _field_index.get('Sprint')
     except requests.exceptions.RequestException as e:
         print(f"[WARN] Unable to fetch Sprint field ID: {e}", file=sys.stderr)
 
-    return None
+    return _SPRINT_FIELD_ID
 
 
 def _extract_attr_from_legacy_sprint(sprint_str, attr):
@@ -300,7 +305,7 @@ def get_issues_by_jql(jql_query, max_results=200):
 
     Args:
         jql_query (str): JQL query string
-        max_results (int): Maximum number of results to fetch
+        max_results (int): Maximum number of results to fetch (0 = all)
 
     Returns:
         list: List of issue objects
@@ -312,17 +317,23 @@ def get_issues_by_jql(jql_query, max_results=200):
         if sprint_field_id:
             fields.append(sprint_field_id)
 
-        params = {
-            'jql': jql_query,
-            'maxResults': max_results,
-            'fields': fields
-        }
-
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
+        def fetch_page(start_at, page_size):
+            params = {
+                'jql': jql_query,
+                'startAt': start_at,
+                'maxResults': page_size,
+                'fields': fields
+            }
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response.raise_for_status()
+            return response.json()
 
-        result = response.json()
-        issues = result.get('issues', [])
+        # First page gives the total; the rest are fetched in parallel, in order
+        issues = []
+        for page in iter_jql_pages(fetch_page, max_results):
+            issues.extend(page.get('issues', []))
+        if max_results:
+            issues = issues[:max_results]
 
         print(f"[INFO] Fetched {len(issues)} issues from Jira", file=sys.stderr)
         return issues
@@ -716,7 +727,7 @@ Issue Type Indicators:
         '--max-results',
         type=int,
         default=200,
-        help='Maximum number of results to fetch (default: 200)'
+        help='Maximum number of results to fetch (default: 200, 0 = all)'
     )
 
     args = parser.parse_args()
@@ -80,6 +80,11 @@ from typing import Any, Dict, List, Optional, Tuple
 # Ensure console output is UTF-8 safe
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+else:
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 # Add parent directory to path for account_manager imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -88,11 +93,7 @@ try:
     ETRACK_AVAILABLE = True
 except ImportError:
     ETRACK_AVAILABLE = False
-    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
-else:
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+from jira_common import ResilientTransport, send_request, JiraFieldIndex
 
 import requests
 from dotenv import load_dotenv
@@ -191,6 +192,11 @@ class JiraUpdateClient:
         self.base_url = "https://{}".format(self.server) if self.server else None
         self.timeout = 30
         self._fields_cache = None  # type: Optional[Dict[str, Dict[str, Any]]]
+        self._fields_cache_source = None  # type: Optional[List[Dict[str, Any]]]
+        # Name -> field ID (spaces, '-' and '_' ignored), refetched once on a miss
+        self._field_index = JiraFieldIndex(
+            self.base_url, self._fetch_fields,
+            lambda name: name.strip().lower().replace(' ', '').replace('-', '').replace('_', ''))
         self._field_options_cache = {}  # type: Dict[str, List[Dict[str, str]]]
 
         if not self.base_url or not self.token:
@@ -200,60 +206,51 @@ class JiraUpdateClient:
             "Authorization": "Bearer {}".format(self.token),
             "Content-Type": "application/json",
         }
+        self.transport = ResilientTransport() if ResilientTransport else None
 
     def _request(self, method, url, params=None, json_data=None):
         # type: (str, str, Optional[Dict], Optional[Dict]) -> requests.Response
         """Make HTTP request with retry logic."""
         max_retries = 5
         last_exc = None  # type: Optional[Exception]
-        request_headers = dict(self.headers)
-        request_headers["Connection"] = "close"
+        if method.upper() not in ('GET', 'PUT', 'POST'):
+            raise ValueError("Unsupported HTTP method: {}".format(method))
 
         for attempt in range(1, max_retries + 1):
-            session = requests.Session()
             try:
-                try:
-                    if method.upper() == 'GET':
-                        response = session.get(url, headers=request_headers, params=params, timeout=self.timeout)
-                    elif method.upper() == 'PUT':
-                        response = session.put(url, headers=request_headers, json=json_data, timeout=self.timeout)
-                    elif method.upper() == 'POST':
-                        response = session.post(url, headers=request_headers, json=json_data, timeout=self.timeout)
-                    else:
-                        raise ValueError("Unsupported HTTP method: {}".format(method))
-                except requests.exceptions.SSLError as exc:
-                    msg = str(exc)
-                    is_transient = any(x in msg for x in [
-                        "UNEXPECTED_EOF", "EOF occurred", "SSLEOFError", "ConnectionReset", "bad record"
-                    ])
-                    if is_transient and attempt < max_retries:
-                        last_exc = exc
-                        wait = min(2 ** attempt, 30)
-                        print("Transient SSL error (attempt {}/{}): {}. Retrying in {}s...".format(
-                            attempt, max_retries, exc, wait), file=sys.stderr)
-                        time.sleep(wait)
-                        continue
-                    raise RuntimeError("TLS/SSL error: {}".format(exc))
-                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                response = send_request(self.transport, method.upper(), url, headers=self.headers,
+                                        params=params, json=json_data, timeout=self.timeout)
+            except requests.exceptions.SSLError as exc:
+                msg = str(exc)
+                is_transient = any(x in msg for x in [
+                    "UNEXPECTED_EOF", "EOF occurred", "SSLEOFError", "ConnectionReset", "bad record"
+                ])
+                if is_transient and attempt < max_retries:
                     last_exc = exc
-                    if attempt < max_retries:
-                        wait = min(2 ** attempt, 30)
-                        print("Network error (attempt {}/{}): {}. Retrying in {}s...".format(
-                            attempt, max_retries, exc, wait), file=sys.stderr)
-                        time.sleep(wait)
-                        continue
-                    raise RuntimeError("Network error: {}".format(exc))
-
-                if response.status_code in (429, 500, 502, 503, 504) and attempt < max_retries:
                     wait = min(2 ** attempt, 30)
-                    print("Jira returned {} (attempt {}/{}). Retrying in {}s...".format(
-                        response.status_code, attempt, max_retries, wait), file=sys.stderr)
+                    print("Transient SSL error (attempt {}/{}): {}. Retrying in {}s...".format(
+                        attempt, max_retries, exc, wait), file=sys.stderr)
                     time.sleep(wait)
                     continue
+                raise RuntimeError("TLS/SSL error: {}".format(exc))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+                last_exc = exc
+                if attempt < max_retries:
+                    wait = min(2 ** attempt, 30)
+                    print("Network error (attempt {}/{}): {}. Retrying in {}s...".format(
+                        attempt, max_retries, exc, wait), file=sys.stderr)
+                    time.sleep(wait)
+                    continue
+                raise RuntimeError("Network error: {}".format(exc))
+
+            if response.status_code in (429, 500, 502, 503, 504) and attempt < max_retries:
+                wait = min(2 ** attempt, 30)
+                print("Jira returned {} (attempt {}/{}). Retrying in {}s...".format(
+                    response.status_code, attempt, max_retries, wait), file=sys.stderr)
+                time.sleep(wait)
+                continue
 
-                return response
-            finally:
-                session.close()
+            return response
 
         raise RuntimeError("Network error after {} attempts: {}".format(max_retries, last_exc))
 
@@ -339,17 +336,13 @@ class JiraUpdateClient:
     def get_all_fields(self):
         # type: () -> Dict[str, Dict[str, Any]]
         """Get all Jira fields with their metadata."""
-        if self._fields_cache is not None:
+        fields = self._field_index.all_fields()
+        if self._fields_cache is not None and self._fields_cache_source is fields:
             return self._fields_cache
 
-        url = "{}/rest/api/2/field".format(self.base_url)
-        response = self._request('GET', url)
-        if response.status_code != 200:
-            raise RuntimeError("Failed to fetch fields: {} {}".format(
-                response.status_code, response.text[:400]))
-
+        self._fields_cache_source = fields
         self._fields_cache = {}
-        for field in response.json():
+        for field in fields:
             field_id = field.get('id', '')
             self._fields_cache[field_id] = {
                 'id': field_id,
@@ -359,18 +352,20 @@ class JiraUpdateClient:
             }
         return self._fields_cache
 
+    def _fetch_fields(self):
+        # type: () -> List[Dict[str, Any]]
+        """Download the Jira field list (used through the field cache)."""
+        url = "{}/rest/api/2/field".format(self.base_url)
+        response = self._request('GET', url)
+        if response.status_code != 200:
+            raise RuntimeError("Failed to fetch fields: {} {}".format(
+                response.status_code, response.text[:400]))
+        return response.json()
+
     def get_field_id_by_name(self, display_name):
         # type: (str) -> Optional[str]
-        """Find field ID by display name."""
-        fields = self.get_all_fields()
-        normalized = display_name.strip().lower().replace(' ', '').replace('-', '').replace('_', '')
-
-        for field_id, field_info in fields.items():
-            field_name = field_info.get('name', '')
-            field_normalized = field_name.strip().lower().replace(' ', '').replace('-', '').replace('_', '')
-            if field_normalized == normalized:
-                return field_id
-        return None
+        """Find field ID by display name (spaces, '-' and '_' ignored)."""
+        return self._field_index.get(display_name)
 
     def get_field_options(self, issue_key, field_key):
         # type: (str, str) -> List[Dict[str, str]]
@@ -885,8 +880,9 @@ def extract_validated_etrack_id(client, issue_key, silent=False):
     )
 
 
-def sync_etrack_to_jira(client, issue_key, etrack_id, sync_component=False, sync_affectsversion=False, silent=False, etrack_mappings=None):
-    # type: (JiraUpdateClient, str, str, bool, bool, bool, Optional[Dict[str, Dict[str, str]]]) -> Tuple[Dict[str, Any], Optional[str]]
+def sync_etrack_to_jira(client, issue_key, etrack_id, sync_component=False, sync_affectsversion=False, silent=False, etrack_mappings=None,
+                        etrack_info=None, issue_data=None):
+    # type: (JiraUpdateClient, str, str, bool, bool, bool, Optional[Dict[str, Dict[str, str]]], Any, Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Optional[str]]
     """
     Fetch etrack info and return updates dict for mismatched fields only.
 
@@ -899,21 +895,23 @@ def sync_etrack_to_jira(client, issue_key, etrack_id, sync_component=False, sync
         silent: Suppress output messages
         etrack_mappings: Optional dict to transform etrack values before setting
                          Format: {"component": {"EtrackVal": "JiraVal"}, "version": {...}}
+        etrack_info: Already fetched EtrackInfo for etrack_id (skips the esql lookup)
+        issue_data: Already fetched Jira issue JSON (skips the Jira GET)
 
     Returns:
         Tuple of (field_updates_dict, sync_comment_string)
         - field_updates: Dict of fields that differ from Jira current values
         - sync_comment: Comment describing what was synced (None if nothing synced)
     """
-    if not ETRACK_AVAILABLE:
-        raise RuntimeError("Etrack integration not available. Check account_manager.etrack_integration module.")
-
     updates = {}  # type: Dict[str, Any]
     sync_actions = []  # type: List[str]
 
     # Fetch etrack info
-    executor = EtrackExecutor()
-    etrack_info = executor.get_etrack_info(etrack_id)
+    if etrack_info is None:
+        if not ETRACK_AVAILABLE:
+            raise RuntimeError("Etrack integration not available. Check account_manager.etrack_integration module.")
+        executor = EtrackExecutor()
+        etrack_info = executor.get_etrack_info(etrack_id)
 
     if not etrack_info:
         raise RuntimeError("Could not fetch etrack info for incident: {}".format(etrack_id))
@@ -925,7 +923,8 @@ def sync_etrack_to_jira(client, issue_key, etrack_id, sync_component=False, sync
             print("! WARNING: Etrack {} type is '{}', expected SERVICE_REQUEST".format(etrack_id, et_type))
 
     # Fetch current Jira issue values
-    issue_data = client.get_issue(issue_key)
+    if issue_data is None:
+        issue_data = client.get_issue(issue_key)
     fields = issue_data.get('fields', {})
 
     # Extract current Jira values
@@ -1028,6 +1027,24 @@ def sync_etrack_to_jira(client, issue_key, etrack_id, sync_component=False, sync
     return (updates, sync_comment)
 
 
+def build_fields_data(client, issue_key, updates, silent=False):
+    # type: (JiraUpdateClient, str, Dict[str, Any], bool) -> Dict[str, Any]
+    """
+    Resolve and format {field_name: value} updates into a Jira "fields" payload.
+    Raises ValueError for unknown fields or invalid values.
+    """
+    fields_data = {}  # type: Dict[str, Any]
+
+    for field_name, value in updates.items():
+        canonical, defn = resolve_field_name(field_name)
+        jira_key, formatted = format_field_value(client, issue_key, canonical, value, defn)
+        fields_data[jira_key] = formatted
+        if not silent:
+            print("  {} ({}) = {}".format(canonical, jira_key, formatted))
+
+    return fields_data
+
+
 def perform_update(client, issue_key, updates, comment=None, dry_run=False, silent=False, potential_comment=None):
     # type: (JiraUpdateClient, str, Dict[str, Any], Optional[str], bool, bool, Optional[str]) -> bool
     """
@@ -1040,18 +1057,11 @@ def perform_update(client, issue_key, updates, comment=None, dry_run=False, sile
         return False
 
     # Build the fields payload
-    fields_data = {}  # type: Dict[str, Any]
-
-    for field_name, value in updates.items():
-        try:
-            canonical, defn = resolve_field_name(field_name)
-            jira_key, formatted = format_field_value(client, issue_key, canonical, value, defn)
-            fields_data[jira_key] = formatted
-            if not silent:
-                print("  {} ({}) = {}".format(canonical, jira_key, formatted))
-        except ValueError as e:
-            print("Error: {}".format(e), file=sys.stderr)
-            return False
+    try:
+        fields_data = build_fields_data(client, issue_key, updates, silent=silent)
+    except ValueError as e:
+        print("Error: {}".format(e), file=sys.stderr)
+        return False
 
     if dry_run:
         print("\n[DRY RUN] Would update {} with:".format(issue_key))
@@ -5,9 +5,13 @@ Batch validate FI issues against linked etrack and sync mismatched fields.
 
 Features:
 - Read FI IDs from file or stdin (extracts FI-XXXXX pattern from any text)
-- Fetch FI details with etrack comparison using j.getJiraDetails.py -e -j
+- Fetch FI details with etrack comparison (j.getJiraDetails.py -e logic)
 - Detect mismatches in Component and Affects Version
-- Auto-sync mismatched fields using j.updateJiraDetails.py -set
+- Auto-sync mismatched fields (j.updateJiraDetails.py -set logic)
+- In-process engine: both scripts are imported as libraries, all FIs are
+  bulk-fetched (JQL "key in (...)") and their etracks batch-queried up front,
+  and updates go through one shared Jira client (--subprocess: one
+  j.getJiraDetails.py / j.updateJiraDetails.py process per FI, as before)
 - Handle edge cases: no etrack, multiple conflicting etracks, fetch/update errors
 - Generate categorized success/failure reports (JSON + text)
 - Mapping-only mode: apply value translations without etrack comparison
@@ -51,6 +55,7 @@ Short Options:
   -fm  --fuzzy-match      Use fuzzy matching for component comparison (default: strict)
   -p   --parallel         Enable parallel processing
   -w   --workers          Number of parallel workers (default: 4)
+       --subprocess       Run one j.getJiraDetails.py/j.updateJiraDetails.py process per FI
 
 Mapping File Format (JSON):
   {
@@ -82,6 +87,7 @@ Mapping File Format (JSON):
 from __future__ import print_function
 
 import argparse
+import importlib.util
 import json
 import os
 import re
@@ -106,6 +112,9 @@ GET_DETAILS_SCRIPT = os.path.join(SCRIPT_DIR, 'j.getJiraDetails.py')
 _fuzzy_match_enabled = False
 UPDATE_SCRIPT = os.path.join(SCRIPT_DIR, 'j.updateJiraDetails.py')
 
+# In-process engine (set from main unless --subprocess); None = one subprocess per FI
+_engine: Optional["InProcessEngine"] = None
+
 # Global mappings (loaded from file)
 VALUE_MAPPINGS: Dict[str, Dict[str, str]] = {
     "component": {},
@@ -253,6 +262,178 @@ def read_fi_ids_from_stdin() -> List[str]:
     return extract_fi_ids(content)
 
 
+# ---------------------------------------------------------------------------
+# In-Process Engine
+# ---------------------------------------------------------------------------
+
+def _load_script_module(name: str, path: str) -> Any:
+    """Import a j.*.py script (not a valid module name) as a library module."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load {path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class InProcessEngine:
+    """Fetch, compare and sync FIs in this process with shared Jira clients.
+
+    Uses j.getJiraDetails.py and j.updateJiraDetails.py as libraries, so a
+    batch pays interpreter start-up, imports and the TLS handshake once
+    instead of once or twice per FI. prefetch() loads all FIs with bulk JQL
+    queries and all linked etracks with batched esql; fetch_fi_details()
+    and sync_fi_with_etrack() then answer from that data.
+    """
+
+    def __init__(self, fuzzy_match: bool = False, workers: int = 4):
+        """Load both scripts and create the shared clients.
+
+        Args:
+            fuzzy_match: Use fuzzy component matching (as --fuzzy-match)
+            workers: Concurrent bulk queries during prefetch
+
+        Raises:
+            ImportError: A script or one of its dependencies cannot be imported
+            RuntimeError: Jira credentials are missing
+        """
+        self.details = _load_script_module('j_getJiraDetails', GET_DETAILS_SCRIPT)
+        self.updater = _load_script_module('j_updateJiraDetails', UPDATE_SCRIPT)
+        self.jira = self.details.JiraClient()
+        self.update_client = self.updater.JiraUpdateClient()
+        self.fuzzy_match = fuzzy_match
+        self.workers = max(1, workers)
+        self._issues: Dict[str, Dict[str, Any]] = {}
+        self._fetch_errors: Dict[str, str] = {}
+        self._etrack_infos: Dict[str, Any] = {}
+        self._etrack_details: Dict[str, Dict[str, str]] = {}
+        self._etrack_lock = threading.Lock()
+
+    def prefetch(self, fi_ids: List[str], with_etrack: bool = True) -> None:
+        """Bulk-fetch FIs and (optionally) every etrack they link to.
+
+        Args:
+            fi_ids: FI issue keys
+            with_etrack: Also fetch linked etrack details
+        """
+        issues, errors = self.details.fetch_issues_bulk(self.jira, fi_ids, max_workers=self.workers)
+        self._issues.update(issues)
+        self._fetch_errors.update(errors)
+
+        if with_etrack:
+            etrack_ids: Set[str] = set()
+            for issue in self._issues.values():
+                etrack_ids.update(self._linked_etrack_ids(issue))
+            self._ensure_etracks(sorted(etrack_ids, key=int))
+
+    def _linked_etrack_ids(self, issue: Dict[str, Any]) -> List[str]:
+        """Etrack IDs linked from an issue (same sources as j.getJiraDetails.py -e)."""
+        sources, _errors = self.details._extract_etrack_ids_with_sources(issue)
+        return list(sources)
+
+    def _ensure_etracks(self, etrack_ids: List[str]) -> None:
+        """Fetch details for etracks not loaded yet."""
+        with self._etrack_lock:
+            missing = [et for et in etrack_ids if et not in self._etrack_details]
+            if not missing:
+                return
+            try:
+                infos = self.details.fetch_etrack_infos(missing, max_workers=self.workers)
+            except (ImportError, RuntimeError):
+                # Same placeholder rows (module unavailable / no esql) the CLI reports
+                self._etrack_details.update(self.details._fetch_etrack_details(missing))
+                return
+            self._etrack_infos.update(infos)
+            for et, info in infos.items():
+                self._etrack_details[et] = self.details._etrack_detail_from_info(info)
+
+    def fetch_fi_details(self, fi_id: str, with_etrack: bool = True) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Build the j.getJiraDetails.py [-e] --format json payload for an FI.
+
+        Args:
+            fi_id: The FI issue key
+            with_etrack: Include etrack details and comparison
+
+        Returns:
+            Tuple of (details_dict, error_message), as fetch_fi_details()
+        """
+        if fi_id in self._fetch_errors:
+            return None, self._fetch_errors[fi_id]
+        issue = self._issues.get(fi_id)
+        try:
+            if issue is None:
+                issue = self.jira.get_issue(fi_id)
+                self._issues[fi_id] = issue
+
+            etrack_info = None
+            if with_etrack:
+                etrack_ids = self._linked_etrack_ids(issue)
+                self._ensure_etracks(etrack_ids)
+                etrack_info = {et: self._etrack_details[et] for et in etrack_ids}
+
+            payload = self.details.build_etrack_validation_payload(
+                issue, etrack_info,
+                jira_base_url=self.jira.base_url,
+                fuzzy_match=self.fuzzy_match,
+            )
+            return payload, None
+        except Exception as e:
+            return None, str(e)
+
+    def sync_fi_with_etrack(
+        self,
+        fi_id: str,
+        etrack_id: str,
+        sync_component: bool = True,
+        sync_version: bool = True,
+        dry_run: bool = False,
+        component_value: Optional[str] = None,
+        version_value: Optional[str] = None,
+    ) -> Tuple[bool, str]:
+        """Apply the j.updateJiraDetails.py -set (or -c/--av) update for an FI.
+
+        The prefetched FI and etrack are reused, so only the update itself
+        goes to Jira.
+
+        Returns:
+            Tuple of (success, message), as sync_fi_with_etrack()
+        """
+        updater = self.updater
+        sync_comment = None
+        try:
+            if component_value is not None or version_value is not None:
+                updates: Dict[str, Any] = {}
+                if sync_component and component_value:
+                    updates['components'] = component_value
+                if sync_version and version_value:
+                    updates['affectsversions'] = version_value
+            else:
+                updates, sync_comment = updater.sync_etrack_to_jira(
+                    self.update_client, fi_id, etrack_id,
+                    sync_component=sync_component,
+                    sync_affectsversion=sync_version,
+                    silent=True,
+                    etrack_info=self._etrack_infos.get(etrack_id),
+                    issue_data=self._issues.get(fi_id),
+                )
+            if not updates:
+                return False, "No updates specified."
+
+            fields_data = updater.build_fields_data(self.update_client, fi_id, updates, silent=True)
+            if dry_run:
+                message = "[DRY RUN] Would update {} with:\n{}".format(
+                    fi_id, json.dumps({"fields": fields_data}, indent=2))
+            else:
+                self.update_client.update_issue(fi_id, fields_data)
+                message = "[OK] Updated {} successfully".format(fi_id)
+        except (RuntimeError, ValueError) as e:
+            return False, "Error: {}".format(e)
+
+        if sync_comment:
+            message += "\n" + sync_comment
+        return True, message
+
+
 # ---------------------------------------------------------------------------
 # FI Details Fetching
 # ---------------------------------------------------------------------------
@@ -270,6 +451,9 @@ def fetch_fi_details(fi_id: str, timeout: int = 60, with_etrack: bool = True) ->
         - On success: (dict, None)
         - On failure: (None, error_string)
     """
+    if _engine is not None:
+        return _engine.fetch_fi_details(fi_id, with_etrack=with_etrack)
+
     cmd = ['python3', GET_DETAILS_SCRIPT, fi_id, '--format', 'json']
     if with_etrack:
         cmd.insert(3, '-e')  # Insert after fi_id
@@ -550,6 +734,13 @@ def sync_fi_with_etrack(
     Returns:
         Tuple of (success, message)
     """
+    if _engine is not None:
+        return _engine.sync_fi_with_etrack(
+            fi_id, etrack_id,
+            sync_component=sync_component, sync_version=sync_version, dry_run=dry_run,
+            component_value=component_value, version_value=version_value,
+        )
+
     # If we have direct values (from mapping), use direct update instead of etrack sync
     use_direct_update = (component_value is not None or version_value is not None)
 
@@ -868,6 +1059,12 @@ def process_fi_batch(
 
     total = len(fi_ids)
 
+    if _engine is not None:
+        start = time.time()
+        _engine.prefetch(fi_ids, with_etrack=not mapping_only)
+        if verbose:
+            print(f"Prefetched {total} FIs in {time.time() - start:.1f}s")
+
     if parallel:
         # Parallel processing with ThreadPoolExecutor
         completed = 0
@@ -912,7 +1109,8 @@ def process_fi_batch(
                 msg = _format_verbose_result(category, entry, dry_run, mapping_only)
                 print(msg)
 
-            if delay > 0:
+            # Prefetched FIs only call Jira again when an update is sent
+            if delay > 0 and (_engine is None or ("sync_message" in entry and not dry_run)):
                 time.sleep(delay)
 
     return results
@@ -1074,7 +1272,7 @@ def main() -> int:
         usage="%(prog)s [-h] [-sc/--sync-component] [-sv/--sync-version] [-n/--dry-run]\n"
               "                       [-d/--delay DELAY] [-o/--output-dir DIR] [-v/--verbose]\n"
               "                       [-nr/--no-report] [-mf/--mapping-file FILE] [-mo/--mapping-only]\n"
-              "                       [-p/--parallel] [-w/--workers N] [input]",
+              "                       [-p/--parallel] [-w/--workers N] [--subprocess] [input]",
         epilog="""
 Examples:
   # From file
@@ -1199,16 +1397,27 @@ Mapping File Format (JSON):
         type=int,
         default=4,
         metavar='N',
-        help='Number of parallel workers (default: 4, use with -p)'
+        help='Number of parallel workers (default: 4, use with -p; also bulk fetch concurrency)'
+    )
+    parser.add_argument(
+        '--subprocess',
+        action='store_true',
+        help='Run one j.getJiraDetails.py / j.updateJiraDetails.py process per FI (slow; old behavior)'
     )
 
     args = parser.parse_args()
     print(f"[CMD] {' '.join(sys.argv)}", file=sys.stderr)
 
     # Set module-level fuzzy match flag for subprocess calls
-    global _fuzzy_match_enabled
+    global _fuzzy_match_enabled, _engine
     _fuzzy_match_enabled = args.fuzzy_match
 
+    if not args.subprocess:
+        try:
+            _engine = InProcessEngine(fuzzy_match=args.fuzzy_match, workers=args.workers)
+        except Exception as e:
+            print(f"Warning: in-process engine unavailable ({e}); running one subprocess per FI", file=sys.stderr)
+
     # Determine which fields to sync
     # If neither --sync-component nor --sync-version specified, sync both
     if args.sync_component_only and args.sync_version_only:
@@ -1272,6 +1481,7 @@ Mapping File Format (JSON):
 
     if args.parallel:
         print(f"Parallel mode: {args.workers} workers")
+    print(f"Engine: {'in-process' if _engine is not None else 'subprocess per FI'}")
 
     print()
 
@@ -0,0 +1,101 @@
+"""
+Shared imports for the Jira scripts in this directory
+
+The j.*.py scripts are run directly, so this module (next to them on
+sys.path) is the one place that pulls in the optional account_manager
+helpers and defines what to use when account_manager is not importable:
+
+- ResilientTransport: None (send_request() then opens a fresh socket per call)
+- JiraFieldIndex: same interface, downloading the field list once per run
+- iter_jql_pages: serial pager with the same signature
+- get_batch_workers: same $JIRA_BATCH_WORKERS parsing (bad values fall back to 4)
+
+    from jira_common import ResilientTransport, send_request, JiraFieldIndex, iter_jql_pages, get_batch_workers
+"""
+
+import os
+import sys
+
+try:
+    import requests
+except ImportError:  # pragma: no cover
+    requests = None
+
+try:
+    from account_manager.http_session import ResilientTransport, send_request, get_batch_workers
+    from account_manager.jira_field_cache import JiraFieldIndex
+    from account_manager.jql_pager import iter_jql_pages
+except ImportError:
+    _workspace_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _workspace_root not in sys.path:
+        sys.path.insert(0, _workspace_root)
+    try:
+        from account_manager.http_session import ResilientTransport, send_request, get_batch_workers
+        from account_manager.jira_field_cache import JiraFieldIndex
+        from account_manager.jql_pager import iter_jql_pages
+    except ImportError:
+        ResilientTransport = None
+        send_request = None
+        JiraFieldIndex = None
+        iter_jql_pages = None
+        get_batch_workers = None
+
+if send_request is None:
+    def send_request(transport, method, url, **kwargs):
+        """Fallback for account_manager.http_session.send_request(): one fresh 'Connection: close' socket."""
+        headers = dict(kwargs.pop('headers', None) or {})
+        headers['Connection'] = 'close'
+        with requests.Session() as session:
+            return session.request(method, url, headers=headers, **kwargs)
+
+if JiraFieldIndex is None:
+    class JiraFieldIndex:
+        """Fallback for account_manager.jira_field_cache.JiraFieldIndex: no cache, so no refetch on a miss."""
+
+        def __init__(self, server, fetch, normalize=lambda name: ' '.join(name.split()).casefold(), build=None):
+            self.server = server
+            self.fetch = fetch
+            self.normalize = normalize
+            self.build = build or (lambda fields: {normalize(f['name']): f['id'] for f in reversed(fields)
+                                                   if isinstance(f.get('name'), str) and isinstance(f.get('id'), str)})
+            self.fields = None
+            self.index = None
+
+        def load(self, refresh=False):
+            self.fields = self.fetch()
+            self.index = self.build(self.fields)
+            return self.index
+
+        def all_fields(self):
+            if self.fields is None:
+                self.load()
+            return self.fields
+
+        def get(self, name):
+            if not name:
+                return None
+            if self.index is None:
+                self.load()
+            return self.index.get(self.normalize(name))
+
+if get_batch_workers is None:
+    def get_batch_workers(workers=None):
+        """Fallback for account_manager.http_session.get_batch_workers(): argument, $JIRA_BATCH_WORKERS, or 4."""
+        if workers is not None:
+            return max(1, int(workers))
+        try:
+            return max(1, int(os.getenv('JIRA_BATCH_WORKERS') or 4))
+        except ValueError:
+            return 4
+
+if iter_jql_pages is None:
+    def iter_jql_pages(fetch_page, max_results=0, page_size=100, max_workers=None):
+        """Serial fallback for account_manager.jql_pager.iter_jql_pages()."""
+        start_at = 0
+        while not max_results or start_at < max_results:
+            page = fetch_page(start_at, page_size if not max_results else min(page_size, max_results - start_at))
+            yield page
+            fetched = len(page.get('issues') or [])
+            start_at += fetched
+            if not fetched or start_at >= page.get('total', 0):
+                return
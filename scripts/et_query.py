@@ -9,7 +9,16 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Multiplexed SSH transport and esql output parser shared with account_manager (optional)
+try:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from account_manager.remote_exec import get_remote_executor
+    from account_manager.esql_parser import iter_rows as iter_esql_rows
+except ImportError:
+    get_remote_executor = None
+    iter_esql_rows = None
 
 DEFAULT_FIELDS = [
     "INCIDENT",
@@ -165,14 +174,21 @@ def _resolve_esql_command() -> List[str]:
 def _run_esql(sql: str, timeout: int) -> str:
     cmd = _resolve_esql_command()
     try:
-        result = subprocess.run(
-            cmd,
-            input=sql.encode('utf-8'),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=timeout,
-            check=False,
-        )
+        if get_remote_executor:
+            # Remote esql reuses one multiplexed SSH connection across runs
+            remote = cmd[1] if cmd[0] == "ssh" else None
+            result = get_remote_executor(remote).run(
+                cmd[2:] if remote else cmd, input_text=sql, timeout=timeout, label="esql"
+            )
+        else:
+            result = subprocess.run(
+                cmd,
+                input=sql.encode('utf-8'),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+                check=False,
+            )
     except subprocess.TimeoutExpired as exc:
         raise EtQueryError(f"esql query timed out after {timeout}s") from exc
     except OSError as exc:
@@ -187,6 +203,26 @@ def _run_esql(sql: str, timeout: int) -> str:
     return result.stdout.decode('utf-8', errors='replace')
 
 
+def _stream_esql(sql: str, timeout: int) -> Iterator[str]:
+    """Yield esql output lines as they arrive (whole output at once without the shared transport)."""
+    if not get_remote_executor:
+        yield from _run_esql(sql, timeout).splitlines()
+        return
+
+    cmd = _resolve_esql_command()
+    remote = cmd[1] if cmd[0] == "ssh" else None
+    try:
+        yield from get_remote_executor(remote).stream(
+            cmd[2:] if remote else cmd, input_text=sql, timeout=timeout, label="esql"
+        )
+    except TimeoutError as exc:
+        raise EtQueryError(f"esql query timed out after {timeout}s") from exc
+    except RuntimeError as exc:
+        raise EtQueryError(str(exc)) from exc
+    except OSError as exc:
+        raise EtQueryError(f"Unable to execute esql: {exc}") from exc
+
+
 def _should_skip_line(line: str) -> bool:
     stripped = line.strip()
     if not stripped:
@@ -202,11 +238,21 @@ def _should_skip_line(line: str) -> bool:
     return False
 
 
-def _parse_esql_output(raw_output: str, fields: List[str]) -> List[Dict[str, str]]:
-    records: List[Dict[str, str]] = []
+def _parse_esql_output(raw_output: Iterable[str], fields: List[str]) -> List[Dict[str, str]]:
+    lines = raw_output.splitlines() if isinstance(raw_output, str) else raw_output
+    return list(_iter_esql_records(lines, fields))
+
+
+def _iter_esql_records(lines: Iterable[str], fields: List[str]) -> Iterator[Dict[str, str]]:
+    if iter_esql_rows:
+        # Shared parser: format detected once, columns mapped by header name
+        for parts in iter_esql_rows(lines, fields):
+            yield dict(zip(fields, parts))
+        return
+
     expected_cols = len(fields)
 
-    for line in raw_output.splitlines():
+    for line in lines:
         if _should_skip_line(line):
             continue
 
@@ -232,10 +278,7 @@ def _parse_esql_output(raw_output: str, fields: List[str]) -> List[Dict[str, str
             tail = " ".join(parts[expected_cols - 1 :]).strip()
             parts = head + [tail]
 
-        record = {fields[idx]: parts[idx] for idx in range(expected_cols)}
-        records.append(record)
-
-    return records
+        yield {fields[idx]: parts[idx] for idx in range(expected_cols)}
 
 
 def _format_table(records: List[Dict[str, str]], columns: List[str]) -> str:
@@ -398,8 +441,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         if args.verbose:
             print(f"Querying {len(incidents)} incident(s)...", file=sys.stderr)
 
-        raw_output = _run_esql(sql, timeout=args.timeout)
-        records = _parse_esql_output(raw_output, fields)
+        records = _parse_esql_output(_stream_esql(sql, timeout=args.timeout), fields)
 
         projected_records = [
             {column: record.get(column, "") for column in output_columns} for record in records
@@ -18,6 +18,7 @@ Examples:
 """
 
 import argparse
+import os
 import re
 import shutil
 import subprocess
@@ -25,6 +26,15 @@ import sys
 from collections import deque
 from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+# Multiplexed SSH transport and esql output parser shared with account_manager (optional)
+try:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from account_manager.remote_exec import get_remote_executor
+    from account_manager.esql_parser import iter_rows as iter_esql_rows
+except ImportError:
+    get_remote_executor = None
+    iter_esql_rows = None
+
 VALID_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 DEFAULT_COLUMNS = [
@@ -114,6 +124,10 @@ class EtrackHierarchyFetcher:
         command_timeout: int = 20,
     ):
         self.ssh_target = ssh_target
+        # Remote commands reuse one multiplexed SSH connection when the shared transport is available
+        self.transport = (
+            get_remote_executor(ssh_target, batch_mode=True) if ssh_target and get_remote_executor else None
+        )
         self.verbose = verbose
         self.debug = debug
         self.command_timeout = command_timeout
@@ -156,14 +170,17 @@ class EtrackHierarchyFetcher:
         result: Optional[subprocess.CompletedProcess[bytes]] = None
         for attempt, timeout_s in enumerate(timeouts, start=1):
             try:
-                result = subprocess.run(
-                    cmd,
-                    input=sql.encode("utf-8"),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=timeout_s,
-                    check=False,
-                )
+                if self.transport:
+                    result = self.transport.run(["esql"], input_text=sql, timeout=timeout_s, label="esql")
+                else:
+                    result = subprocess.run(
+                        cmd,
+                        input=sql.encode("utf-8"),
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        timeout=timeout_s,
+                        check=False,
+                    )
                 break
             except subprocess.TimeoutExpired:
                 if attempt == len(timeouts):
@@ -198,6 +215,10 @@ class EtrackHierarchyFetcher:
         return result.stdout.decode("utf-8", errors="replace")
 
     def _parse_esql_output(self, raw_output: str, fields: List[str]) -> List[Dict[str, str]]:
+        if iter_esql_rows:
+            # Shared parser: format detected once, columns mapped by header name
+            return [dict(zip(fields, parts)) for parts in iter_esql_rows(raw_output, fields)]
+
         records: List[Dict[str, str]] = []
         expected_cols = len(fields)
 
@@ -343,13 +364,16 @@ class EtrackHierarchyFetcher:
             print(f"[INFO] Running: {' '.join(full_cmd)}", file=sys.stderr)
 
         try:
-            result = subprocess.run(
-                full_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=False,
-                timeout=self.command_timeout,
-            )
+            if self.transport:
+                result = self.transport.run(list(cmd), timeout=self.command_timeout, label=cmd[0])
+            else:
+                result = subprocess.run(
+                    full_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    check=False,
+                    timeout=self.command_timeout,
+                )
         except subprocess.TimeoutExpired as exc:
             raise EtrackHierarchyError(
                 f"Command timed out after {self.command_timeout}s: {' '.join(full_cmd)}"